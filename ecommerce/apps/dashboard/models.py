@@ -10,7 +10,7 @@ class User(AbstractUser):
     The UUID is generated automatically and is not editable. It also overrides the username and email fields
     to make them unique and adds first_name and last_name fields.
     Attributes:
-        id (CharField): The primary key for the User model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the User model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         username (CharField): A CharField that stores the username. It is unique and has a maximum length of 30 characters.
         email (EmailField): An EmailField that stores the user's email. It is unique.
@@ -18,9 +18,7 @@ class User(AbstractUser):
         last_name (CharField): A CharField that stores the user's last name. It has a maximum length of 30 characters.
     """
 
-    id = models.CharField(
-        primary_key=True, default=uuid.uuid4, editable=False, max_length=256
-    )
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     username = models.CharField(
         unique=True,
         verbose_name="Username",
@@ -9,3 +9,9 @@ class DemoConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ecommerce.apps.demo"
+
+    def ready(self):
+        """
+        Connect the page cache invalidation signals.
+        """
+        from . import signals
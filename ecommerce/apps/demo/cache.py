@@ -0,0 +1,99 @@
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import urlencode
+
+
+def get_page_version_key(namespace):
+    """
+    Return the cache key holding the current version of a page cache namespace.
+    """
+
+    return f"demo:version:{namespace}"
+
+
+def get_page_versions(namespaces):
+    """
+    Return the current versions of page cache namespaces, read in one round trip.
+    """
+
+    keys = [get_page_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+
+    return [
+        versions[key] if key in versions else cache.get_or_set(key, 1, timeout=None)
+        for key in keys
+    ]
+
+
+def bump_page_version(namespace):
+    """
+    Invalidate every cached page of a namespace by moving it to a new version.
+    """
+
+    try:
+        cache.incr(get_page_version_key(namespace))
+    except ValueError:
+        cache.set(get_page_version_key(namespace), 2, timeout=None)
+
+
+def get_page_cache_key(namespaces, query_params, request):
+    """
+    Return the cache key of a page, built from the versions of the namespaces it
+    depends on, the host, the path holding the slug or id, and the query params the
+    page reads.
+    """
+
+    query = urlencode(
+        sorted(
+            (param, request.GET.getlist(param))
+            for param in query_params
+            if param in request.GET
+        ),
+        doseq=True,
+    )
+    digest = hashlib.md5(
+        f"{request.get_host()}{request.path}?{query}".encode("utf-8")
+    ).hexdigest()
+    versions = ".".join(str(version) for version in get_page_versions(namespaces))
+
+    return f"demo:page:{versions}:{digest}"
+
+
+def cache_page(namespaces, query_params=("page",)):
+    """
+    Decorator that caches the rendered successful responses of a demo view.
+
+    A page is cached until one of the namespaces it depends on changes, see
+    `ecommerce.apps.demo.signals`, or `DEMO_PAGE_CACHE_TIMEOUT` elapses, which bounds
+    the staleness of the changes sending no model signals, such as stock updates and
+    promotion prices recomputed by tasks.
+
+    Args:
+        namespaces (tuple): The namespaces of the catalogue data shown by the page.
+        query_params (tuple): The query params the page reads, other params are ignored.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            key = get_page_cache_key(namespaces, query_params, request)
+
+            content = cache.get(key)
+            if content is not None:
+                return HttpResponse(content, headers={"X-Cache": "HIT"})
+
+            response = func(self, request, *args, **kwargs)
+
+            if response.status_code == 200:
+                cache.set(key, response.content, settings.DEMO_PAGE_CACHE_TIMEOUT)
+                response["X-Cache"] = "MISS"
+
+            return response
+
+        return wrapper
+
+    return decorator
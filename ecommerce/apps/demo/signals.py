@@ -0,0 +1,102 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ecommerce.apps.inventory.categories import category_product_counts_changed
+from ecommerce.apps.inventory.models import (
+    Brand,
+    Category,
+    Media,
+    Product,
+    ProductAttribute,
+    ProductAttributeValue,
+    ProductInventory,
+    ProductType,
+    Stock,
+)
+from ecommerce.apps.promotion.models import (
+    Coupon,
+    EffectivePrice,
+    ProductsOnPromotion,
+    Promotion,
+    PromotionType,
+)
+from ecommerce.apps.promotion.tasks import promotions_transitioned
+from .cache import bump_page_version
+
+# The versions are bumped once the writing transaction commits, a concurrent request
+# would otherwise cache the rows read before the commit under the new version
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(category_product_counts_changed)
+def invalidate_categories_pages(sender, **kwargs):
+    """
+    Invalidate the cached category pages when a category or its product counts change.
+    """
+    transaction.on_commit(partial(bump_page_version, "categories"))
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+def invalidate_brands_pages(sender, **kwargs):
+    """
+    Invalidate the cached pages showing brands when a brand changes.
+    """
+    transaction.on_commit(partial(bump_page_version, "brands"))
+
+
+@receiver(post_save, sender=ProductType)
+@receiver(post_delete, sender=ProductType)
+def invalidate_product_types_pages(sender, **kwargs):
+    """
+    Invalidate the cached pages showing product types when a product type changes.
+    """
+    transaction.on_commit(partial(bump_page_version, "product_types"))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductInventory)
+@receiver(post_delete, sender=ProductInventory)
+@receiver(post_save, sender=Stock)
+@receiver(post_delete, sender=Stock)
+@receiver(post_save, sender=Media)
+@receiver(post_delete, sender=Media)
+@receiver(post_save, sender=ProductAttribute)
+@receiver(post_delete, sender=ProductAttribute)
+@receiver(post_save, sender=ProductAttributeValue)
+@receiver(post_delete, sender=ProductAttributeValue)
+@receiver(m2m_changed, sender=Product.category.through)
+@receiver(m2m_changed, sender=ProductInventory.attribute_values.through)
+def invalidate_products_pages(sender, **kwargs):
+    """
+    Invalidate the cached pages showing products when a product, its inventories or
+    their stock, media or attribute values change.
+    """
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(partial(bump_page_version, "products"))
+
+
+@receiver(post_save, sender=PromotionType)
+@receiver(post_delete, sender=PromotionType)
+@receiver(post_save, sender=Coupon)
+@receiver(post_delete, sender=Coupon)
+@receiver(post_save, sender=Promotion)
+@receiver(post_delete, sender=Promotion)
+@receiver(post_save, sender=ProductsOnPromotion)
+@receiver(post_delete, sender=ProductsOnPromotion)
+@receiver(post_save, sender=EffectivePrice)
+@receiver(post_delete, sender=EffectivePrice)
+@receiver(m2m_changed, sender=ProductsOnPromotion)
+@receiver(promotions_transitioned)
+def invalidate_promotions_pages(sender, **kwargs):
+    """
+    Invalidate the cached pages showing promotions when a promotion, its products or
+    the effective prices change.
+    """
+    if kwargs.get("action", "post_").startswith("post_"):
+        transaction.on_commit(partial(bump_page_version, "promotions"))
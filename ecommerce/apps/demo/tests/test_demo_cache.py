@@ -0,0 +1,94 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty page cache.
+    """
+    cache.clear()
+
+
+def test_listing_page_cache(
+    db,
+    client,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+    brand_factory,
+):
+    """
+    Test to verify a cached listing page is served without queries, per `?page=`, and
+    refreshed after a save.
+    """
+
+    brand = brand_factory()
+    url = reverse("demo_brands")
+
+    assert client.get(url)["X-Cache"] == "MISS"
+
+    with django_assert_num_queries(0):
+        response = client.get(url, {"utm_source": "test"})
+
+    assert response["X-Cache"] == "HIT"
+    assert brand.name in response.content.decode()
+    assert client.get(url, {"page": 2})["X-Cache"] == "MISS"
+
+    brand.name = f"{brand.name} Updated"
+    with django_capture_on_commit_callbacks(execute=True):
+        brand.save()
+
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert brand.name in response.content.decode()
+
+
+def test_detail_page_cache(
+    db,
+    client,
+    django_capture_on_commit_callbacks,
+    product_inventory_factory,
+    stock_factory,
+    promotion_factory,
+):
+    """
+    Test to verify a cached product detail page is keyed by slug and refreshed after a
+    stock or promotion save.
+    """
+
+    stock = stock_factory(units=170)
+    promotion = promotion_factory(products_on_promotion=[])
+    promotion.products_on_promotion.add(stock.product_inventory)
+    other = product_inventory_factory()
+    url = reverse(
+        "demo_product_detail",
+        kwargs={"product_slug": stock.product_inventory.product.slug},
+    )
+
+    assert client.get(url)["X-Cache"] == "MISS"
+    assert client.get(url)["X-Cache"] == "HIT"
+
+    response = client.get(
+        reverse("demo_product_detail", kwargs={"product_slug": other.product.slug})
+    )
+
+    assert response["X-Cache"] == "MISS"
+    assert stock.product_inventory.sku not in response.content.decode()
+
+    stock.units = 163
+    with django_capture_on_commit_callbacks(execute=True):
+        stock.save()
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert "<td>163</td>" in response.content.decode()
+
+    promotion.name = f"{promotion.name} Updated"
+    with django_capture_on_commit_callbacks(execute=True):
+        promotion.save()
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert promotion.name in response.content.decode()
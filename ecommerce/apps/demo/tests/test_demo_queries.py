@@ -0,0 +1,66 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ecommerce.apps.promotion.models import ProductsOnPromotion
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty page cache.
+    """
+    cache.clear()
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_product_detail_queries(
+    db,
+    client,
+    product_factory,
+    category_factory,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    promotion_factory,
+    brand,
+    size,
+):
+    """
+    Test to verify the product detail page query count does not grow with the number of
+    product inventories, media, attribute values and promotions.
+    """
+
+    product = product_factory(category=[category_factory(), category_factory()])
+    promotions = [
+        promotion_factory(products_on_promotion=[]),
+        promotion_factory(products_on_promotion=[], coupon=None),
+    ]
+
+    for _ in range(size):
+        product_inventory = product_inventory_factory(product=product, brand=brand)
+        product_inventory.attribute_values.add(
+            product_attribute_value_factory(), product_attribute_value_factory()
+        )
+        media_factory(product_inventory=product_inventory)
+        media_factory(product_inventory=product_inventory)
+        stock_factory(product_inventory=product_inventory)
+        for promotion in promotions:
+            ProductsOnPromotion.objects.create(
+                promotion=promotion,
+                product_inventory=product_inventory,
+                promotion_price=50,
+            )
+
+    url = reverse("demo_product_detail", kwargs={"product_slug": product.slug})
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.context["product_inventory_stock_media_map"]) == size
+    assert promotions[0].coupon.code in response.content.decode()
+    assert len(context.captured_queries) == 6
@@ -1,7 +1,10 @@
+from django.db.models import Prefetch
 from django.views.generic import View
 from django.shortcuts import render
 from ecommerce.apps.inventory import models as inventory_models
+from ecommerce.apps.inventory.categories import filter_category_products
 from ecommerce.apps.promotion import models as promotion_models
+from .cache import cache_page
 
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
@@ -12,13 +15,12 @@ class DemoHomeView(View):
     """
 
     template_name = "demo/demo_home.html"
-    context = {}
 
     def get(self, request):
         """
         Handles GET requests, renders the demo home page.
         """
-        return render(request, self.template_name, self.context)
+        return render(request, self.template_name)
 
 
 class DemoParentCategoriesView(View):
@@ -28,8 +30,8 @@ class DemoParentCategoriesView(View):
     """
 
     template_name = "demo/demo_parent_categories.html"
-    context = {}
 
+    @cache_page(("categories",))
     def get(self, request):
         """
         Handles GET requests, fetches all parent categories from the database and renders the page.
@@ -49,8 +51,8 @@ class DemoParentCategoriesView(View):
         except EmptyPage:
             categories = paginator.page(paginator.num_pages)
 
-        self.context["categories"] = categories
-        return render(request, self.template_name, self.context)
+        context = {"categories": categories}
+        return render(request, self.template_name, context)
 
 
 class DemoSubCategoriesView(View):
@@ -60,8 +62,8 @@ class DemoSubCategoriesView(View):
     """
 
     template_name = "demo/demo_sub_categories.html"
-    context = {}
 
+    @cache_page(("categories",))
     def get(self, request, parent_category_slug):
         """
         Handles GET requests, fetches all sub-categories of a parent category from the database and renders the page.
@@ -84,26 +86,40 @@ class DemoSubCategoriesView(View):
         except EmptyPage:
             sub_categories = paginator.page(paginator.num_pages)
 
-        self.context["parent_category"] = parent_category
-        self.context["sub_categories"] = sub_categories
-        return render(request, self.template_name, self.context)
+        context = {
+            "parent_category": parent_category,
+            "sub_categories": sub_categories,
+        }
+        return render(request, self.template_name, context)
 
 
 class DemoSubCategoriesProductsView(View):
     """
-    A view that renders a page with all products in a category.
+    A view that renders a page with all products in a category, or in a category and
+    its descendants with `include_descendants`.
     """
 
     template_name = "demo/demo_sub_categories_products.html"
-    context = {}
 
+    @cache_page(
+        ("categories", "products", "brands", "product_types"),
+        query_params=("page", "include_descendants"),
+    )
     def get(self, request, category_slug):
         """
         Handles GET requests, fetches all products in a category from the database and renders the page.
         """
         category = inventory_models.Category.objects.get(slug=category_slug)
+        include_descendants = request.GET.get("include_descendants", "").lower() in (
+            "1",
+            "true",
+        )
         products_list = (
-            inventory_models.Product.objects.filter(category=category)
+            filter_category_products(
+                inventory_models.Product.objects.all(),
+                category.id,
+                include_descendants,
+            )
             .values(
                 "id",
                 "name",
@@ -126,9 +142,12 @@ class DemoSubCategoriesProductsView(View):
         except EmptyPage:
             products = paginator.page(paginator.num_pages)
 
-        self.context["category"] = category
-        self.context["products"] = products
-        return render(request, self.template_name, self.context)
+        context = {
+            "category": category,
+            "products": products,
+            "include_descendants": include_descendants,
+        }
+        return render(request, self.template_name, context)
 
 
 class DemoProductDetailView(View):
@@ -137,30 +156,46 @@ class DemoProductDetailView(View):
     """
 
     template_name = "demo/demo_product_detail.html"
-    context = {}
 
+    @cache_page(("categories", "products", "brands", "product_types", "promotions"))
     def get(self, request, product_slug):
         """
         Handles GET requests, fetches details of a product from the database and renders the page.
+
+        The product inventories and everything the page shows about them are loaded by
+        a fixed set of queries, whatever the number of inventories: the brand, stock
+        and effective price are joined, and the media, attribute values and promotions
+        are prefetched along with their own related rows.
         """
-        product = inventory_models.Product.objects.get(slug=product_slug)
-        product_inventory = inventory_models.ProductInventory.objects.filter(
-            product=product
+        product = inventory_models.Product.objects.prefetch_related("category").get(
+            slug=product_slug
+        )
+        product_inventory = (
+            inventory_models.ProductInventory.objects.filter(product=product)
+            .select_related("brand", "stock_product_inventory", "effective_price")
+            .prefetch_related(
+                "media_product_inventory",
+                Prefetch(
+                    "attribute_values",
+                    queryset=inventory_models.ProductAttributeValue.objects.select_related(
+                        "product_attribute"
+                    ),
+                ),
+                Prefetch(
+                    "promotion_product_inventory",
+                    queryset=promotion_models.ProductsOnPromotion.objects.select_related(
+                        "promotion__promotion_type", "promotion__coupon"
+                    ),
+                ),
+            )
         )
 
         product_inventory_stock_media_map = []
         for pi in product_inventory:
-            stock = inventory_models.Stock.objects.get(product_inventory=pi)
-            media = inventory_models.Media.objects.filter(product_inventory=pi)
-
-            products_on_promotion = promotion_models.ProductsOnPromotion.objects.filter(
-                product_inventory=pi
-            )
-
             promotions_list = []
 
-            for item in products_on_promotion:
-                promotion = promotion_models.Promotion.objects.get(id=item.promotion.id)
+            for item in pi.promotion_product_inventory.all():
+                promotion = item.promotion
 
                 promotions_list.append(
                     {
@@ -168,7 +203,7 @@ class DemoProductDetailView(View):
                         "promotion_reduction": promotion.promotion_reduction,
                         "is_active": promotion.is_active,
                         "promotion_type": promotion.promotion_type,
-                        "coupon": promotion.coupon.code,
+                        "coupon": promotion.coupon.code if promotion.coupon else None,
                         "promotion_price": item.promotion_price,
                     }
                 )
@@ -176,21 +211,26 @@ class DemoProductDetailView(View):
             product_inventory_stock_media_map.append(
                 {
                     "product_inventory": pi,
-                    "stock": stock,
-                    "media": media,
+                    "stock": getattr(pi, "stock_product_inventory", None),
+                    "media": pi.media_product_inventory.all(),
                     "attribute_values": pi.attribute_values.all(),
                     "promotions": promotions_list,
+                    "effective_price": getattr(pi, "effective_price", None),
                 }
             )
 
-        self.context["brand"] = product_inventory.first().brand
-        self.context["product"] = product
-        self.context["product_inventory_stock_media_map"] = (
-            product_inventory_stock_media_map
-        )
-        self.context["categories"] = product.category.all()
+        context = {
+            "brand": (
+                product_inventory_stock_media_map[0]["product_inventory"].brand
+                if product_inventory_stock_media_map
+                else None
+            ),
+            "product": product,
+            "product_inventory_stock_media_map": product_inventory_stock_media_map,
+            "categories": product.category.all(),
+        }
 
-        return render(request, self.template_name, self.context)
+        return render(request, self.template_name, context)
 
 
 class DemoProductTypesView(View):
@@ -199,8 +239,8 @@ class DemoProductTypesView(View):
     """
 
     template_name = "demo/demo_product_types.html"
-    context = {}
 
+    @cache_page(("product_types",))
     def get(self, request):
         """
         Handles GET requests, fetches all product types from the database and renders the page.
@@ -218,8 +258,8 @@ class DemoProductTypesView(View):
         except EmptyPage:
             product_types = paginator.page(paginator.num_pages)
 
-        self.context["product_types"] = product_types
-        return render(request, self.template_name, self.context)
+        context = {"product_types": product_types}
+        return render(request, self.template_name, context)
 
 
 class DemoProductTypeProductsView(View):
@@ -228,8 +268,8 @@ class DemoProductTypeProductsView(View):
     """
 
     template_name = "demo/demo_product_type_products.html"
-    context = {}
 
+    @cache_page(("product_types", "products", "brands"))
     def get(self, request, product_type_id):
         """
         Handles GET requests, fetches all products of a product type from the database and renders the page.
@@ -258,11 +298,8 @@ class DemoProductTypeProductsView(View):
         except EmptyPage:
             products = paginator.page(paginator.num_pages)
 
-        print(products[0])
-
-        self.context["product_type"] = product_type
-        self.context["products"] = products
-        return render(request, self.template_name, self.context)
+        context = {"product_type": product_type, "products": products}
+        return render(request, self.template_name, context)
 
 
 class DemoBrandsView(View):
@@ -271,8 +308,8 @@ class DemoBrandsView(View):
     """
 
     template_name = "demo/demo_brands.html"
-    context = {}
 
+    @cache_page(("brands",))
     def get(self, request):
         """
         Handles GET requests, fetches all brands from the database and renders the page.
@@ -290,8 +327,8 @@ class DemoBrandsView(View):
         except EmptyPage:
             brands = paginator.page(paginator.num_pages)
 
-        self.context["brands"] = brands
-        return render(request, self.template_name, self.context)
+        context = {"brands": brands}
+        return render(request, self.template_name, context)
 
 
 class DemoBrandProductsView(View):
@@ -300,8 +337,8 @@ class DemoBrandProductsView(View):
     """
 
     template_name = "demo/demo_brand_products.html"
-    context = {}
 
+    @cache_page(("brands", "products", "product_types"))
     def get(self, request, brand_id):
         """
         Handles GET requests, fetches all products of a brand from the database and renders the page.
@@ -330,6 +367,5 @@ class DemoBrandProductsView(View):
         except EmptyPage:
             products = paginator.page(paginator.num_pages)
 
-        self.context["brand"] = brand
-        self.context["products"] = products
-        return render(request, self.template_name, self.context)
+        context = {"brand": brand, "products": products}
+        return render(request, self.template_name, context)
@@ -7,6 +7,7 @@ from ecommerce.apps.inventory.models import (
     ProductInventory,
     ProductAttribute,
     ProductAttributeValue,
+    Stock,
 )
 
 
@@ -195,3 +196,39 @@ class ProductAttributeValueAdmin(admin.ModelAdmin):
     search_fields = ("product_attribute", "attribute_value")
     autocomplete_fields = ["product_attribute"]
     readonly_fields = ("id",)
+
+
+@admin.register(Stock)
+class StockAdmin(admin.ModelAdmin):
+    """
+    The StockAdmin class inherits from Django's ModelAdmin class.
+    It represents the admin interface for the Stock model.
+
+    The units sold and reserved are only changed by the conditional UPDATEs of
+    `ecommerce.apps.inventory.stock`, so they are read only, and saving a stock only
+    writes the fields changed in the form, leaving the concurrent updates untouched.
+    """
+
+    list_display = ("product_inventory", "units", "units_sold", "units_reserved")
+    fields = (
+        "id",
+        "product_inventory",
+        "last_checked",
+        "units",
+        "units_sold",
+        "units_reserved",
+        "updated_at",
+    )
+    autocomplete_fields = ("product_inventory",)
+    readonly_fields = (
+        "id",
+        "units_sold",
+        "units_reserved",
+        "updated_at",
+    )
+
+    def save_model(self, request, obj, form, change):
+        if change:
+            obj.save(update_fields=[*form.changed_data, "updated_at"])
+        else:
+            obj.save()
@@ -9,3 +9,9 @@ class InventoryConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ecommerce.apps.inventory"
+
+    def ready(self):
+        """
+        Connect the category product counts signals.
+        """
+        from . import signals
@@ -0,0 +1,188 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Exists, F, Func, OuterRef, Subquery
+from django.db.models.functions import Greatest
+from django.dispatch import Signal
+
+from .models import Category, Product
+
+# Sent with the `category_ids` whose product counts changed, None for every category,
+# since the counts are changed by bulk updates which send no model signals
+category_product_counts_changed = Signal()
+
+
+def get_category_subtree(category_id):
+    """
+    Return the categories of the subtree of a category, the category included.
+
+    The subtree is the `lft` range of the category within its tree, read by subqueries,
+    so it resolves within the query using it and an unknown category matches nothing.
+    """
+
+    root = Category.objects.filter(id=category_id).order_by()
+
+    return Category.objects.filter(
+        tree_id=Subquery(root.values("tree_id")),
+        lft__gte=Subquery(root.values("lft")),
+        lft__lte=Subquery(root.values("rght")),
+    )
+
+
+def get_category_ancestors(category_ids):
+    """
+    Return the categories with any of the categories in their subtree, the categories
+    included.
+    """
+
+    return Category.objects.filter(
+        Exists(
+            Category.objects.filter(
+                id__in=category_ids,
+                tree_id=OuterRef("tree_id"),
+                lft__gte=OuterRef("lft"),
+                lft__lte=OuterRef("rght"),
+            )
+        )
+    )
+
+
+def filter_category_products(queryset, category_id, include_descendants=False):
+    """
+    Filter a product queryset on a category, or on a category and all its descendants.
+
+    The descendants are matched by a semi-join on the subtree range rather than a join,
+    so a product in several categories of the subtree is returned once without a
+    DISTINCT, and the queryset keeps its indexed ordering.
+
+    Args:
+        queryset (QuerySet): The products to filter
+        category_id (UUID): The id of the category
+        include_descendants (bool): Whether the products of the descendants are included
+    """
+
+    if not include_descendants:
+        return queryset.filter(category__id=category_id)
+
+    return queryset.filter(
+        Exists(
+            Product.category.through.objects.filter(
+                product_id=OuterRef("pk"),
+                category__in=get_category_subtree(category_id),
+            )
+        )
+    )
+
+
+def count_subquery(queryset, field, distinct=False):
+    """
+    Return a subquery of the number of rows, or of distinct `field` values, of a queryset.
+    """
+
+    extra = {"template": "%(function)s(DISTINCT %(expressions)s)"} if distinct else {}
+
+    # A COUNT unknown to the ORM as an aggregate, so the subquery has no GROUP BY
+    return Subquery(
+        queryset.order_by()
+        .annotate(count=Func(F(field), function="COUNT", **extra))
+        .values("count")
+    )
+
+
+def send_product_counts_changed(category_ids):
+    transaction.on_commit(
+        partial(
+            category_product_counts_changed.send,
+            sender=Category,
+            category_ids=category_ids,
+        )
+    )
+
+
+def update_category_product_counts(product_ids, category_ids, sign, active_only=True):
+    """
+    Add or remove every product to or from every category in the product counts.
+
+    The `product_count` of the categories changes by the number of products, and the
+    `subtree_product_count` of every ancestor by the number of products which are not
+    in its subtree through any other category, so a product in several categories of a
+    subtree is counted once. Concurrent changes of a product, and bulk changes sending
+    no signals, may miscount, which `rebuild_category_product_counts` repairs.
+
+    Args:
+        product_ids (list): The ids of the products added or removed
+        category_ids (list): The ids of the categories the products are added to or
+            removed from
+        sign (int): 1 when the products are added, -1 when they are removed
+        active_only (bool): Whether only the active products are counted, False when
+            the products themselves are activated or deactivated
+    """
+
+    products = Product.objects.filter(id__in=product_ids)
+    if active_only:
+        products = products.filter(is_active=True)
+
+    count = products.count()
+    if not count or not category_ids:
+        return
+
+    # The counts never go negative, even when they drifted from bulk changes
+    Category.objects.filter(id__in=category_ids).update(
+        product_count=Greatest(F("product_count") + sign * count, 0)
+    )
+
+    # The products in the subtree of an ancestor through another category
+    in_subtree = Product.category.through.objects.filter(
+        product_id=OuterRef("pk"),
+        category__tree_id=OuterRef(OuterRef("tree_id")),
+        category__lft__gte=OuterRef(OuterRef("lft")),
+        category__lft__lte=OuterRef(OuterRef("rght")),
+    ).exclude(category_id__in=category_ids)
+    get_category_ancestors(category_ids).update(
+        subtree_product_count=Greatest(
+            F("subtree_product_count")
+            + sign * count_subquery(products.exclude(Exists(in_subtree)), "id"),
+            0,
+        )
+    )
+
+    send_product_counts_changed(list(category_ids))
+
+
+def rebuild_category_product_counts(categories=None):
+    """
+    Recompute the product counts of categories from the active products.
+
+    Args:
+        categories (QuerySet): The categories to recompute, all categories by default
+
+    Returns:
+        int: The number of categories recomputed
+    """
+
+    category_ids = None
+    if categories is None:
+        categories = Category.objects.all()
+    else:
+        category_ids = list(categories.values_list("id", flat=True))
+
+    active = Product.category.through.objects.filter(product__is_active=True)
+
+    updated = categories.update(
+        product_count=count_subquery(
+            active.filter(category_id=OuterRef("pk")), "product_id"
+        ),
+        subtree_product_count=count_subquery(
+            active.filter(
+                category__tree_id=OuterRef("tree_id"),
+                category__lft__gte=OuterRef("lft"),
+                category__lft__lte=OuterRef("rght"),
+            ),
+            "product_id",
+            distinct=True,
+        ),
+    )
+
+    send_product_counts_changed(category_ids)
+
+    return updated
@@ -0,0 +1,343 @@
+import csv
+import json
+import uuid
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+from .categories import rebuild_category_product_counts
+from .models import Category
+
+# The category fields an import sets, besides the parent
+IMPORT_FIELDS = ("name", "slug", "is_active")
+
+# The MPTT fields, left empty by the import until the tree is rebuilt
+TREE_FIELDS = ("lft", "rght", "tree_id", "level")
+
+
+def read_category_rows(file, format):
+    """
+    Read the category rows of a CSV or JSON file.
+
+    CSV files have a header with an `id`, `name`, `slug`, `parent` and `is_active`
+    column, only `name` is required. JSON files hold a list of objects with the same
+    keys, or a Django fixture of `inventory.category` objects.
+
+    Args:
+        file (file): The text file to read
+        format (str): `csv` or `json`
+
+    Returns:
+        list: The rows, as dicts
+    """
+
+    if format == "csv":
+        return [
+            {key: value for key, value in row.items() if value not in ("", None)}
+            for row in csv.DictReader(file)
+        ]
+
+    rows = json.load(file)
+    if not isinstance(rows, list):
+        raise ValidationError("The JSON file must hold a list of categories.")
+
+    return [
+        {"id": row["pk"], **row["fields"]} if "fields" in row else row
+        for row in rows
+        if row.get("model", "inventory.category") == "inventory.category"
+    ]
+
+
+def parse_is_active(value):
+    if isinstance(value, str):
+        return value.strip().lower() not in ("0", "false", "no")
+
+    return bool(value)
+
+
+def get_row_key(row):
+    """
+    Return the key a row matches an existing category by, its id or else its slug.
+    """
+
+    return str(row["id"]) if row["id"] else row["slug"]
+
+
+def get_row_references(rows):
+    """
+    Return the rows by the references other rows can use for them, their id and their
+    slug. A slug shared by several rows is mapped to None, as referencing it is ambiguous.
+    """
+
+    references = {}
+    for row in rows:
+        if row["slug"] in references:
+            references[row["slug"]] = None
+        else:
+            references[row["slug"]] = row
+
+    references.update((row["id"], row) for row in rows if row["id"])
+
+    return references
+
+
+def import_categories(rows, batch_size=1000):
+    """
+    Create or update categories and their parents in bulk, then rebuild the tree once.
+
+    Every row has a `name` and optionally an `id`, a `slug`, an `is_active` flag and a
+    `parent` reference, the id or the slug of another row or of an existing category.
+    Rows matching an existing category, by id or else by slug, update it, so whole
+    subtrees are moved by importing them with a new parent.
+
+    Saving categories one by one makes django-mptt shift the `lft` and `rght` values of
+    the tree on every insert, which is quadratic. The rows are instead bulk created and
+    updated with the MPTT updates disabled, and the trees the import touched are
+    rebuilt once at the end, see `rebuild_category_trees`, followed by the category
+    product counts, in a single transaction.
+
+    Args:
+        rows (list): The category rows, as dicts
+        batch_size (int): The number of categories per INSERT or UPDATE
+
+    Returns:
+        dict: The number of `created` and `updated` categories
+    """
+
+    rows = [prepare_row(row, index) for index, row in enumerate(rows, 1)]
+
+    keys = set()
+    for row in rows:
+        row["key"] = get_row_key(row)
+        if row["key"] in keys:
+            raise ValidationError(f"Category {row['key']} is imported more than once.")
+        keys.add(row["key"])
+
+    references = get_row_references(rows)
+
+    with transaction.atomic():
+        existing = get_existing_categories(rows)
+        for row in rows:
+            category = existing.get(row["key"])
+            if category:
+                row["id"] = category["id"]
+            else:
+                row["id"] = uuid.UUID(row["id"]) if row["id"] else uuid.uuid4()
+
+        parent_ids = get_parent_ids(rows, references)
+        check_cycles(parent_ids)
+
+        categories = {"created": [], "updated": []}
+        for row in rows:
+            category = Category(
+                id=row["id"],
+                parent_id=parent_ids[row["id"]],
+                **{field: row[field] for field in IMPORT_FIELDS},
+                **{field: 0 for field in TREE_FIELDS},
+            )
+            state = "updated" if row["key"] in existing else "created"
+            categories[state].append(category)
+
+        with Category.objects.disable_mptt_updates():
+            Category.objects.bulk_create(categories["created"], batch_size=batch_size)
+            Category.objects.bulk_update(
+                categories["updated"],
+                [*IMPORT_FIELDS, "parent"],
+                batch_size=batch_size,
+            )
+            rebuild_category_trees(
+                [category.id for category in categories["created"]],
+                {row["id"]: existing[row["key"]] for row in rows if row["key"] in existing},
+                parent_ids,
+            )
+
+        rebuild_category_product_counts()
+
+    return {state: len(items) for state, items in categories.items()}
+
+
+def prepare_row(row, line):
+    """
+    Validate a row and fill in its default slug and `is_active` flag.
+    """
+
+    name = str(row.get("name") or "").strip()
+    if not name:
+        raise ValidationError(f"Category {line} has no name.")
+
+    if row.get("id") and not is_uuid(str(row["id"])):
+        raise ValidationError(f"Category {line} id is not a UUID.")
+
+    parent = str(row["parent"]) if row.get("parent") else None
+
+    return {
+        **row,
+        "id": str(uuid.UUID(str(row["id"]))) if row.get("id") else None,
+        "name": name,
+        "slug": row.get("slug") or slugify(name),
+        "is_active": parse_is_active(row.get("is_active", True)),
+        # UUID references are compared in their canonical form
+        "parent": str(uuid.UUID(parent)) if parent and is_uuid(parent) else parent,
+    }
+
+
+def get_existing_categories(rows):
+    """
+    Return the existing categories matching rows, by row key.
+
+    A row without an id only matches a category by slug when no other category has
+    the same slug.
+    """
+
+    ids = [row["id"] for row in rows if row["id"]]
+    slugs = [row["slug"] for row in rows if not row["id"]]
+
+    existing = {
+        str(category["id"]): category
+        for category in Category.objects.filter(id__in=ids).values(
+            "id", "parent_id", "tree_id"
+        )
+    }
+
+    matches = {}
+    for category in Category.objects.filter(slug__in=slugs).values(
+        "id", "slug", "parent_id", "tree_id"
+    ):
+        matches.setdefault(category["slug"], []).append(category)
+    existing.update(
+        (slug, categories[0])
+        for slug, categories in matches.items()
+        if len(categories) == 1
+    )
+
+    return existing
+
+
+def get_parent_ids(rows, keys):
+    """
+    Return the parent id of every imported category, resolving the parent references
+    to imported rows first, by id or slug, and to existing categories second.
+    """
+
+    references = {row["parent"] for row in rows if row["parent"] not in keys}
+    references.discard(None)
+
+    parents = {}
+    for category in Category.objects.filter(
+        id__in=[reference for reference in references if is_uuid(reference)]
+    ).values_list("id", flat=True):
+        parents[str(category)] = category
+
+    for category in Category.objects.filter(slug__in=references).values("id", "slug"):
+        if parents.setdefault(category["slug"], category["id"]) != category["id"]:
+            raise ValidationError(f"Parent category {category['slug']} is ambiguous.")
+
+    parent_ids = {}
+    for row in rows:
+        reference = row["parent"]
+        if reference is None:
+            parent_ids[row["id"]] = None
+        elif reference in keys:
+            if keys[reference] is None:
+                raise ValidationError(f"Parent category {reference} is ambiguous.")
+            parent_ids[row["id"]] = keys[reference]["id"]
+        elif reference in parents:
+            parent_ids[row["id"]] = parents[reference]
+        else:
+            raise ValidationError(f"Parent category {reference} does not exist.")
+
+    return parent_ids
+
+
+def rebuild_category_trees(created_ids, updated, parent_ids):
+    """
+    Rebuild the tree fields of the trees an import touched.
+
+    The touched trees are the trees the updated categories left and the trees of the
+    existing parents. Their categories and the created ones are moved to the tree of
+    their root, then every touched tree is rebuilt on its own by
+    `TreeManager.partial_rebuild`. An import creating a root, by creating a category
+    without a parent or by making an existing category a root, needs a new tree id and
+    rebuilds every tree with `TreeManager.rebuild` instead.
+
+    Args:
+        created_ids (list): The ids of the created categories
+        updated (dict): The `parent_id` and `tree_id` of the updated categories, by id
+        parent_ids (dict): The imported parent id of every imported category
+    """
+
+    created_ids = set(created_ids)
+    if any(
+        parent_id is None
+        and (category_id in created_ids or updated[category_id]["parent_id"])
+        for category_id, parent_id in parent_ids.items()
+    ):
+        Category.objects.rebuild()
+        return
+
+    tree_ids = {category["tree_id"] for category in updated.values()}
+    tree_ids.update(
+        Category.objects.filter(
+            id__in=set(parent_ids.values()) - set(parent_ids)
+        ).values_list("tree_id", flat=True)
+    )
+
+    nodes = {
+        category_id: (parent_id, tree_id)
+        for category_id, parent_id, tree_id in Category.objects.filter(
+            Q(tree_id__in=tree_ids) | Q(id__in=created_ids)
+        ).values_list("id", "parent_id", "tree_id")
+    }
+
+    # The tree id of every category is the tree id of its root
+    roots = {}
+    for category_id in nodes:
+        path = []
+        while category_id not in roots and nodes[category_id][0] is not None:
+            path.append(category_id)
+            category_id = nodes[category_id][0]
+        tree_id = roots.get(category_id, nodes[category_id][1])
+        roots.update((node_id, tree_id) for node_id in [category_id, *path])
+
+    moved = {}
+    for category_id, tree_id in roots.items():
+        if nodes[category_id][1] != tree_id:
+            moved.setdefault(tree_id, []).append(category_id)
+    for tree_id, ids in moved.items():
+        Category.objects.filter(id__in=ids).update(tree_id=tree_id)
+
+    for tree_id in sorted(set(roots.values())):
+        Category.objects.partial_rebuild(tree_id)
+
+
+def check_cycles(parent_ids):
+    """
+    Raise a ValidationError when the imported parents make a category its own ancestor.
+
+    The parents of the existing categories are read once, with the imported parents
+    taking precedence.
+    """
+
+    parents = dict(Category.objects.values_list("id", "parent_id"))
+    parents.update(parent_ids)
+
+    checked = set()
+    for category_id in parent_ids:
+        path = set()
+        while category_id is not None and category_id not in checked:
+            if category_id in path:
+                raise ValidationError(f"Category {category_id} is its own ancestor.")
+            path.add(category_id)
+            category_id = parents.get(category_id)
+        checked |= path
+
+
+def is_uuid(value):
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+
+    return True
@@ -12,20 +12,20 @@ class Category(MPTTModel):
     It represents a hierarchical category structure for products.
 
     Attributes:
-        id (CharField): The primary key for the Category model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the Category model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the category name. It is required and has a maximum length of 100 characters.
         slug (SlugField): A SlugField that stores the URL-friendly version of the category name. It is required and has a maximum length of 100 characters.
         is_active (BooleanField): A BooleanField that indicates whether the category is active. It is required and its default value is True.
         parent (TreeForeignKey): A TreeForeignKey that represents the parent category of the current category. It is not required and can be null.
+        product_count (PositiveIntegerField): The number of active products directly in the category, maintained by signals.
+        subtree_product_count (PositiveIntegerField): The number of distinct active products in the category and its descendants, maintained by signals.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=100,
@@ -65,6 +65,20 @@ class Category(MPTTModel):
         verbose_name="Parent Category",
         help_text=_("format: optional"),
     )
+    product_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Product Count",
+        help_text=_("format: auto-generated, active products in the category"),
+    )
+    subtree_product_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Subtree Product Count",
+        help_text=_(
+            "format: auto-generated, active products in the category and its descendants"
+        ),
+    )
 
     class MPTTMeta:
         order_insertion_by = ["name"]
@@ -73,6 +87,10 @@ class Category(MPTTModel):
         verbose_name = "Product Category"
         verbose_name_plural = "Product Categories"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["parent", "name"], name="category_parent_name_idx"),
+            models.Index(fields=["tree_id", "lft"], name="category_tree_lft_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -83,7 +101,7 @@ class Product(models.Model):
     The Product class represents a product in the inventory.
 
     Attributes:
-        id (CharField): The primary key for the Product model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the Product model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         web_id (CharField): A CharField that stores the product ID. It is required and has a maximum length of 36 characters.
         name (CharField): A CharField that stores the product name. It is required and has a maximum length of 100 characters.
@@ -95,12 +113,10 @@ class Product(models.Model):
         updated_at (DateTimeField): A DateTimeField that stores the date and time when the product was last updated. It is not required and can be null.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     web_id = models.CharField(
         max_length=256,
@@ -170,6 +186,9 @@ class Product(models.Model):
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "id"], name="product_name_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -180,17 +199,15 @@ class ProductType(models.Model):
     The ProductType class represents the type of a product.
 
     Attributes:
-        id (CharField): The primary key for the ProductType model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the ProductType model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the type of the product. It is required, unique, and has a maximum length of 255 characters.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=255,
@@ -216,17 +233,15 @@ class Brand(models.Model):
     The Brand class represents the brand of a product.
 
     Attributes:
-        id (CharField): The primary key for the Brand model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the Brand model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the name of the brand. It is required, unique, and has a maximum length of 255 characters.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=255,
@@ -252,18 +267,16 @@ class ProductAttribute(models.Model):
     The ProductAttribute class represents the attributes of a product.
 
     Attributes:
-        id (CharField): The primary key for the ProductAttribute model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the ProductAttribute model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the name of the product attribute. It is required, unique, and has a maximum length of 255 characters.
         description (TextField): A TextField that stores the description of the product attribute. It is required.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=255,
@@ -299,18 +312,16 @@ class ProductAttributeValue(models.Model):
     The ProductAttributeValue class represents the value of a product attribute.
 
     Attributes:
-        id (CharField): The primary key for the ProductAttributeValue model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the ProductAttributeValue model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         product_attribute (ForeignKey): A ForeignKey that links to a ProductAttribute instance.
         attribute_value (CharField): A CharField that stores the value of the product attribute. It is required and has a maximum length of 255 characters.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     product_attribute = models.ForeignKey(
         ProductAttribute,
@@ -340,7 +351,7 @@ class ProductInventory(models.Model):
     The ProductInventory class represents a product's inventory details.
 
     Attributes:
-        id (CharField): The primary key for the ProductInventory model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the ProductInventory model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         sku (CharField): A CharField that stores the product's Stock Keeping Unit (SKU). It is required and has a maximum length of 36 characters.
         upc (CharField): A CharField that stores the product's Universal Product Code (UPC). It is required and has a maximum length of 36 characters.
@@ -358,12 +369,10 @@ class ProductInventory(models.Model):
         updated_at (DateTimeField): A DateTimeField that stores the date and time when the product inventory was last updated.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     sku = models.CharField(
         default=uuid.uuid4,
@@ -457,6 +466,19 @@ class ProductInventory(models.Model):
     class Meta:
         verbose_name = "Product Inventory"
         verbose_name_plural = "Product Inventories"
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="product_inv_created_id_idx"
+            ),
+            models.Index(
+                fields=["brand", "created_at", "id"],
+                name="product_inv_brand_created_idx",
+            ),
+            models.Index(
+                fields=["product_type", "created_at", "id"],
+                name="product_inv_type_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.product.name
@@ -467,7 +489,7 @@ class Media(models.Model):
     The Media class represents the media associated with a product inventory.
 
     Attributes:
-        id (CharField): The primary key for the Media model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the Media model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         product_inventory (ForeignKey): A ForeignKey that links to a ProductInventory instance.
         image (ImageField): An ImageField that stores the image of the product. It is required and has a default image.
@@ -481,12 +503,10 @@ class Media(models.Model):
         verbose_name_plural (str): A string that provides a human-readable plural name for the Media model.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     product_inventory = models.ForeignKey(
         ProductInventory,
@@ -538,20 +558,20 @@ class Stock(models.Model):
     The Stock class represents the stock of a product inventory.
 
     Attributes:
-        id (CharField): The primary key for the Stock model. It's a CharField that gets its default value
+        id (UUIDField): The primary key for the Stock model. It's a UUIDField that gets its default value
                         from the uuid.uuid4 function and is not editable.
         product_inventory (OneToOneField): A OneToOneField that links to a ProductInventory instance.
         last_checked (DateTimeField): A DateTimeField that stores the date and time the stock was last checked. It can be null and blank.
         units (IntegerField): An IntegerField that stores the number of units in stock. It is required and has a default value of 0.
         units_sold (IntegerField): An IntegerField that stores the number of units sold. It is required and has a default value of 0.
+        units_reserved (IntegerField): An IntegerField that stores the number of units held by unexpired reservations. It is required and has a default value of 0.
+        updated_at (DateTimeField): A DateTimeField that stores the date and time the stock was last updated, also set by the bulk stock updates.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     product_inventory = models.OneToOneField(
         ProductInventory,
@@ -581,7 +601,86 @@ class Stock(models.Model):
         verbose_name=_("Units Sold to Date"),
         help_text=_("format: required, default-0"),
     )
+    units_reserved = models.IntegerField(
+        default=0,
+        unique=False,
+        null=False,
+        blank=False,
+        verbose_name=_("Units Reserved"),
+        help_text=_("format: required, default-0"),
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Date Stock Updated"),
+        help_text=_("format: Y-m-d H:M:S"),
+    )
 
     class Meta:
         verbose_name = "Stock"
         verbose_name_plural = "Stocks"
+        constraints = [
+            # The stock can never be oversold, whatever updates it
+            models.CheckConstraint(
+                check=models.Q(units_sold__gte=0)
+                & models.Q(units_reserved__gte=0)
+                & models.Q(
+                    units__gte=models.F("units_sold") + models.F("units_reserved")
+                ),
+                name="stock_units_available",
+            ),
+        ]
+
+
+class StockReservation(models.Model):
+    """
+    The StockReservation class represents units of a product inventory stock held for a
+    pending order, until they are committed as sold, released or expired.
+
+    Attributes:
+        id (UUIDField): The primary key for the StockReservation model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
+        product_inventory (ForeignKey): A ForeignKey that links to the reserved ProductInventory instance.
+        units (PositiveIntegerField): A PositiveIntegerField that stores the number of units reserved. It is required.
+        expires_at (DateTimeField): A DateTimeField that stores the date and time the reservation expires. It is required.
+        created_at (DateTimeField): A DateTimeField that stores the date and time when the reservation was created.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    product_inventory = models.ForeignKey(
+        ProductInventory,
+        related_name="stock_reservations",
+        on_delete=models.PROTECT,
+    )
+    units = models.PositiveIntegerField(
+        unique=False,
+        null=False,
+        blank=False,
+        verbose_name=_("Units Reserved"),
+        help_text=_("format: required, min-1"),
+        validators=[MinValueValidator(1)],
+    )
+    expires_at = models.DateTimeField(
+        unique=False,
+        null=False,
+        blank=False,
+        db_index=True,
+        verbose_name=_("Reservation Expiry Date"),
+        help_text=_("format: Y-m-d H:M:S"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        editable=False,
+        verbose_name=_("Date Reservation Created"),
+        help_text=_("format: Y-m-d H:M:S"),
+    )
+
+    class Meta:
+        verbose_name = "Stock Reservation"
+        verbose_name_plural = "Stock Reservations"
+
+    def __str__(self):
+        return f"{self.units} x {self.product_inventory_id}"
@@ -0,0 +1,122 @@
+from django.db.models.signals import m2m_changed, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from .categories import (
+    rebuild_category_product_counts,
+    update_category_product_counts,
+)
+from .models import Category, Product
+
+ProductCategory = Product.category.through
+
+
+@receiver(post_init, sender=Product)
+def track_product_is_active(sender, instance, **kwargs):
+    """
+    Keep the loaded `is_active` of a product, to detect its changes on save.
+    """
+    instance._category_counts_is_active = instance.__dict__.get("is_active")
+
+
+@receiver(post_init, sender=Category)
+def track_category_parent(sender, instance, **kwargs):
+    """
+    Keep the loaded parent and tree of a category, to detect its moves on save.
+    """
+    instance._category_counts_tree = (
+        instance.__dict__.get("parent_id"),
+        instance.__dict__.get("tree_id"),
+    )
+
+
+@receiver(post_save, sender=Product)
+def product_is_active_changed(sender, instance, created, **kwargs):
+    """
+    Count or uncount a product in its categories when it is activated or deactivated.
+    """
+    value = instance.__dict__.get("is_active")
+    if (
+        not created
+        and value is not None
+        and instance._category_counts_is_active is not None
+        and value != instance._category_counts_is_active
+    ):
+        update_category_product_counts(
+            [instance.id],
+            list(instance.category.values_list("id", flat=True)),
+            1 if value else -1,
+            active_only=False,
+        )
+    instance._category_counts_is_active = value
+
+
+@receiver(post_save, sender=Category)
+def category_moved(sender, instance, created, **kwargs):
+    """
+    Recompute the product counts of the trees a category moved from and to.
+    """
+    parent_id, tree_id = instance._category_counts_tree
+    if not created and instance.parent_id != parent_id:
+        rebuild_category_product_counts(
+            Category.objects.filter(tree_id__in={tree_id, instance.tree_id})
+        )
+    instance._category_counts_tree = (instance.parent_id, instance.tree_id)
+
+
+@receiver(pre_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    """
+    Uncount a deleted product from its categories.
+    """
+    if instance.is_active:
+        update_category_product_counts(
+            [instance.id],
+            list(instance.category.values_list("id", flat=True)),
+            -1,
+            active_only=False,
+        )
+
+
+@receiver(pre_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    """
+    Uncount the products of a deleted category from its ancestors.
+    """
+    instance.products.clear()
+
+
+@receiver(m2m_changed, sender=ProductCategory)
+def product_categories_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Count the products added to categories and uncount the products removed.
+
+    The rows removed are only known before a remove or a clear, so they are kept on the
+    instance until the rows are deleted.
+    """
+    if action in ("pre_remove", "pre_clear"):
+        rows = ProductCategory.objects.filter(
+            **{"category_id" if reverse else "product_id": instance.id}
+        )
+        if action == "pre_remove":
+            rows = rows.filter(
+                **{"product_id__in" if reverse else "category_id__in": pk_set}
+            )
+        instance._category_counts_removed = set(
+            rows.values_list("product_id" if reverse else "category_id", flat=True)
+        )
+        return
+
+    if action == "post_add":
+        ids, sign = pk_set, 1
+    elif action in ("post_remove", "post_clear"):
+        ids, sign = instance.__dict__.pop("_category_counts_removed", set()), -1
+    else:
+        return
+
+    if not ids:
+        return
+
+    if reverse:
+        update_category_product_counts(ids, [instance.id], sign)
+    else:
+        update_category_product_counts([instance.id], ids, sign)
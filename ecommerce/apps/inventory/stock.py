@@ -0,0 +1,187 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import Stock, StockReservation
+
+# The number of expired reservations released per transaction
+EXPIRED_RESERVATIONS_BATCH_SIZE = 1000
+
+
+def get_available_stock(product_inventory_id, units):
+    """
+    Return the stock of a product inventory as a queryset, empty unless it has `units`
+    units neither sold nor reserved.
+
+    Updating it is a single conditional UPDATE, which checks and changes the units
+    atomically, so concurrent updates can never oversell the stock.
+    """
+
+    return Stock.objects.filter(
+        product_inventory_id=product_inventory_id,
+        units__gte=F("units_sold") + F("units_reserved") + units,
+    )
+
+
+def decrement_stock(product_inventory_id, units):
+    """
+    Sell units of a product inventory stock right away, if that many units are available.
+
+    Returns:
+        bool: Whether the units were sold
+    """
+
+    return bool(
+        get_available_stock(product_inventory_id, units).update(
+            units_sold=F("units_sold") + units, updated_at=timezone.now()
+        )
+    )
+
+
+def reserve_stock(product_inventory_id, units, timeout=None):
+    """
+    Reserve units of a product inventory stock, if that many units are available.
+
+    The reservation is inserted first, so the stock row is only locked from the
+    conditional UPDATE of the available units to the commit.
+
+    Args:
+        product_inventory_id (UUID): The id of the product inventory to reserve
+        units (int): The number of units to reserve
+        timeout (int): The seconds before the reservation expires, by default
+            `STOCK_RESERVATION_TIMEOUT`
+
+    Returns:
+        StockReservation: The reservation, None when the units are not available
+    """
+
+    if timeout is None:
+        timeout = settings.STOCK_RESERVATION_TIMEOUT
+
+    with transaction.atomic():
+        reservation = StockReservation.objects.create(
+            product_inventory_id=product_inventory_id,
+            units=units,
+            expires_at=timezone.now() + timedelta(seconds=timeout),
+        )
+        reserved = get_available_stock(product_inventory_id, units).update(
+            units_reserved=F("units_reserved") + units, updated_at=timezone.now()
+        )
+
+        if not reserved:
+            transaction.set_rollback(True)
+            return None
+
+    return reservation
+
+
+def pop_reservation(reservation_id):
+    """
+    Delete a reservation and return it, None when it does not exist anymore.
+
+    The reservation row is locked until the transaction ends, so concurrent commits,
+    releases and expiries of a reservation can only apply once.
+    """
+
+    reservation = (
+        StockReservation.objects.select_for_update().filter(id=reservation_id).first()
+    )
+    if reservation is not None:
+        StockReservation.objects.filter(id=reservation.id).delete()
+
+    return reservation
+
+
+def commit_reservation(reservation_id):
+    """
+    Commit the units of a reservation as sold.
+
+    An expired reservation is released instead, as its units may have been reserved
+    by others once expired.
+
+    Returns:
+        StockReservation: The committed reservation, None when missing or expired
+    """
+
+    with transaction.atomic():
+        reservation = pop_reservation(reservation_id)
+        if reservation is None:
+            return None
+
+        expired = reservation.expires_at <= timezone.now()
+        Stock.objects.filter(
+            product_inventory_id=reservation.product_inventory_id
+        ).update(
+            units_reserved=F("units_reserved") - reservation.units,
+            units_sold=F("units_sold") + (0 if expired else reservation.units),
+            updated_at=timezone.now(),
+        )
+
+    return None if expired else reservation
+
+
+def release_reservation(reservation_id):
+    """
+    Release the units of a reservation back to the available stock.
+
+    Returns:
+        StockReservation: The released reservation, None when missing or expired
+    """
+
+    with transaction.atomic():
+        reservation = pop_reservation(reservation_id)
+        if reservation is None:
+            return None
+
+        Stock.objects.filter(
+            product_inventory_id=reservation.product_inventory_id
+        ).update(
+            units_reserved=F("units_reserved") - reservation.units,
+            updated_at=timezone.now(),
+        )
+
+    return None if reservation.expires_at <= timezone.now() else reservation
+
+
+def release_expired_reservations():
+    """
+    Release the units of every expired reservation, in batches.
+
+    The reservations being committed or released concurrently are locked, and skipped
+    rather than waited for. The stock of each product inventory is updated once per batch.
+
+    Returns:
+        int: The number of released reservations
+    """
+
+    released = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                StockReservation.objects.select_for_update(skip_locked=True)
+                .filter(expires_at__lte=timezone.now())
+                .values_list("id", flat=True)[:EXPIRED_RESERVATIONS_BATCH_SIZE]
+            )
+            if not ids:
+                return released
+
+            expired = StockReservation.objects.filter(id__in=ids)
+            # The stocks are updated in id order, so concurrent batches can not deadlock
+            units = list(
+                expired.values("product_inventory_id")
+                .annotate(total_units=Sum("units"))
+                .order_by("product_inventory_id")
+                .values_list("product_inventory_id", "total_units")
+            )
+            expired.delete()
+
+            for product_inventory_id, total in units:
+                Stock.objects.filter(product_inventory_id=product_inventory_id).update(
+                    units_reserved=F("units_reserved") - total,
+                    updated_at=timezone.now(),
+                )
+
+        released += len(ids)
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from .stock import release_expired_reservations
+
+
+@shared_task
+def release_expired_stock_reservations():
+    """
+    This task releases the units of the expired stock reservations
+
+    Returns:
+        int: The number of released reservations
+    """
+
+    return release_expired_reservations()
@@ -0,0 +1,202 @@
+import io
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+from ecommerce.apps.inventory.category_import import (
+    import_categories,
+    read_category_rows,
+)
+from ecommerce.apps.inventory.models import Category
+
+CATEGORIES_CSV = """name,slug,parent,is_active
+Clothing,clothing,,
+Shirts,shirts,clothing,
+Polo,polo,shirts,false
+Jeans,jeans,clothing,
+Shoes,shoes,,
+"""
+
+
+def get_tree():
+    categories = Category.objects.select_related("parent")
+    roots = {
+        category.tree_id: category.slug
+        for category in categories
+        if category.parent is None
+    }
+
+    return {
+        category.slug: (
+            category.parent.slug if category.parent else None,
+            roots.get(category.tree_id),
+            category.lft,
+            category.rght,
+            category.level,
+        )
+        for category in categories
+    }
+
+
+def assert_valid_tree():
+    """
+    Assert the tree fields are the ones django-mptt rebuilds from the parents, the
+    trees being told apart by their root rather than their tree id.
+    """
+
+    tree = get_tree()
+    Category.objects.rebuild()
+
+    assert get_tree() == tree
+
+
+def test_import_categories_csv(db, django_assert_max_num_queries):
+    """
+    Test to verify a CSV tree is imported in a constant number of queries.
+    """
+
+    rows = read_category_rows(io.StringIO(CATEGORIES_CSV), "csv")
+
+    with django_assert_max_num_queries(12):
+        counts = import_categories(rows)
+
+    assert counts == {"created": 5, "updated": 0}
+    assert_valid_tree()
+
+    clothing = Category.objects.get(slug="clothing")
+    assert [category.slug for category in clothing.get_descendants()] == [
+        "jeans",
+        "shirts",
+        "polo",
+    ]
+    assert not Category.objects.get(slug="polo").is_active
+
+
+def test_import_categories_move(db, category_factory, product_factory):
+    """
+    Test to verify an import moves existing categories and their subtrees, and
+    recomputes the product counts.
+    """
+
+    import_categories(read_category_rows(io.StringIO(CATEGORIES_CSV), "csv"))
+    product_factory(category=[Category.objects.get(slug="jeans")])
+    shirts = Category.objects.get(slug="shirts")
+
+    counts = import_categories(
+        [
+            {"id": str(shirts.id), "name": "Shirts", "parent": "shoes"},
+            {"name": "Boots", "slug": "boots", "parent": "shoes"},
+            {"name": "Jeans", "slug": "jeans", "parent": "shirts"},
+        ]
+    )
+
+    assert counts == {"created": 1, "updated": 2}
+    assert_valid_tree()
+
+    shoes = Category.objects.get(slug="shoes")
+    assert [category.slug for category in shoes.get_descendants()] == [
+        "boots",
+        "shirts",
+        "jeans",
+        "polo",
+    ]
+    assert shoes.subtree_product_count == 1
+    assert Category.objects.get(slug="clothing").subtree_product_count == 0
+
+
+def test_import_categories_rebuilds_touched_trees(db):
+    """
+    Test to verify an import creating no root only rebuilds the trees it touched.
+    """
+
+    import_categories(read_category_rows(io.StringIO(CATEGORIES_CSV), "csv"))
+    import_categories([{"name": "Hats", "slug": "hats"}])
+    hats = Category.objects.get(slug="hats")
+
+    import_categories(
+        [
+            {"name": "Shirts", "slug": "shirts", "parent": "shoes"},
+            {"name": "Sandals", "slug": "sandals", "parent": "shoes"},
+        ]
+    )
+
+    assert_valid_tree()
+    assert Category.objects.get(slug="hats").tree_id == hats.tree_id
+    assert [
+        category.slug
+        for category in Category.objects.get(slug="shoes").get_descendants()
+    ] == ["sandals", "shirts", "polo"]
+    assert Category.objects.get(slug="clothing").get_descendant_count() == 1
+
+
+def test_import_categories_parent_slug_of_row_with_id(db):
+    """
+    Test to verify a parent row with an id can be referenced by its slug.
+    """
+
+    import_categories(
+        [
+            {
+                "id": "6b7b56ce-e8c1-4d3c-9a8f-0d5b6f2e4a11",
+                "name": "Root",
+                "slug": "root",
+            },
+            {"name": "Child", "slug": "child", "parent": "root"},
+        ]
+    )
+
+    assert Category.objects.get(slug="child").parent.slug == "root"
+    assert_valid_tree()
+
+
+@pytest.mark.parametrize(
+    "rows, message",
+    [
+        ([{"name": "A", "parent": "missing"}], "does not exist"),
+        ([{"name": "A"}, {"name": "B", "slug": "a"}], "more than once"),
+        ([{"name": "A", "parent": "b"}, {"name": "B", "parent": "a"}], "own ancestor"),
+        (
+            [
+                {"id": "6b7b56ce-e8c1-4d3c-9a8f-0d5b6f2e4a11", "name": "A"},
+                {"id": "0c7a1f52-3c55-4e0e-8f3e-6f1d2d8b9c22", "name": "A"},
+                {"name": "B", "parent": "a"},
+            ],
+            "ambiguous",
+        ),
+        ([{"name": ""}], "has no name"),
+    ],
+)
+def test_import_categories_invalid(db, rows, message):
+    """
+    Test to verify invalid imports are rejected without any change.
+    """
+
+    with pytest.raises(ValidationError, match=message):
+        import_categories(rows)
+
+    assert not Category.objects.exists()
+
+
+def test_import_categories_command_fixture(db, tmp_path):
+    """
+    Test to verify the command imports a Django fixture of categories.
+    """
+
+    path = tmp_path / "categories.json"
+    path.write_text(
+        """[
+            {"model": "inventory.category", "pk": "6b7b56ce-e8c1-4d3c-9a8f-0d5b6f2e4a11",
+             "fields": {"name": "Root", "slug": "root", "parent": null, "lft": 7}},
+            {"model": "inventory.category", "pk": "0c7a1f52-3c55-4e0e-8f3e-6f1d2d8b9c22",
+             "fields": {"name": "Child", "slug": "child",
+                        "parent": "6b7b56ce-e8c1-4d3c-9a8f-0d5b6f2e4a11", "lft": 1}}
+        ]"""
+    )
+    out = io.StringIO()
+
+    call_command("import_categories", str(path), stdout=out)
+
+    assert "2 categories created, 0 updated" in out.getvalue()
+    assert Category.objects.get(slug="child").parent.slug == "root"
+    assert_valid_tree()
@@ -0,0 +1,143 @@
+import pytest
+from django.core.management import call_command
+
+from ecommerce.apps.inventory.models import Category, Product
+
+
+@pytest.fixture
+def category_tree(db, category_factory):
+    """
+    A root category with two children, the first one with a child.
+    """
+
+    root = category_factory()
+    first = category_factory(parent=root)
+    second = category_factory(parent=root)
+    leaf = category_factory(parent=first)
+
+    return root, first, second, leaf
+
+
+def get_counts(categories):
+    counts = {
+        category.id: (category.product_count, category.subtree_product_count)
+        for category in Category.objects.filter(id__in=[c.id for c in categories])
+    }
+
+    return [counts[category.id] for category in categories]
+
+
+def assert_rebuilt_counts(categories):
+    """
+    Assert the maintained counts are the counts a rebuild computes.
+    """
+
+    counts = get_counts(categories)
+    call_command("rebuild_category_product_counts")
+
+    assert get_counts(categories) == counts
+
+
+def test_category_product_counts_add_remove(category_tree, product_factory):
+    """
+    Test to verify the counts follow product categories added and removed, counting a
+    product in several categories of a subtree once.
+    """
+
+    root, first, second, leaf = category_tree
+    product = product_factory(category=[first, leaf])
+    product_factory(category=[second])
+
+    assert get_counts(category_tree) == [(0, 2), (1, 1), (1, 1), (1, 1)]
+
+    product.category.remove(leaf)
+
+    assert get_counts(category_tree) == [(0, 2), (1, 1), (1, 1), (0, 0)]
+
+    # Removing a category the product is not in changes nothing
+    product.category.remove(leaf)
+    leaf.products.add(product)
+    root.products.add(product)
+
+    assert get_counts(category_tree) == [(1, 2), (1, 1), (1, 1), (1, 1)]
+    assert_rebuilt_counts(category_tree)
+
+    product.category.clear()
+
+    assert get_counts(category_tree) == [(0, 1), (0, 0), (1, 1), (0, 0)]
+    assert_rebuilt_counts(category_tree)
+
+
+def test_category_product_counts_is_active(category_tree, product_factory):
+    """
+    Test to verify only the active products are counted.
+    """
+
+    root, first, second, leaf = category_tree
+    product = product_factory(category=[first, leaf])
+
+    product.is_active = False
+    product.save()
+
+    assert get_counts(category_tree) == [(0, 0)] * 4
+
+    second.products.add(product)
+
+    assert get_counts(category_tree) == [(0, 0)] * 4
+
+    product = Product.objects.get(id=product.id)
+    product.is_active = True
+    product.save()
+
+    assert get_counts(category_tree) == [(0, 1), (1, 1), (1, 1), (1, 1)]
+    assert_rebuilt_counts(category_tree)
+
+    product.delete()
+
+    assert get_counts(category_tree) == [(0, 0)] * 4
+
+
+def test_category_product_counts_move_and_delete(
+    category_tree, category_factory, product_factory
+):
+    """
+    Test to verify the counts are recomputed when a category moves or is deleted.
+    """
+
+    root, first, second, leaf = category_tree
+    other = category_factory()
+    product_factory(category=[leaf, second])
+
+    leaf = Category.objects.get(id=leaf.id)
+    leaf.parent = other
+    leaf.save()
+
+    assert get_counts([root, first, second, leaf, other]) == [
+        (0, 1),
+        (0, 0),
+        (1, 1),
+        (1, 1),
+        (0, 1),
+    ]
+
+    Category.objects.get(id=second.id).delete()
+
+    assert get_counts([root, other]) == [(0, 0), (0, 1)]
+
+
+def test_rebuild_category_product_counts(category_tree, product_factory):
+    """
+    Test to verify the rebuild command repairs counts changed without signals.
+    """
+
+    root, first, second, leaf = category_tree
+    product_factory(category=[first, leaf])
+    Product.category.through.objects.bulk_create(
+        Product.category.through(product=product, category=second)
+        for product in product_factory.create_batch(2)
+    )
+    Category.objects.update(product_count=0, subtree_product_count=0)
+
+    call_command("rebuild_category_product_counts", tree=[root.tree_id])
+
+    assert get_counts(category_tree) == [(0, 3), (1, 1), (2, 2), (1, 1)]
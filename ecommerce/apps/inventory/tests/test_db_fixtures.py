@@ -148,7 +148,7 @@ def test_inventory_product_insert_data(
 
     assert product.category.count() == categories
     for cat in category_list:
-        assert str(cat.id) in [cat.id for cat in product.category.all()]
+        assert cat.id in [cat.id for cat in product.category.all()]
 
 
 @pytest.mark.dbfixture
@@ -215,9 +215,9 @@ def test_inventory_product_inventory_dbfixture(
 
     assert result.sku == sku
     assert result.upc == upc
-    assert result.product_type.id == product_type
-    assert result.product.id == product
-    assert result.brand.id == brand
+    assert str(result.product_type.id) == product_type
+    assert str(result.product.id) == product
+    assert str(result.brand.id) == brand
     assert result.is_active == is_active
     assert result.retail_price == retail_price
     assert result.store_price == store_price
@@ -379,7 +379,7 @@ def test_inventory_media_dbfixture(
         "%Y-%m-%d %H:%M:%S"
     )
 
-    assert result.product_inventory.id == product_inventory
+    assert str(result.product_inventory.id) == product_inventory
     assert result.image == image
     assert result.alt_text == alt_text
     assert result.is_feature == is_feature
@@ -445,7 +445,7 @@ def test_inventory_stock_dbfixture(
         "%Y-%m-%d %H:%M:%S"
     )
 
-    assert result.product_inventory.id == product_inventory
+    assert str(result.product_inventory.id) == product_inventory
     assert result_last_checked == last_checked
     assert result.units == units
     assert result.units_sold == units_sold
@@ -491,7 +491,7 @@ def test_inventory_product_attribute_dbfixture(db, db_fixture_setup, id, name):
 
     result = models.ProductAttribute.objects.get(id=id)
 
-    assert result.id == id
+    assert str(result.id) == id
     assert result.name == name
 
 
@@ -557,8 +557,8 @@ def test_inventory_product_attribute_value_dbfixture(
 
     result = models.ProductAttributeValue.objects.get(id=id)
 
-    assert result.id == id
-    assert result.product_attribute.id == product_attribute
+    assert str(result.id) == id
+    assert str(result.product_attribute.id) == product_attribute
     assert result.attribute_value == attribute_value
 
 
@@ -0,0 +1,73 @@
+import pytest
+
+from ecommerce.apps.inventory.categories import filter_category_products
+from ecommerce.apps.inventory.models import Category, Product, ProductInventory
+
+pytestmark = pytest.mark.query_plan
+
+
+def test_category_slug_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the demo category lookup by slug uses an index.
+    """
+
+    assert_index_plan(
+        Category.objects.filter(slug=query_plan_catalogue["category"].slug)
+    )
+
+
+def test_product_slug_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the demo product lookup by slug uses an index.
+    """
+
+    assert_index_plan(Product.objects.filter(slug=query_plan_catalogue["product"].slug))
+
+
+def test_parent_categories_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the parent categories page is read in name order from an index.
+    """
+
+    assert_index_plan(Category.objects.filter(parent=None).order_by("name")[:20])
+
+
+def test_sub_categories_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the sub categories page is read in name order from an index.
+    """
+
+    assert_index_plan(
+        Category.objects.filter(
+            parent=query_plan_catalogue["category"].parent
+        ).order_by("name")[:20]
+    )
+
+
+def test_category_subtree_products_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the products of a category subtree are read from indexes only.
+    """
+
+    assert_index_plan(
+        filter_category_products(
+            Product.objects.all(),
+            query_plan_catalogue["category"].parent_id,
+            include_descendants=True,
+        ).order_by("name", "id")[:11]
+    )
+
+
+@pytest.mark.parametrize("field", ["brand", "product_type"])
+def test_product_inventory_listing_plan(
+    db, query_plan_catalogue, assert_index_plan, field
+):
+    """
+    Test to verify the brand and product type listings are read in keyset order from an index.
+    """
+
+    assert_index_plan(
+        ProductInventory.objects.filter(
+            **{field: query_plan_catalogue[field]}
+        ).order_by("created_at", "id")[:11]
+    )
@@ -0,0 +1,142 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from ecommerce.apps.inventory.models import Stock, StockReservation
+from ecommerce.apps.inventory.stock import (
+    commit_reservation,
+    decrement_stock,
+    release_expired_reservations,
+    release_reservation,
+    reserve_stock,
+)
+
+
+def get_stock(stock):
+    return Stock.objects.get(id=stock.id)
+
+
+def test_reserve_commit_and_release_stock(db, stock_factory):
+    """
+    Test to verify reservations hold units until they are committed or released.
+    """
+
+    stock = stock_factory(units=10, units_sold=4)
+
+    sold = reserve_stock(stock.product_inventory_id, 4)
+    released = reserve_stock(stock.product_inventory_id, 2)
+
+    assert get_stock(stock).units_reserved == 6
+    assert reserve_stock(stock.product_inventory_id, 1) is None
+    assert StockReservation.objects.count() == 2
+
+    assert commit_reservation(sold.id) == sold
+    assert release_reservation(released.id) == released
+    assert commit_reservation(sold.id) is None
+    assert release_reservation(released.id) is None
+
+    stock = get_stock(stock)
+    assert (stock.units_sold, stock.units_reserved) == (8, 0)
+    assert not StockReservation.objects.exists()
+
+
+def test_decrement_stock_keeps_reserved_units(db, stock_factory):
+    """
+    Test to verify decrements only sell the units neither sold nor reserved.
+    """
+
+    stock = stock_factory(units=10, units_sold=4)
+    reserve_stock(stock.product_inventory_id, 2)
+
+    assert decrement_stock(stock.product_inventory_id, 3)
+    assert not decrement_stock(stock.product_inventory_id, 2)
+    assert decrement_stock(stock.product_inventory_id, 1)
+    assert get_stock(stock).units_sold == 8
+
+
+def test_expired_reservations_are_released(db, stock_factory):
+    """
+    Test to verify expired reservations give their units back and can not be committed.
+    """
+
+    stock = stock_factory(units=10, units_sold=0)
+    expired = reserve_stock(stock.product_inventory_id, 3)
+    committed = reserve_stock(stock.product_inventory_id, 3)
+    pending = reserve_stock(stock.product_inventory_id, 4)
+    StockReservation.objects.filter(id__in=[expired.id, committed.id]).update(
+        expires_at=timezone.now() - timedelta(seconds=1)
+    )
+
+    assert commit_reservation(committed.id) is None
+    assert release_expired_reservations() == 1
+
+    stock = get_stock(stock)
+    assert (stock.units_sold, stock.units_reserved) == (0, 4)
+    assert list(StockReservation.objects.values_list("id", flat=True)) == [pending.id]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_reservations_never_oversell(stock_factory):
+    """
+    Test to verify concurrent decrements, reservations and commits sell exactly the
+    available units.
+    """
+
+    stock = stock_factory(units=50, units_sold=0)
+    results = []
+
+    def buy():
+        try:
+            for index in range(10):
+                if index % 2:
+                    results.append(decrement_stock(stock.product_inventory_id, 1))
+                    continue
+
+                reservation = reserve_stock(stock.product_inventory_id, 1)
+                results.append(
+                    reservation is not None
+                    and commit_reservation(reservation.id) is not None
+                )
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=buy) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stock = get_stock(stock)
+    assert results.count(True) == 50
+    assert (stock.units_sold, stock.units_reserved) == (50, 0)
+
+
+def test_stock_admin_keeps_concurrent_units(db, admin_client, stock_factory):
+    """
+    Test to verify the stock admin can not edit the units sold and reserved, and does
+    not overwrite them when saving a stock.
+    """
+
+    stock = stock_factory(units=10, units_sold=2)
+    url = reverse("admin:inventory_stock_change", args=[stock.id])
+
+    # A sale committed while the admin form is open
+    Stock.objects.filter(id=stock.id).update(units_sold=4)
+
+    response = admin_client.post(
+        url,
+        {
+            "product_inventory": stock.product_inventory_id,
+            "units": 12,
+            "units_sold": 0,
+            "units_reserved": 5,
+        },
+    )
+
+    assert response.status_code == 302
+    stock = get_stock(stock)
+    assert (stock.units, stock.units_sold, stock.units_reserved) == (12, 4, 0)
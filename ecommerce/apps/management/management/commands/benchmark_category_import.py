@@ -0,0 +1,109 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ecommerce.apps.inventory.category_import import import_categories
+from ecommerce.apps.inventory.models import Category
+
+
+class Command(BaseCommand):
+    """
+    Benchmark bulk category tree imports against saving the categories one by one.
+
+    For every size, a tree with `--branching` children per category is generated and
+    imported, in a transaction rolled back at the end. A smaller tree of `--saves`
+    categories is also saved one by one with the MPTT updates enabled, and imported in
+    bulk, to compare the two on the same tree.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Report the duration of bulk category tree imports of several sizes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--nodes",
+            type=int,
+            nargs="+",
+            default=[10000, 50000, 200000],
+            help="Number of categories of every imported tree.",
+        )
+        parser.add_argument(
+            "--branching",
+            type=int,
+            default=10,
+            help="Number of children per category.",
+        )
+        parser.add_argument(
+            "--saves",
+            type=int,
+            default=1000,
+            help="Number of categories saved one by one for the comparison, 0 to skip it.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        self.stdout.write(f"{'method':<10}{'nodes':>10}{'seconds':>10}{'nodes/s':>10}")
+
+        if kwargs["saves"]:
+            rows = self.generate_rows(kwargs["saves"], kwargs["branching"])
+            self.report("save", rows, self.save_categories)
+            self.report("import", rows, import_categories)
+
+        for nodes in kwargs["nodes"]:
+            rows = self.generate_rows(nodes, kwargs["branching"])
+            self.report("import", rows, import_categories)
+
+    def generate_rows(self, nodes, branching):
+        """
+        Return the rows of a breadth first tree of `nodes` categories.
+        """
+
+        prefix = uuid.uuid4().hex[:8]
+        ids = [str(uuid.uuid4()) for _ in range(nodes)]
+
+        return [
+            {
+                "id": ids[index],
+                "name": f"benchmark {prefix} {index}",
+                "slug": f"benchmark-{prefix}-{index}",
+                "parent": ids[(index - 1) // branching] if index else None,
+            }
+            for index in range(nodes)
+        ]
+
+    def save_categories(self, rows):
+        """
+        Save the categories one by one, the parents first.
+        """
+
+        for row in rows:
+            Category(
+                id=row["id"],
+                name=row["name"],
+                slug=row["slug"],
+                parent_id=row["parent"],
+            ).save()
+
+    def report(self, method, rows, load):
+        """
+        Write the duration of a load of the rows, rolled back afterwards.
+        """
+
+        with transaction.atomic():
+            start = time.perf_counter()
+            load(rows)
+            elapsed = time.perf_counter() - start
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{method:<10}{len(rows):>10}{elapsed:>10.2f}{len(rows) / elapsed:>10.0f}"
+        )
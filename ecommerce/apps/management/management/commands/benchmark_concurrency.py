@@ -0,0 +1,158 @@
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Benchmark the requests per second of REST API endpoints under concurrent connections.
+
+    Each url is loaded by keep-alive HTTP/1.1 connections, one per concurrency slot,
+    so the WSGI and ASGI serving modes are compared by passing the same endpoint on a
+    WSGI server and on an ASGI server, e.g. `/restapi/products/` on `runserver` or
+    gunicorn and `/restapi/async/products/` on `uvicorn ecommerce.asgi:application`.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Compare endpoints requests per second at increasing concurrent connections."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "urls",
+            nargs="+",
+            help="Absolute http:// urls of the endpoints to benchmark.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            default="100,250,500,1000",
+            help="Comma separated numbers of concurrent connections.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=5000,
+            help="Number of requests sent per url and concurrency level.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="Seconds before a request is counted as an error.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        for url in kwargs["urls"]:
+            if urlsplit(url).scheme != "http":
+                raise CommandError(f"Only http:// urls can be benchmarked: {url}")
+
+        self.stdout.write(
+            f"{'url':<50}{'connections':>12}{'requests/s':>12}"
+            f"{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}"
+        )
+
+        for concurrency in [int(c) for c in kwargs["concurrency"].split(",")]:
+            for url in kwargs["urls"]:
+                latencies, errors, elapsed = asyncio.run(
+                    self.run(url, concurrency, kwargs["requests"], kwargs["timeout"])
+                )
+                latencies.sort()
+                p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0
+
+                self.stdout.write(
+                    f"{url:<50}{concurrency:>12}{len(latencies) / elapsed:>12.0f}"
+                    f"{statistics.median(latencies or [0]) * 1000:>9.1f}"
+                    f"{p99 * 1000:>9.1f}{errors:>8}"
+                )
+
+    async def run(self, url, concurrency, requests, timeout):
+        """
+        Send `requests` GET requests over `concurrency` connections.
+
+        Returns the latencies of the successful requests, the number of errors and the
+        total time in seconds.
+        """
+
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request = (
+            f"GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+            "Accept: application/json\r\nConnection: keep-alive\r\n\r\n"
+        ).encode("ascii")
+
+        remaining = [requests]
+        latencies = []
+        errors = [0]
+
+        async def connection():
+            reader = writer = None
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(parts.hostname, parts.port or 80),
+                            timeout,
+                        )
+
+                    start = time.perf_counter()
+                    writer.write(request)
+                    status, keep_alive = await asyncio.wait_for(
+                        self.read_response(reader), timeout
+                    )
+                    latency = time.perf_counter() - start
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    errors[0] += 1
+                    status, keep_alive = None, False
+                else:
+                    if status == 200:
+                        latencies.append(latency)
+                    else:
+                        errors[0] += 1
+
+                if not keep_alive and writer is not None:
+                    writer.close()
+                    reader = writer = None
+
+            if writer is not None:
+                writer.close()
+
+        start = time.perf_counter()
+        await asyncio.gather(*[connection() for _ in range(concurrency)])
+
+        return latencies, errors[0], time.perf_counter() - start
+
+    async def read_response(self, reader):
+        """
+        Read a whole HTTP/1.1 response, returning its status and whether it is kept alive.
+        """
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            await reader.readexactly(int(headers.get("content-length", 0)))
+
+        return int(status_line.split()[1]), headers.get("connection") != "close"
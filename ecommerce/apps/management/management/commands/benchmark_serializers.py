@@ -0,0 +1,128 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from ecommerce.apps.inventory.models import Product, ProductInventory
+from ecommerce.apps.restapi.renderers import ORJSONRenderer
+from ecommerce.apps.restapi.serializers import (
+    PRODUCT_INVENTORY_LIST_PLAN,
+    PRODUCT_INVENTORY_PRODUCT_PLAN,
+    PRODUCT_LIST_PLAN,
+    ProductInventoryListSerializer,
+    ProductInventoryProductSerializer,
+    ProductListSerializer,
+)
+
+
+class Command(BaseCommand):
+    """
+    Benchmark the REST API list serializers against their values plans.
+
+    Every run loads, serializes and renders one page of the current database rows,
+    like the list endpoints do, and the throughput is reported per page size.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = (
+        "Compare the list serializers and their values plans throughput per page size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-sizes",
+            default="10,50,100,500",
+            help="Comma separated page sizes to benchmark.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Number of pages rendered per page size and serialization path.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        page_sizes = [int(size) for size in kwargs["page_sizes"].split(",")]
+        iterations = kwargs["iterations"]
+
+        benchmarks = [
+            (
+                "products",
+                Product.objects.all(),
+                ProductListSerializer,
+                PRODUCT_LIST_PLAN,
+            ),
+            (
+                "product_inventory",
+                ProductInventory.objects.order_by("created_at", "id"),
+                ProductInventoryListSerializer,
+                PRODUCT_INVENTORY_LIST_PLAN,
+            ),
+            (
+                "brand_products",
+                ProductInventory.objects.order_by("created_at", "id"),
+                ProductInventoryProductSerializer,
+                PRODUCT_INVENTORY_PRODUCT_PLAN,
+            ),
+        ]
+
+        self.stdout.write(
+            f"{'endpoint':<20}{'page size':>10}{'rows':>8}"
+            f"{'serializer rows/s':>20}{'values rows/s':>16}{'speedup':>10}"
+        )
+
+        for name, queryset, serializer_class, plan in benchmarks:
+            for page_size in page_sizes:
+                serializer_time, rows = self.measure(
+                    iterations,
+                    lambda: self.render_serializer(
+                        serializer_class, queryset, page_size
+                    ),
+                )
+                values_time, _ = self.measure(
+                    iterations, lambda: self.render_plan(plan, queryset, page_size)
+                )
+
+                if not rows:
+                    self.stderr.write(
+                        self.style.WARNING(f"No rows to benchmark {name}.")
+                    )
+                    break
+
+                self.stdout.write(
+                    f"{name:<20}{page_size:>10}{rows:>8}"
+                    f"{rows * iterations / serializer_time:>20.0f}"
+                    f"{rows * iterations / values_time:>16.0f}"
+                    f"{serializer_time / values_time:>9.1f}x"
+                )
+
+    def measure(self, iterations, render):
+        """
+        Return the total time of `iterations` renders and the number of rows of a page.
+        """
+
+        rows = render()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render()
+
+        return time.perf_counter() - start, rows
+
+    def render_serializer(self, serializer_class, queryset, page_size):
+        page = list(serializer_class.setup_eager_loading(queryset)[:page_size])
+        JSONRenderer().render(serializer_class(page, many=True).data)
+
+        return len(page)
+
+    def render_plan(self, plan, queryset, page_size):
+        page = list(plan.values(queryset)[:page_size])
+        ORJSONRenderer().render(plan.serialize(page))
+
+        return len(page)
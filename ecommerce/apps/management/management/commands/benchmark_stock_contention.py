@@ -0,0 +1,160 @@
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ecommerce.apps.inventory.models import (
+    Brand,
+    Product,
+    ProductInventory,
+    ProductType,
+    Stock,
+    StockReservation,
+)
+from ecommerce.apps.inventory.stock import (
+    commit_reservation,
+    decrement_stock,
+    reserve_stock,
+)
+
+
+class Command(BaseCommand):
+    """
+    Benchmark concurrent stock decrements on a single hot product inventory.
+
+    Every thread has its own database connection and buys one unit at a time until the
+    stock is sold out, by a direct decrement or by a reservation committed right away
+    with `--mode reservation`. The command fails when more units are sold than the
+    stock holds. The benchmark product inventory and its stock are created for the run
+    and deleted afterwards.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Report the decrements per second and overselling of a contended stock."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=32,
+            help="Number of concurrent buyers.",
+        )
+        parser.add_argument(
+            "--units",
+            type=int,
+            default=5000,
+            help="Number of units in stock.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["decrement", "reservation"],
+            default="decrement",
+            help="Buy by a direct decrement, or by a reservation and its commit.",
+        )
+        parser.add_argument(
+            "--attempts",
+            type=int,
+            default=None,
+            help="Number of purchase attempts per thread, enough to sell out by default.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        threads = kwargs["threads"]
+        units = kwargs["units"]
+        attempts = kwargs["attempts"] or -(-units * 2 // threads)
+        purchase = getattr(self, f"purchase_{kwargs['mode']}")
+
+        stock = self.create_stock(units)
+        try:
+            counts = {"sold": 0, "rejected": 0, "errors": 0}
+            lock = threading.Lock()
+
+            def buy():
+                try:
+                    for _ in range(attempts):
+                        try:
+                            sold = purchase(stock.product_inventory_id)
+                        except Exception:
+                            outcome = "errors"
+                        else:
+                            outcome = "sold" if sold else "rejected"
+
+                        with lock:
+                            counts[outcome] += 1
+                finally:
+                    connection.close()
+
+            workers = [threading.Thread(target=buy) for _ in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            stock.refresh_from_db()
+        finally:
+            self.delete_stock(stock)
+
+        total = sum(counts.values())
+        self.stdout.write(
+            f"{threads} threads, {total} attempts in {elapsed:.2f}s: "
+            f"{total / elapsed:.0f} attempts/s, {counts['sold'] / elapsed:.0f} decrements/s"
+        )
+        self.stdout.write(
+            f"sold {counts['sold']}, rejected {counts['rejected']}, "
+            f"errors {counts['errors']}, stock units {stock.units}, "
+            f"units sold {stock.units_sold}, units reserved {stock.units_reserved}"
+        )
+
+        if stock.units_sold > stock.units or counts["sold"] != stock.units_sold:
+            raise CommandError("The stock was oversold.")
+
+        self.stdout.write(self.style.SUCCESS("No units were oversold."))
+
+    def purchase_decrement(self, product_inventory_id):
+        return decrement_stock(product_inventory_id, 1)
+
+    def purchase_reservation(self, product_inventory_id):
+        reservation = reserve_stock(product_inventory_id, 1)
+
+        return reservation is not None and bool(commit_reservation(reservation.id))
+
+    def create_stock(self, units):
+        """
+        Create a product inventory and its stock for the benchmark.
+        """
+
+        name = f"benchmark-{uuid.uuid4().hex[:12]}"
+        product_inventory = ProductInventory.objects.create(
+            product_type=ProductType.objects.create(name=name),
+            product=Product.objects.create(name=name, slug=name, description=name),
+            brand=Brand.objects.create(name=name),
+            retail_price=1,
+            store_price=1,
+            weight=1,
+        )
+
+        return Stock.objects.create(product_inventory=product_inventory, units=units)
+
+    def delete_stock(self, stock):
+        """
+        Delete the benchmark stock, its product inventory and its reservations.
+        """
+
+        product_inventory = stock.product_inventory
+        StockReservation.objects.filter(product_inventory=product_inventory).delete()
+        stock.delete()
+        product_inventory.delete()
+        product_inventory.product.delete()
+        product_inventory.product_type.delete()
+        product_inventory.brand.delete()
@@ -0,0 +1,194 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from .normalize_uuid_keys import UUID_KEY_APPS
+
+# The key column types compared, the varchar keys before the migration
+KEY_TYPES = {"varchar": "varchar(256)", "uuid": "uuid"}
+
+
+class Command(BaseCommand):
+    """
+    Compare the index sizes and join latency of varchar(256) and uuid keys on PostgreSQL.
+
+    The same generated keys are loaded in a parent and a child table per key type, in
+    a transaction rolled back at the end, and their primary key and foreign key indexes
+    are measured, as well as a join of the whole tables and indexed joins of a sample
+    of parents. The index sizes of the models tables are reported as they are in the
+    database, so running the command before and after `migrate` compares the two.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Report index sizes and join latency of varchar and uuid keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--parents",
+            type=int,
+            default=100000,
+            help="Number of parent rows generated per key type.",
+        )
+        parser.add_argument(
+            "--children",
+            type=int,
+            default=10,
+            help="Number of child rows generated per parent row.",
+        )
+        parser.add_argument(
+            "--sample",
+            type=int,
+            default=1000,
+            help="Number of parents joined by the indexed join.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed runs of every join.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        if connection.vendor != "postgresql":
+            raise CommandError("UUID keys can only be benchmarked on PostgreSQL.")
+
+        with connection.cursor() as cursor:
+            self.report_tables(cursor)
+
+            with transaction.atomic():
+                self.create_tables(cursor, kwargs["parents"], kwargs["children"])
+
+                self.stdout.write(
+                    f"\n{'key type':<10}{'pk index':>12}{'fk index':>12}"
+                    f"{'full join ms':>14}{'indexed join ms':>17}"
+                )
+                for name in KEY_TYPES:
+                    self.report_key_type(
+                        cursor, name, kwargs["sample"], kwargs["repeat"]
+                    )
+
+                transaction.set_rollback(True)
+
+    def report_tables(self, cursor):
+        """
+        Write the key type and the index sizes of the models tables.
+        """
+
+        cursor.execute(
+            """
+            SELECT c.relname, a.data_type,
+                pg_size_pretty(pg_indexes_size(c.oid)), pg_indexes_size(c.oid)
+            FROM pg_class c
+            JOIN information_schema.columns a
+                ON a.table_name = c.relname AND a.column_name = 'id'
+                AND a.table_schema = current_schema()
+            WHERE c.relkind = 'r' AND c.relname ~ %s
+            ORDER BY pg_indexes_size(c.oid) DESC
+            """,
+            [f"^({'|'.join(UUID_KEY_APPS)})_"],
+        )
+        rows = cursor.fetchall()
+
+        self.stdout.write(f"{'table':<50}{'id type':>20}{'indexes':>12}")
+        for table, data_type, size, _ in rows:
+            self.stdout.write(f"{table:<50}{data_type:>20}{size:>12}")
+        self.stdout.write(
+            f"{'total':<50}{'':>20}{self.format_size(sum(row[3] for row in rows)):>12}"
+        )
+
+    def create_tables(self, cursor, parents, children):
+        """
+        Create and analyze the parent and child tables of every key type.
+        """
+
+        cursor.execute(
+            "CREATE TEMPORARY TABLE benchmark_keys ON COMMIT DROP AS "
+            "SELECT gen_random_uuid() AS id FROM generate_series(1, %s)",
+            [parents],
+        )
+        for name, column_type in KEY_TYPES.items():
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE benchmark_{name}_parent "
+                f"(id {column_type} PRIMARY KEY) ON COMMIT DROP"
+            )
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE benchmark_{name}_child "
+                f"(id {column_type} PRIMARY KEY, parent_id {column_type} NOT NULL "
+                f"REFERENCES benchmark_{name}_parent (id)) ON COMMIT DROP"
+            )
+            cursor.execute(
+                f"INSERT INTO benchmark_{name}_parent "
+                f"SELECT id::{column_type} FROM benchmark_keys"
+            )
+            cursor.execute(
+                f"INSERT INTO benchmark_{name}_child "
+                f"SELECT gen_random_uuid()::{column_type}, id::{column_type} "
+                f"FROM benchmark_keys, generate_series(1, %s)",
+                [children],
+            )
+            cursor.execute(
+                f"CREATE INDEX benchmark_{name}_child_parent "
+                f"ON benchmark_{name}_child (parent_id)"
+            )
+            cursor.execute(f"ANALYZE benchmark_{name}_parent")
+            cursor.execute(f"ANALYZE benchmark_{name}_child")
+
+    def report_key_type(self, cursor, name, sample, repeat):
+        """
+        Write the index sizes and the join latencies of a key type.
+        """
+
+        parent, child = f"benchmark_{name}_parent", f"benchmark_{name}_child"
+
+        cursor.execute(
+            "SELECT pg_relation_size(%s), pg_relation_size(%s)",
+            [f"{parent}_pkey", f"{child}_parent"],
+        )
+        pk_size, fk_size = cursor.fetchone()
+
+        full_join = self.time_query(
+            cursor,
+            f"SELECT count(*) FROM {parent} p JOIN {child} c ON c.parent_id = p.id",
+            [],
+            repeat,
+        )
+        cursor.execute(f"SELECT id FROM {parent} ORDER BY random() LIMIT %s", [sample])
+        ids = [row[0] for row in cursor.fetchall()]
+        indexed_join = self.time_query(
+            cursor,
+            f"SELECT count(*) FROM {parent} p JOIN {child} c ON c.parent_id = p.id "
+            f"WHERE p.id = ANY(%s::{KEY_TYPES[name]}[])",
+            [ids],
+            repeat,
+        )
+
+        self.stdout.write(
+            f"{name:<10}{self.format_size(pk_size):>12}{self.format_size(fk_size):>12}"
+            f"{full_join * 1000:>14.1f}{indexed_join * 1000:>17.2f}"
+        )
+
+    def time_query(self, cursor, sql, params, repeat):
+        """
+        Return the median time in seconds of `repeat` runs of a query.
+        """
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            cursor.execute(sql, params)
+            cursor.fetchall()
+            timings.append(time.perf_counter() - start)
+
+        return statistics.median(timings)
+
+    def format_size(self, size):
+        return f"{size / 1024 / 1024:.1f} MB"
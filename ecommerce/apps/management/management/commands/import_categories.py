@@ -0,0 +1,71 @@
+import os
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from ecommerce.apps.inventory.category_import import (
+    import_categories,
+    read_category_rows,
+)
+
+
+class Command(BaseCommand):
+    """
+    Import a category tree from a CSV or JSON file, creating or moving the categories.
+
+    Every category references its parent by id or by slug, within the file or among
+    the existing categories. The categories are written in bulk and the tree is rebuilt
+    once, see `ecommerce.apps.inventory.category_import.import_categories`.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Bulk import a category tree from a CSV or JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="Path of the CSV or JSON file, or a Django fixture of categories.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "json"],
+            default=None,
+            help="File format, from the file extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of categories per INSERT or UPDATE.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        path = kwargs["path"]
+        format = kwargs["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if format not in ("csv", "json"):
+            raise CommandError("The file format must be csv or json.")
+
+        start = time.perf_counter()
+        try:
+            with open(path, newline="", encoding="utf-8") as file:
+                rows = read_category_rows(file, format)
+            counts = import_categories(rows, batch_size=kwargs["batch_size"])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"The categories could not be read: {e}")
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{counts['created']} categories created, {counts['updated']} updated "
+                f"in {time.perf_counter() - start:.2f}s."
+            )
+        )
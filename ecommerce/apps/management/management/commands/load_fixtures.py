@@ -1,3 +1,6 @@
+import os
+
+from django.apps import apps
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import IntegrityError
@@ -29,7 +32,8 @@ class Command(BaseCommand):
             self.load_fixture("db_brand_fixture.json")
             self.load_fixture("db_product_attribute_fixture.json")
             self.load_fixture("db_product_attribute_value_fixture.json")
-            self.load_fixture("db_category_fixture.json")
+            # Imported in bulk, the fixture tree fields are not a valid nested set
+            self.import_categories("db_category_fixture.json")
 
             # Load product-related fixtures
             self.load_fixture("db_product_fixture.json")
@@ -64,3 +68,21 @@ class Command(BaseCommand):
             )
         except Exception as e:
             self.stderr.write(self.style.ERROR(f"Error loading {fixture_name}: {e}"))
+
+    def import_categories(self, fixture_name):
+        """
+        Import a category fixture of the inventory app with a single tree rebuild.
+
+        Args:
+            fixture_name (str): The name of the fixture file to import.
+        """
+        path = os.path.join(
+            apps.get_app_config("inventory").path, "fixtures", fixture_name
+        )
+        try:
+            call_command("import_categories", path)
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully imported {fixture_name}.")
+            )
+        except Exception as e:
+            self.stderr.write(self.style.ERROR(f"Error importing {fixture_name}: {e}"))
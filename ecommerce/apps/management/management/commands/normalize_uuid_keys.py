@@ -0,0 +1,132 @@
+import uuid
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+
+# The text forms the PostgreSQL uuid type accepts, up to braces
+UUID_PATTERN = "^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$"
+
+UUID_KEY_APPS = ("dashboard", "inventory", "promotion")
+
+
+class Command(BaseCommand):
+    """
+    Replace the primary keys which are not UUIDs, before their columns become UUIDs.
+
+    The `id` columns used to be varchar columns. The migrations generated for the
+    UUIDField primary keys convert them with `ALTER COLUMN ... TYPE uuid USING id::uuid`,
+    along with every foreign key and many-to-many column pointing to them, and the cast
+    fails on any value which is not a UUID. Run this command before `migrate`: each of
+    those values is replaced by a UUID derived from the table and the old value, in the
+    primary key and in every column referencing it, in a single transaction.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Replace the non UUID primary keys before migrating the id columns to UUIDs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the keys to replace without saving the changes.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        if connection.vendor != "postgresql":
+            raise CommandError("UUID keys can only be normalized on PostgreSQL.")
+
+        replaced = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            # The foreign keys are only checked once every column is updated
+            cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+
+            for model in self.get_models():
+                table, column = model._meta.db_table, model._meta.pk.column
+                if self.is_uuid_column(cursor, table, column):
+                    continue
+
+                cursor.execute(
+                    f"SELECT {self.quote(column)} FROM {self.quote(table)} "
+                    f"WHERE {self.quote(column)} !~* %s",
+                    [UUID_PATTERN],
+                )
+                old_ids = [row[0] for row in cursor.fetchall()]
+                columns = [(table, column), *self.get_references(cursor, model)]
+
+                for old_id in old_ids:
+                    new_id = str(uuid.uuid5(uuid.NAMESPACE_OID, f"{table}:{old_id}"))
+                    for reference_table, reference_column in columns:
+                        cursor.execute(
+                            f"UPDATE {self.quote(reference_table)} "
+                            f"SET {self.quote(reference_column)} = %s "
+                            f"WHERE {self.quote(reference_column)} = %s",
+                            [new_id, old_id],
+                        )
+
+                self.stdout.write(
+                    f"{table}: {len(old_ids)} keys replaced in {len(columns)} columns"
+                )
+                replaced += len(old_ids)
+
+            if kwargs["dry_run"]:
+                transaction.set_rollback(True)
+
+        action = "to replace" if kwargs["dry_run"] else "replaced"
+        self.stdout.write(self.style.SUCCESS(f"{replaced} keys {action}."))
+
+    def get_models(self):
+        """
+        Return the models with a UUIDField primary key.
+        """
+
+        return [
+            model
+            for model in apps.get_models()
+            if model._meta.app_label in UUID_KEY_APPS
+            and isinstance(model._meta.pk, models.UUIDField)
+        ]
+
+    def get_references(self, cursor, model):
+        """
+        Return the varchar (table, column) pairs of the foreign keys to a model.
+
+        The many-to-many through tables are included, as auto created models.
+        """
+
+        references = []
+        for related_model in apps.get_models(include_auto_created=True):
+            for field in related_model._meta.concrete_fields:
+                if (
+                    field.many_to_one or field.one_to_one
+                ) and field.related_model is model:
+                    table = related_model._meta.db_table
+                    if not self.is_uuid_column(cursor, table, field.column):
+                        references.append((table, field.column))
+
+        return references
+
+    def is_uuid_column(self, cursor, table, column):
+        """
+        Return whether a column already has the uuid type.
+        """
+
+        cursor.execute(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = %s "
+            "AND column_name = %s",
+            [table, column],
+        )
+        row = cursor.fetchone()
+
+        return row is not None and row[0] == "uuid"
+
+    def quote(self, name):
+        return connection.ops.quote_name(name)
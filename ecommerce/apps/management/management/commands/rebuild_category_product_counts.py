@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ecommerce.apps.inventory.categories import rebuild_category_product_counts
+from ecommerce.apps.inventory.models import Category
+
+
+class Command(BaseCommand):
+    """
+    Recompute the direct and subtree product counts of the categories.
+
+    The counts are kept up to date by signals on the product categories and on the
+    product `is_active` changes. Run this command after bulk changes, which send no
+    signals, such as fixtures loaded with `bulk_create` or `QuerySet.update` calls.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = "Recompute the product counts of every category, or of some trees."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tree",
+            type=int,
+            action="append",
+            dest="tree_ids",
+            help="Tree id of the categories to recompute, repeatable, all trees by default.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        categories = None
+        if kwargs["tree_ids"]:
+            categories = Category.objects.filter(tree_id__in=kwargs["tree_ids"])
+
+        with transaction.atomic():
+            updated = rebuild_category_product_counts(categories)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated} category product counts recomputed.")
+        )
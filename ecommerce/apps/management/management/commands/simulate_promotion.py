@@ -0,0 +1,134 @@
+import csv
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ecommerce.apps.inventory.models import ProductInventory
+from ecommerce.apps.promotion.simulation import (
+    get_projected_prices,
+    is_simulation_available,
+    load_simulation_arrays,
+    parse_reductions,
+    simulate_promotion_prices,
+    to_decimal,
+)
+
+
+class Command(BaseCommand):
+    """
+    Simulate promotion reductions on a set of product inventories, without saving prices.
+
+    The candidate product inventories are the products on a promotion, or the ones
+    matching a brand and product type, all of them by default. Their prices and units
+    sold are loaded once and every reduction is evaluated on the whole set with NumPy.
+
+    Attributes:
+        handle(*args, **kwargs): The main method of the command. It is called when the command is run.
+    """
+
+    help = (
+        "Project promotion prices, retail discount and revenue for several reductions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reductions",
+            required=True,
+            help="Comma separated reduction percentages to simulate.",
+        )
+        parser.add_argument(
+            "--promotion",
+            help="Simulate the products on this promotion ID.",
+        )
+        parser.add_argument(
+            "--brand",
+            help="Simulate the products of this brand ID.",
+        )
+        parser.add_argument(
+            "--product-type",
+            help="Simulate the products of this product type ID.",
+        )
+        parser.add_argument(
+            "--prices",
+            help="Write the projected price of every product and reduction to this CSV file.",
+        )
+
+    def handle(self, *args, **kwargs):
+        """
+        The handle method is the main method of the command.
+        It is called when the command is run.
+        """
+
+        if not is_simulation_available():
+            raise CommandError("Promotion simulation requires NumPy.")
+
+        reductions = parse_reductions(kwargs["reductions"], max_scenarios=1000)
+        if reductions is None:
+            raise CommandError("Reductions must be percentages between 0 and 100.")
+
+        queryset = ProductInventory.objects.all()
+        for option, lookup in (
+            ("promotion", "products_on_promotion__id"),
+            ("brand", "brand__id"),
+            ("product_type", "product_type__id"),
+        ):
+            if not kwargs[option]:
+                continue
+
+            try:
+                object_id = uuid.UUID(kwargs[option])
+            except ValueError:
+                raise CommandError(f"The {option} ID must be a UUID.")
+
+            queryset = queryset.filter(**{lookup: object_id})
+
+        start = time.perf_counter()
+        arrays = load_simulation_arrays(queryset)
+        loaded = time.perf_counter()
+        scenarios = simulate_promotion_prices(arrays, reductions)
+        simulated = time.perf_counter()
+
+        self.stdout.write(
+            f"{len(arrays['id'])} products loaded in {loaded - start:.2f}s, "
+            f"{len(reductions)} reductions simulated in {simulated - loaded:.2f}s"
+        )
+        self.stdout.write(
+            f"{'reduction':>10}{'min price':>12}{'max price':>12}"
+            f"{'retail discount':>18}{'%':>8}{'revenue delta':>16}"
+        )
+        for scenario in scenarios:
+            row = {
+                name: "-" if value is None else str(value)
+                for name, value in scenario.items()
+            }
+            self.stdout.write(
+                f"{row['promotion_reduction']:>10}{row['min_price']:>12}"
+                f"{row['max_price']:>12}{row['discount_from_retail']:>18}"
+                f"{row['discount_from_retail_percent']:>8}{row['revenue_delta']:>16}"
+            )
+
+        if kwargs["prices"]:
+            self.write_prices(kwargs["prices"], arrays, reductions)
+
+    def write_prices(self, path, arrays, reductions):
+        """
+        Write one CSV row per product inventory, with its projected price per reduction.
+        """
+
+        prices = [
+            get_projected_prices(arrays["store_price"], reduction)
+            for reduction in reductions
+        ]
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "store_price", *reductions])
+            for index, product_inventory_id in enumerate(arrays["id"]):
+                writer.writerow(
+                    [
+                        product_inventory_id,
+                        to_decimal(arrays["store_price"][index]),
+                        *[to_decimal(column[index]) for column in prices],
+                    ]
+                )
@@ -82,10 +82,10 @@ class PromotionAdmin(admin.ModelAdmin):
     readonly_fields = ("id",)
     inlines = [ProductsOnPromotionInline]
 
-    def save_model(self, request, obj, form, change) -> None:
+    def save_related(self, request, form, formsets, change) -> None:
         """
-        The save_model method allows us to override the default behavior of the save_model method.
+        Recompute the promotion prices once the products on promotion inline is saved.
         """
-        super().save_model(request, obj, form, change)
-        promotion_prices(obj.id)
+        super().save_related(request, form, formsets, change)
+        promotion_prices(form.instance.id)
         promotion_management.delay()
@@ -9,3 +9,9 @@ class PromotionConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ecommerce.apps.promotion"
+
+    def ready(self):
+        """
+        Connect the promotion price change tracking signals.
+        """
+        from . import signals
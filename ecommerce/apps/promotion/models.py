@@ -13,19 +13,17 @@ class PromotionType(models.Model):
     It represents a type of promotion in the system.
 
     Attributes:
-        id (CharField): The primary key for the PromotionType model. It's a CharField that gets its default value
-                        from the uuid.uuid4 function and is not editable. It has a maximum length of 256 characters.
+        id (UUIDField): The primary key for the PromotionType model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the promotion type name. It is required and has a maximum length of 100 characters.
                           The verbose name is "Promotions Type Name" and the help text is "format: required, max length 100 characters".
                           It is unique across the model.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=100,
@@ -51,8 +49,8 @@ class Coupon(models.Model):
     It represents a coupon in the system.
 
     Attributes:
-        id (CharField): The primary key for the Coupon model. It's a CharField that gets its default value
-                        from the uuid.uuid4 function and is not editable. It has a maximum length of 256 characters.
+        id (UUIDField): The primary key for the Coupon model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the coupon name. It is required and has a maximum length of 100 characters.
                           The verbose name is "Coupon Name" and the help text is "format: required, max length 100 characters".
         code (CharField): A CharField that stores the coupon code. It is required, unique, and has a maximum length of 20 characters.
@@ -61,12 +59,10 @@ class Coupon(models.Model):
                                  The verbose name is "Coupon Description" and the help text is "format: required, max length 500 characters".
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=100,
@@ -109,8 +105,8 @@ class Promotion(models.Model):
     It represents a promotion in the system.
 
     Attributes:
-        id (CharField): The primary key for the Promotion model. It's a CharField that gets its default value
-                        from the uuid.uuid4 function and is not editable. It has a maximum length of 256 characters.
+        id (UUIDField): The primary key for the Promotion model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
         name (CharField): A CharField that stores the promotion name. It is required and has a maximum length of 100 characters.
                           The verbose name is "Promotion Name" and the help text is "format: required, max length 100 characters".
         description (TextField): A TextField that stores the promotion description. It is required and has a maximum length of 500 characters.
@@ -137,12 +133,10 @@ class Promotion(models.Model):
                and that the promotion reduction is between 0 and 100.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     name = models.CharField(
         max_length=100,
@@ -243,6 +237,19 @@ class Promotion(models.Model):
         verbose_name = "Promotion"
         verbose_name_plural = "Promotions"
         ordering = ["-promotion_start", "-promotion_end"]
+        indexes = [
+            # The scheduled promotions transitioned by `promotion_management`
+            models.Index(
+                fields=["promotion_start"],
+                condition=models.Q(is_schedule=True),
+                name="promotion_schedule_start_idx",
+            ),
+            models.Index(
+                fields=["promotion_end"],
+                condition=models.Q(is_schedule=True),
+                name="promotion_schedule_end_idx",
+            ),
+        ]
 
 
 class ProductsOnPromotion(models.Model):
@@ -250,8 +257,8 @@ class ProductsOnPromotion(models.Model):
     This class represents the relationship between the Promotion and ProductInventory models.
 
     Attributes:
-        id (CharField): The primary key for the ProductsOnPromotion model. It's a CharField that gets its default value
-                        from the uuid.uuid4 function and is not editable. It has a maximum length of 256 characters.
+        id (UUIDField): The primary key for the ProductsOnPromotion model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
         promotion (ForeignKey): A ForeignKey that links to the Promotion model. It is required.
                                 The verbose name is "Promotion" and the help text is "format: required, foreign key".
         product_inventory (ForeignKey): A ForeignKey that links to the ProductInventory model. It is required.
@@ -259,14 +266,15 @@ class ProductsOnPromotion(models.Model):
         promotion_price (DecimalField): A DecimalField that stores the promotion price. It is required and its default value is 0.
                                         The verbose name is "Promotion Price" and the help text is "format: required, decimal".
         price_override (BooleanField): A BooleanField that indicates whether the price is overridden. It is required and its default value is False.
+        price_stale (BooleanField): A BooleanField that indicates whether the promotion price waits for a recomputation.
+                                    It is set when the store price or the promotion reduction changes, and its default value is False.
+        created_at (DateTimeField): A DateTimeField that stores the date and time the product was added to the promotion.
     """
 
-    id = models.CharField(
+    id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
         editable=False,
-        max_length=256,
-        validators=[MaxValueValidator(256)],
     )
     promotion = models.ForeignKey(
         Promotion,
@@ -306,3 +314,205 @@ class ProductsOnPromotion(models.Model):
         unique=False,
         default=False,
     )
+    price_stale = models.BooleanField(
+        verbose_name="Price Stale",
+        help_text=_("format: required, boolean"),
+        null=False,
+        blank=False,
+        unique=False,
+        default=False,
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        editable=False,
+        verbose_name="Date Added To Promotion",
+        help_text=_("format: Y-m-d H:M:S"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["promotion", "product_inventory"],
+                name="products_on_promotion_unique",
+            ),
+        ]
+        indexes = [
+            # The stale prices recomputed by `stale_promotion_prices`
+            models.Index(
+                fields=["promotion"],
+                condition=models.Q(price_stale=True),
+                name="promotion_products_stale_idx",
+            ),
+        ]
+
+
+class EffectivePrice(models.Model):
+    """
+    This class represents the price a ProductInventory currently sells at, a read model
+    maintained from the active promotions by `ecommerce.apps.promotion.tasks.refresh_effective_prices`.
+
+    Attributes:
+        id (UUIDField): The primary key for the EffectivePrice model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
+        product_inventory (OneToOneField): A OneToOneField that links to the ProductInventory model. It is required.
+                                           The verbose name is "Product Inventory" and the help text is "format: required, one to one".
+        promotion (ForeignKey): A ForeignKey that links to the active Promotion with the lowest price for the product inventory.
+                                The verbose name is "Promotion" and the help text is "format: required, foreign key".
+        promotion_price (DecimalField): A DecimalField that stores the promotion price the product inventory sells at.
+                                        The verbose name is "Promotion Price" and the help text is "format: required, decimal".
+        valid_from (DateField): A DateField that stores the start date of the promotion. It can be null.
+                                The verbose name is "Valid From" and the help text is "format: date".
+        valid_to (DateField): A DateField that stores the end date of the promotion. It can be null.
+                              The verbose name is "Valid To" and the help text is "format: date".
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    product_inventory = models.OneToOneField(
+        ProductInventory,
+        related_name="effective_price",
+        verbose_name="Product Inventory",
+        on_delete=models.CASCADE,
+        help_text=_("format: required, one to one"),
+        null=False,
+        blank=False,
+    )
+    promotion = models.ForeignKey(
+        Promotion,
+        related_name="effective_prices",
+        verbose_name="Promotion",
+        on_delete=models.CASCADE,
+        help_text=_("format: required, foreign key"),
+        null=False,
+        blank=False,
+        unique=False,
+    )
+    promotion_price = models.DecimalField(
+        verbose_name="Promotion Price",
+        help_text=_("format: required, decimal"),
+        max_digits=10,
+        decimal_places=2,
+        null=False,
+        blank=False,
+        unique=False,
+    )
+    valid_from = models.DateField(
+        verbose_name="Valid From",
+        help_text=_("format: date"),
+        null=True,
+        blank=True,
+        unique=False,
+    )
+    valid_to = models.DateField(
+        verbose_name="Valid To",
+        help_text=_("format: date"),
+        null=True,
+        blank=True,
+        unique=False,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Date Effective Price Updated",
+        help_text=_("format: Y-m-d H:M:S"),
+    )
+
+    class Meta:
+        verbose_name = "Effective Price"
+        verbose_name_plural = "Effective Prices"
+
+
+class PromotionPricesRun(models.Model):
+    """
+    This class represents a run of `ecommerce.apps.promotion.tasks.promotion_prices_all`,
+    keeping its partitions and progress in the database so an interrupted run can restart.
+
+    Attributes:
+        id (UUIDField): The primary key for the PromotionPricesRun model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
+        created_at (DateTimeField): A DateTimeField that stores the date and time the run started.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        editable=False,
+        verbose_name="Date Run Started",
+        help_text=_("format: Y-m-d H:M:S"),
+    )
+
+    class Meta:
+        verbose_name = "Promotion Prices Run"
+        verbose_name_plural = "Promotion Prices Runs"
+
+
+class PromotionPricesPartition(models.Model):
+    """
+    This class represents an id range of ProductsOnPromotion rows checked by a
+    PromotionPricesRun, marked as committed in the transaction rewriting its prices.
+
+    Attributes:
+        id (UUIDField): The primary key for the PromotionPricesPartition model. It's a UUIDField that gets its default value
+                        from the uuid.uuid4 function and is not editable.
+        run (ForeignKey): A ForeignKey that links to the PromotionPricesRun model. It is required.
+        index (PositiveIntegerField): The position of the partition in the run.
+        lower (UUIDField): The first ProductsOnPromotion id of the partition.
+        upper (UUIDField): The first ProductsOnPromotion id of the next partition, null for the last partition.
+        updated (PositiveIntegerField): The number of prices the partition rewrote.
+        committed (BooleanField): A BooleanField that indicates whether the partition was checked and committed.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    run = models.ForeignKey(
+        PromotionPricesRun,
+        related_name="partitions",
+        verbose_name="Promotion Prices Run",
+        on_delete=models.CASCADE,
+        help_text=_("format: required, foreign key"),
+        null=False,
+        blank=False,
+    )
+    index = models.PositiveIntegerField(
+        verbose_name="Partition Index",
+        help_text=_("format: required, integer"),
+    )
+    lower = models.UUIDField(
+        verbose_name="Partition Lower Bound",
+        help_text=_("format: required, uuid"),
+    )
+    upper = models.UUIDField(
+        verbose_name="Partition Upper Bound",
+        help_text=_("format: uuid"),
+        null=True,
+        blank=True,
+    )
+    updated = models.PositiveIntegerField(
+        verbose_name="Updated Prices",
+        help_text=_("format: required, integer"),
+        default=0,
+    )
+    committed = models.BooleanField(
+        verbose_name="Partition Committed",
+        help_text=_("format: required, boolean"),
+        default=False,
+    )
+
+    class Meta:
+        verbose_name = "Promotion Prices Partition"
+        verbose_name_plural = "Promotion Prices Partitions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["run", "index"],
+                name="promotion_prices_partition_unique",
+            ),
+        ]
@@ -0,0 +1,120 @@
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from ecommerce.apps.inventory.models import ProductInventory
+from .models import Promotion, ProductsOnPromotion
+from .tasks import mark_promotion_prices_stale, refresh_effective_prices
+
+# Tracked fields, as {model: field}, the loaded value is kept on the instance
+TRACKED_FIELDS = {
+    ProductInventory: "store_price",
+    Promotion: "promotion_reduction",
+}
+
+
+def get_tracked_value(instance):
+    """
+    Return the tracked field value of an instance, None when the field is deferred.
+    """
+
+    return instance.__dict__.get(TRACKED_FIELDS[type(instance)])
+
+
+@receiver(post_init, sender=ProductInventory)
+@receiver(post_init, sender=Promotion)
+def track_promotion_price_fields(sender, instance, **kwargs):
+    """
+    Keep the loaded store price or promotion reduction, to detect its changes on save.
+    """
+    instance._promotion_tracked_value = get_tracked_value(instance)
+
+
+@receiver(post_save, sender=ProductInventory)
+def store_price_changed(sender, instance, created, **kwargs):
+    """
+    Mark the promotion prices of a product stale when its store price changes.
+    """
+    value = get_tracked_value(instance)
+    if not created and value is not None and value != instance._promotion_tracked_value:
+        mark_promotion_prices_stale(
+            ProductsOnPromotion.objects.filter(product_inventory_id=instance.id)
+        )
+    instance._promotion_tracked_value = value
+
+
+@receiver(post_save, sender=Promotion)
+def promotion_reduction_changed(sender, instance, created, **kwargs):
+    """
+    Mark the prices of a promotion stale when its reduction changes.
+    """
+    value = get_tracked_value(instance)
+    if not created and value is not None and value != instance._promotion_tracked_value:
+        mark_promotion_prices_stale(
+            ProductsOnPromotion.objects.filter(promotion_id=instance.id)
+        )
+    instance._promotion_tracked_value = value
+
+
+@receiver(m2m_changed, sender=ProductsOnPromotion)
+def products_on_promotion_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Mark the prices of the products added to a promotion stale, and refresh the
+    effective prices of the products removed from a promotion.
+
+    The products cleared from a promotion are only known before the clear, so they
+    are kept on the instance until the rows are deleted.
+    """
+    if action == "pre_clear":
+        instance._effective_prices_cleared = (
+            [instance.id]
+            if reverse
+            else list(
+                ProductsOnPromotion.objects.filter(
+                    promotion_id=instance.id
+                ).values_list("product_inventory_id", flat=True)
+            )
+        )
+        return
+
+    if action == "post_clear":
+        product_inventory_ids = instance.__dict__.pop("_effective_prices_cleared", [])
+        if product_inventory_ids:
+            refresh_effective_prices(product_inventory_ids)
+        return
+
+    if action not in ("post_add", "post_remove") or not pk_set:
+        return
+
+    if action == "post_remove":
+        refresh_effective_prices([instance.id] if reverse else pk_set)
+        return
+
+    if reverse:
+        products_on_promotion = ProductsOnPromotion.objects.filter(
+            product_inventory_id=instance.id, promotion_id__in=pk_set
+        )
+    else:
+        products_on_promotion = ProductsOnPromotion.objects.filter(
+            promotion_id=instance.id, product_inventory_id__in=pk_set
+        )
+
+    mark_promotion_prices_stale(products_on_promotion)
+
+
+@receiver(post_save, sender=ProductsOnPromotion)
+def product_on_promotion_saved(sender, instance, created, **kwargs):
+    """
+    Refresh the effective price of a product saved on a promotion, such as by the
+    admin inline, and mark the price of a product added without override stale.
+    """
+    if created:
+        mark_promotion_prices_stale(ProductsOnPromotion.objects.filter(id=instance.id))
+    refresh_effective_prices([instance.product_inventory_id])
+
+
+@receiver(post_delete, sender=ProductsOnPromotion)
+def product_on_promotion_deleted(sender, instance, **kwargs):
+    """
+    Refresh the effective price of a product deleted from a promotion.
+    """
+    refresh_effective_prices([instance.product_inventory_id])
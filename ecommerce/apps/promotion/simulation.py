@@ -0,0 +1,142 @@
+from decimal import Decimal
+from fractions import Fraction
+
+from django.db.models import BigIntegerField, F
+from django.db.models.functions import Cast, Coalesce
+
+from .tasks import get_promotion_multiplier
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+
+def is_simulation_available():
+    """
+    Return whether NumPy, needed by the promotion simulator, is installed.
+    """
+
+    return np is not None
+
+
+def parse_reductions(value, max_scenarios):
+    """
+    Parse comma separated reduction percentages, between 0 and 100.
+
+    Returns None when the value is invalid or has more than `max_scenarios` reductions.
+    """
+
+    try:
+        reductions = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        return None
+
+    if not 0 < len(reductions) <= max_scenarios:
+        return None
+    if any(not 0 <= reduction <= 100 for reduction in reductions):
+        return None
+
+    return reductions
+
+
+def load_simulation_arrays(queryset):
+    """
+    Load the store prices, retail prices and units sold of a ProductInventory queryset.
+
+    Prices are loaded as integer cents, so the simulation rounds exactly, and a product
+    inventory without stock counts as no units sold.
+
+    Returns:
+        dict: The `id`, `store_price`, `retail_price` and `units_sold` arrays
+    """
+
+    rows = list(
+        queryset.order_by().values_list(
+            "id",
+            Cast(F("store_price") * 100, BigIntegerField()),
+            Cast(F("retail_price") * 100, BigIntegerField()),
+            Coalesce("stock_product_inventory__units_sold", 0),
+        )
+    )
+    ids, store_prices, retail_prices, units_sold = zip(*rows) if rows else ([],) * 4
+
+    return {
+        "id": list(ids),
+        "store_price": np.array(store_prices, dtype=np.int64),
+        "retail_price": np.array(retail_prices, dtype=np.int64),
+        "units_sold": np.array(units_sold, dtype=np.int64),
+    }
+
+
+def get_projected_prices(store_prices, reduction):
+    """
+    Return the promotion prices, in cents, of store prices in cents for a reduction.
+
+    The prices are `ceil(store_price * multiplier)` as computed by
+    `tasks.promotion_prices`, in integer arithmetic. The multiplier comes from the float
+    `(100 - reduction) / 100`, which misses the exact fraction by less than 1e-16, so
+    the two only round differently when the exact price is a whole number: it is then
+    rounded up once more when the float is above the fraction.
+    """
+
+    # The exact promotion prices are numerator / 10000 whole units
+    numerator = store_prices * (100 - reduction)
+    prices = -(-numerator // 10000) * 100
+
+    exact = (numerator % 10000 == 0) & (store_prices > 0)
+    if Fraction(get_promotion_multiplier(reduction)) > Fraction(100 - reduction, 100):
+        prices = prices + np.where(exact, 100, 0)
+
+    return prices
+
+
+def to_decimal(cents):
+    """
+    Return an amount in cents as a Decimal amount.
+    """
+
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def simulate_promotion_prices(arrays, reductions):
+    """
+    Evaluate promotion reduction scenarios on loaded simulation arrays.
+
+    Every scenario projects the promotion prices of all the products at once, and is
+    compared to the retail prices and to the store price revenue of the units sold.
+
+    Returns:
+        list: One dict of projected totals per reduction
+    """
+
+    store_prices = arrays["store_price"]
+    retail_prices = arrays["retail_price"]
+    units_sold = arrays["units_sold"]
+
+    revenue = int(np.dot(store_prices, units_sold))
+    retail_total = int(retail_prices.sum())
+
+    scenarios = []
+    for reduction in reductions:
+        prices = get_projected_prices(store_prices, reduction)
+        projected_revenue = int(np.dot(prices, units_sold))
+        discount = retail_total - int(prices.sum())
+
+        scenarios.append(
+            {
+                "promotion_reduction": reduction,
+                "products": len(prices),
+                "min_price": to_decimal(prices.min()) if len(prices) else None,
+                "max_price": to_decimal(prices.max()) if len(prices) else None,
+                "discount_from_retail": to_decimal(discount),
+                "discount_from_retail_percent": (
+                    round(discount * 100 / retail_total, 2) if retail_total else None
+                ),
+                "revenue": to_decimal(revenue),
+                "projected_revenue": to_decimal(projected_revenue),
+                "revenue_delta": to_decimal(projected_revenue - revenue),
+            }
+        )
+
+    return scenarios
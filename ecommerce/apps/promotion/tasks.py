@@ -1,117 +1,531 @@
 from decimal import Decimal
-from math import ceil
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import partial
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import (
+    Count,
+    DecimalField,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    Window,
+)
+from django.db.models.functions import Ceil, Coalesce, Mod, RowNumber
+from django.dispatch import Signal
+from django.utils import timezone
 
-
-from ecommerce.apps.promotion.models import Promotion, ProductsOnPromotion
+from ecommerce.apps.promotion.models import (
+    EffectivePrice,
+    Promotion,
+    PromotionPricesPartition,
+    PromotionPricesRun,
+    ProductsOnPromotion,
+)
 from ecommerce.apps.inventory.models import ProductInventory
 
+# Sent with the `promotion_ids` whose state `promotion_management` changed, since the
+# bulk updates send no model signals
+promotions_transitioned = Signal()
+
+# Cache key set while a `stale_promotion_prices` run is scheduled
+STALE_PROMOTION_PRICES_KEY = "promotion:stale_promotion_prices:scheduled"
+
+# Effective prices written per INSERT by `refresh_effective_prices`
+EFFECTIVE_PRICES_BATCH_SIZE = 1000
+
+# How long the partitions and progress of a `promotion_prices_all` run are kept
+PROMOTION_PRICES_RUN_RETENTION = timedelta(days=2)
+
+
+def get_promotion_multiplier(promotion_reduction):
+    """
+    Return the store price multiplier of a promotion reduction percentage.
+
+    The multiplier is the exact Decimal value of the float `(100 - reduction) / 100`,
+    as the promotion prices have always been computed with it, so a promotion price
+    is `ceil(store_price * multiplier)`.
+    """
+
+    return Decimal((100 - promotion_reduction) / 100)
+
+
+def get_promotion_price(promotion_reduction):
+    """
+    Return the expression of a ProductsOnPromotion promotion price, computed by the database.
+
+    The store price is read through a correlated subquery, as Django can not update
+    from a join.
+    """
+
+    return Subquery(
+        ProductInventory.objects.filter(id=OuterRef("product_inventory_id")).values(
+            price=Ceil(
+                F("store_price")
+                * Value(
+                    get_promotion_multiplier(promotion_reduction),
+                    output_field=DecimalField(),
+                )
+            )
+        )
+    )
+
+
+def mark_promotion_prices_stale(products_on_promotion):
+    """
+    Mark promotion prices for recomputation, and schedule the recomputation on commit.
+
+    Attributes:
+        products_on_promotion (QuerySet): The ProductsOnPromotion rows to recompute
+    """
+
+    if products_on_promotion.filter(price_override=False).update(price_stale=True):
+        transaction.on_commit(schedule_stale_promotion_prices, robust=True)
+
+
+def schedule_stale_promotion_prices():
+    """
+    Schedule the `stale_promotion_prices` task, at most once per debounce delay.
+
+    The changes made while a recomputation is scheduled are picked up by that run.
+    """
+
+    delay = settings.PROMOTION_PRICES_DEBOUNCE
+    if cache.add(STALE_PROMOTION_PRICES_KEY, True, delay):
+        stale_promotion_prices.apply_async(countdown=delay)
+
+
+def refresh_effective_prices(product_inventory_ids=None):
+    """
+    Refresh the effective prices of product inventories, all of them when no ids are given.
+
+    The effective price of a product inventory is its lowest price among the active
+    promotions, ties going to the promotion with the lowest id. Product inventories on
+    no active promotion have no effective price.
+
+    Attributes:
+        product_inventory_ids (QuerySet | list): The ids of the product inventories
+
+    Returns:
+        int: The number of refreshed effective prices
+    """
+
+    active = ProductsOnPromotion.objects.filter(promotion__is_active=True)
+    effective_prices = EffectivePrice.objects.all()
+    if product_inventory_ids is not None:
+        active = active.filter(product_inventory_id__in=product_inventory_ids)
+        effective_prices = effective_prices.filter(
+            product_inventory_id__in=product_inventory_ids
+        )
+
+    # The lowest active price of every product inventory
+    rows = (
+        active.order_by("product_inventory_id", "promotion_price", "promotion_id")
+        .distinct("product_inventory_id")
+        .values_list(
+            "product_inventory_id",
+            "promotion_id",
+            "promotion_price",
+            "promotion__promotion_start",
+            "promotion__promotion_end",
+        )
+    )
+
+    with transaction.atomic():
+        effective_prices.exclude(
+            product_inventory_id__in=active.values("product_inventory_id")
+        ).delete()
+
+        return len(
+            EffectivePrice.objects.bulk_create(
+                [
+                    EffectivePrice(
+                        product_inventory_id=product_inventory_id,
+                        promotion_id=promotion_id,
+                        promotion_price=promotion_price,
+                        valid_from=valid_from,
+                        valid_to=valid_to,
+                    )
+                    for product_inventory_id, promotion_id, promotion_price, valid_from, valid_to in rows
+                ],
+                batch_size=EFFECTIVE_PRICES_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["product_inventory"],
+                update_fields=[
+                    "promotion",
+                    "promotion_price",
+                    "valid_from",
+                    "valid_to",
+                    "updated_at",
+                ],
+            )
+        )
+
+
+def get_promotions_product_inventory_ids(promotion_ids):
+    """
+    Return the ids of the product inventories on the given promotions, as a subquery.
+    """
+
+    return ProductsOnPromotion.objects.filter(promotion_id__in=promotion_ids).values(
+        "product_inventory_id"
+    )
+
 
 @shared_task
 def promotion_prices(promotion_id):
     """
     This task calculates the new prices for the products in a promotion
 
+    The prices are recomputed by a single UPDATE, reading the store prices through a
+    correlated subquery, and the products with a `price_override` keep their price.
+    The effective prices of the products are refreshed along.
+
     Attributes:
-        promotion_reduction (int): The reduction percentage for the promotion
         promotion_id (str): The id of the promotion
+
+    Returns:
+        int: The number of updated products
     """
 
-    # Run the code and rollback the transaction if an error occurs
+    # Get the promotion reduction
+    promotion_reduction = Promotion.objects.values_list(
+        "promotion_reduction", flat=True
+    ).get(id=promotion_id)
+
     with transaction.atomic():
-        # Get the promotion
-        promotion = Promotion.objects.get(id=promotion_id)
+        updated = ProductsOnPromotion.objects.filter(
+            promotion_id=promotion_id, price_override=False
+        ).update(
+            promotion_price=get_promotion_price(promotion_reduction), price_stale=False
+        )
+        refresh_effective_prices(get_promotions_product_inventory_ids([promotion_id]))
 
-        # Get the products on the promotion
-        products_on_promotion = ProductsOnPromotion.objects.filter(
-            promotion__id=promotion_id
+    return updated
+
+
+@shared_task
+def stale_promotion_prices():
+    """
+    This task recomputes the promotion prices marked as stale
+
+    Prices are marked stale when a product store price or a promotion reduction
+    changes, see `ecommerce.apps.promotion.signals`, and are recomputed with one
+    UPDATE per affected promotion.
+
+    Returns:
+        int: The number of updated products
+    """
+
+    # Let the changes made from now on schedule a new run
+    cache.delete(STALE_PROMOTION_PRICES_KEY)
+
+    # Get the promotions with stale prices
+    promotions = (
+        Promotion.objects.filter(product_inventory_promotion__price_stale=True)
+        .values_list("id", "promotion_reduction")
+        .distinct()
+    )
+
+    updated = 0
+    promotion_ids = []
+    for promotion_id, promotion_reduction in promotions:
+        updated += ProductsOnPromotion.objects.filter(
+            promotion_id=promotion_id, price_stale=True, price_override=False
+        ).update(
+            promotion_price=get_promotion_price(promotion_reduction), price_stale=False
+        )
+        promotion_ids.append(promotion_id)
+
+    if promotion_ids:
+        refresh_effective_prices(get_promotions_product_inventory_ids(promotion_ids))
+
+    return updated
+
+
+def get_promotion_prices_bounds(size):
+    """
+    Return the first id of every `size` ProductsOnPromotion rows, in id order.
+
+    Partition `i` holds the rows from `bounds[i]` up to `bounds[i + 1]` excluded.
+    """
+
+    return list(
+        ProductsOnPromotion.objects.alias(
+            row=Window(RowNumber(), order_by=F("id").asc())
+        )
+        .alias(position=Mod(F("row") - 1, Value(size)))
+        .filter(position=0)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def create_promotion_prices_run(size, run_id=None):
+    """
+    Create a `promotion_prices_all` run, with a partition of every `size`
+    ProductsOnPromotion rows, and delete the runs past their retention.
+
+    Returns:
+        PromotionPricesRun: The created run
+    """
+
+    bounds = get_promotion_prices_bounds(size)
+
+    with transaction.atomic():
+        PromotionPricesRun.objects.filter(
+            created_at__lt=timezone.now() - PROMOTION_PRICES_RUN_RETENTION
+        ).delete()
+
+        run = PromotionPricesRun.objects.create(**({"id": run_id} if run_id else {}))
+        PromotionPricesPartition.objects.bulk_create(
+            [
+                PromotionPricesPartition(
+                    run=run,
+                    index=index,
+                    lower=lower,
+                    upper=bounds[index + 1] if index + 1 < len(bounds) else None,
+                )
+                for index, lower in enumerate(bounds)
+            ]
+        )
+
+    return run
+
+
+def get_promotion_prices_progress(run_id):
+    """
+    Return the progress of a `promotion_prices_all` run, None when the run is unknown.
+
+    Returns:
+        dict: The number of partitions, of committed partitions and of updated products
+    """
+
+    if not PromotionPricesRun.objects.filter(id=run_id).exists():
+        return None
+
+    return PromotionPricesPartition.objects.filter(run_id=run_id).aggregate(
+        partitions=Count("id"),
+        committed=Count("id", filter=Q(committed=True)),
+        updated=Coalesce(Sum("updated"), 0),
+    )
+
+
+def check_promotion_prices(products_on_promotion, promotion_reduction):
+    """
+    Rewrite the prices that drifted or are stale, of products on promotions with a reduction.
+
+    Returns:
+        int: The number of updated products
+    """
+
+    promotion_price = get_promotion_price(promotion_reduction)
+
+    return (
+        products_on_promotion.filter(promotion__promotion_reduction=promotion_reduction)
+        .filter(Q(price_stale=True) | ~Q(promotion_price=promotion_price))
+        .update(promotion_price=promotion_price, price_stale=False)
+    )
+
+
+@shared_task
+def promotion_prices_all(run_id=None):
+    """
+    This task checks the prices of all the products on promotion
+
+    Prices are maintained by `stale_promotion_prices` as products and promotions
+    change, so this nightly task only rewrites the prices that drifted, e.g. after a
+    queryset `update()` of store prices which sends no signals, and the stale prices
+    a failed recomputation left behind.
+
+    The rows are split in id ranges of `PROMOTION_PRICES_PARTITION_SIZE` rows, stored
+    as the partitions of a PromotionPricesRun and checked in parallel by a chord of
+    `promotion_prices_partition` tasks, each committing on its own. Passing the id of
+    an interrupted run restarts it, skipping the partitions it already committed.
+
+    Attributes:
+        run_id (str): The id of a run to restart
+
+    Returns:
+        str: The id of the run, see `get_promotion_prices_progress`
+    """
+
+    run = None
+    if run_id is not None:
+        run = PromotionPricesRun.objects.filter(id=run_id).first()
+
+    if run is None:
+        run = create_promotion_prices_run(
+            settings.PROMOTION_PRICES_PARTITION_SIZE, run_id
+        )
+
+    partitions = [
+        promotion_prices_partition.si(str(partition_id))
+        for partition_id in run.partitions.filter(committed=False)
+        .order_by("index")
+        .values_list("id", flat=True)
+    ]
+
+    if partitions:
+        chord(partitions)(promotion_prices_all_done.si(str(run.id)))
+
+    return str(run.id)
+
+
+@shared_task
+def promotion_prices_partition(partition_id):
+    """
+    This task checks the prices of the products on promotion in an id range
+
+    The partition row is locked and marked as committed in the transaction rewriting
+    the prices, so a partition is only ever applied once, even when run again.
+
+    Attributes:
+        partition_id (str): The id of the PromotionPricesPartition
+
+    Returns:
+        int: The number of updated products
+    """
+
+    with transaction.atomic():
+        partition = (
+            PromotionPricesPartition.objects.select_for_update()
+            .filter(id=partition_id, committed=False)
+            .first()
         )
+        if partition is None:
+            return 0
 
-        # Traverse over the products
-        for prod_promo in products_on_promotion:
-            # Get the product inventory
-            product_inventory = ProductInventory.objects.get(
-                id=prod_promo.product_inventory.id
+        products_on_promotion = ProductsOnPromotion.objects.filter(
+            id__gte=partition.lower, price_override=False
+        )
+        if partition.upper is not None:
+            products_on_promotion = products_on_promotion.filter(
+                id__lt=partition.upper
             )
 
-            # Calculate the new price
-            new_price = ceil(
-                product_inventory.store_price
-                * Decimal((100 - promotion.promotion_reduction) / 100)
+        # One UPDATE per reduction found in the partition
+        updated = sum(
+            check_promotion_prices(products_on_promotion, promotion_reduction)
+            for promotion_reduction in products_on_promotion.order_by()
+            .values_list("promotion__promotion_reduction", flat=True)
+            .distinct()
+        )
+        if updated:
+            refresh_effective_prices(
+                products_on_promotion.values("product_inventory_id")
             )
 
-            # Update the promotion price
-            prod_promo.promotion_price = new_price
-            prod_promo.save()
+        partition.updated = updated
+        partition.committed = True
+        partition.save(update_fields=["updated", "committed"])
+
+    return updated
 
 
 @shared_task
-def promotion_prices_all():
+def promotion_prices_all_done(run_id):
     """
-    This task calculates the new prices for the products in a promotion
+    This task reports the progress of a `promotion_prices_all` run, once it checked
+    every partition
+
+    The effective prices are refreshed by the partitions, along with the prices they
+    rewrite, in the same transaction.
+
+    Returns:
+        dict: The progress of the run
     """
 
-    # Run the code and rollback the transaction if an error occurs
-    with transaction.atomic():
-        # Get the products on the promotion
-        products_on_promotion = ProductsOnPromotion.objects.all()
+    return get_promotion_prices_progress(run_id)
 
-        # Traverse over the products
-        for prod_promo in products_on_promotion:
-            # Get the product inventory
-            product_inventory = prod_promo.product_inventory
 
-            # Get the promotion
-            promotion = prod_promo.promotion
+def transition_promotions(promotions, **values):
+    """
+    Update promotions with the given values, returning the ids of the updated promotions.
 
-            # Calculate the new price
-            new_price = ceil(
-                product_inventory.store_price
-                * Decimal((100 - promotion.promotion_reduction) / 100)
-            )
+    The promotions are locked while they are selected, so concurrent runs can not
+    both transition the same promotion.
+    """
 
-            # Update the promotion price
-            prod_promo.promotion_price = new_price
-            prod_promo.save()
+    ids = list(promotions.select_for_update().values_list("id", flat=True))
+    if ids:
+        Promotion.objects.filter(id__in=ids).update(**values)
+
+    return ids
+
+
+def get_scheduled_promotions(current_date):
+    """
+    Return the scheduled promotions to expire, activate and deactivate at a date.
+
+    The querysets are served by the partial `is_schedule` indexes of Promotion.
+    """
+
+    scheduled = Promotion.objects.filter(is_schedule=True)
+
+    return {
+        "expired": scheduled.filter(promotion_end__lt=current_date),
+        "activated": scheduled.filter(
+            is_active=False, promotion_start__lte=current_date
+        ).exclude(promotion_end__lt=current_date),
+        "deactivated": scheduled.filter(
+            is_active=True, promotion_start__gt=current_date
+        ),
+    }
 
 
 @shared_task
 def promotion_management():
     """
     This task manages the promotions that are scheduled and active
+
+    Scheduled promotions past their end date expire, the ones that started become
+    active and the ones that did not start yet are kept inactive. Each transition is a
+    bulk UPDATE of the promotions whose state actually changes, so the task is
+    idempotent, and the prices are only recomputed for the newly active promotions.
+    The effective prices of the products on transitioned promotions are refreshed.
+
+    Returns:
+        dict: The ids of the expired, activated and deactivated promotions
     """
 
+    # Get the current date
+    current_date = datetime.now().date()
+
+    # Get the scheduled promotions changing state
+    scheduled = get_scheduled_promotions(current_date)
+
     # Run the code and rollback the transaction if an error occurs
     with transaction.atomic():
-        # Get all the promotions that are scheduled
-        promotions = Promotion.objects.filter(is_schedule=True)
-
-        # Get the current date
-        current_date = datetime.now().date()
-
-        # Traverse over the promotions
-        for promo in promotions:
-            # If the promotion is scheduled
-            if promo.is_schedule:
-                # If the promotion end date is less than the current date
-                if promo.promotion_end < current_date:
-                    # Set the promotion to inactive and unscheduled
-                    promo.is_active = False
-                    promo.is_schedule = False
-                    promo.save()
-                else:
-                    if promo.promotion_start <= current_date:
-                        # Set the promotion to active
-                        promo.is_active = True
-                        promo.save()
-
-                        # Call the promotion prices task
-                        promotion_prices(promo.id)
-
-                    else:
-                        # Set the promotion to inactive
-                        promo.is_active = False
-                        promo.save()
+        expired = transition_promotions(
+            scheduled["expired"], is_active=False, is_schedule=False
+        )
+        activated = transition_promotions(scheduled["activated"], is_active=True)
+        deactivated = transition_promotions(scheduled["deactivated"], is_active=False)
+
+        refresh_effective_prices(
+            get_promotions_product_inventory_ids(expired + activated + deactivated)
+        )
+
+        # Recompute the prices of the newly active promotions once committed
+        for promotion_id in activated:
+            transaction.on_commit(
+                partial(promotion_prices.delay, promotion_id), robust=True
+            )
+
+        if expired or activated or deactivated:
+            transaction.on_commit(
+                partial(
+                    promotions_transitioned.send,
+                    sender=Promotion,
+                    promotion_ids=expired + activated + deactivated,
+                )
+            )
+
+    return {"expired": expired, "activated": activated, "deactivated": deactivated}
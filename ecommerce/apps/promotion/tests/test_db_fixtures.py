@@ -24,7 +24,7 @@ def test_promotion_type_dbfixture(db, db_fixture_setup, id, name):
 
     result = models.PromotionType.objects.get(id=id)
 
-    assert result.id == id
+    assert str(result.id) == id
     assert result.name == name
 
 
@@ -60,7 +60,7 @@ def test_coupon_dbfixture(db, db_fixture_setup, id, name, code):
 
     result = models.Coupon.objects.get(id=id)
 
-    assert result.id == id
+    assert str(result.id) == id
     assert result.name == name
     assert result.code == code
 
@@ -114,7 +114,7 @@ def test_promotion_dbfixture(
     result_promotion_start = result.promotion_start.strftime("%Y-%m-%d")
     result_promotion_end = result.promotion_end.strftime("%Y-%m-%d")
 
-    assert result.id == id
+    assert str(result.id) == id
     assert result.name == name
     assert result.promotion_reduction == promotion_reduction
     assert result_promotion_start == promotion_start
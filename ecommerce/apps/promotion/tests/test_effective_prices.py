@@ -0,0 +1,127 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.urls import reverse
+
+from ecommerce.apps.promotion.models import EffectivePrice, ProductsOnPromotion
+from ecommerce.apps.promotion.tasks import (
+    promotion_management,
+    refresh_effective_prices,
+)
+
+
+def test_effective_price_lowest_active_promotion(
+    db, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify the effective price is the lowest price of the active promotions.
+    """
+
+    inventory, other = product_inventory_factory.create_batch(2)
+    best = promotion_factory(
+        is_active=True,
+        promotion_start=date(2024, 1, 1),
+        promotion_end=date(2024, 1, 31),
+    )
+    best.products_on_promotion.add(inventory, through_defaults={"promotion_price": 70})
+    promotion_factory(is_active=True).products_on_promotion.add(
+        inventory, through_defaults={"promotion_price": 80}
+    )
+    promotion_factory(is_active=False).products_on_promotion.add(
+        inventory, other, through_defaults={"promotion_price": 50}
+    )
+
+    refresh_effective_prices([inventory.id, other.id])
+
+    effective_price = EffectivePrice.objects.get(product_inventory=inventory)
+    assert str(effective_price.promotion_id) == str(best.id)
+    assert effective_price.promotion_price == Decimal("70.00")
+    assert effective_price.valid_from == date(2024, 1, 1)
+    assert effective_price.valid_to == date(2024, 1, 31)
+    assert not EffectivePrice.objects.filter(product_inventory=other).exists()
+
+    # Removing the best promotion falls back to the next active one
+    best.products_on_promotion.remove(inventory)
+
+    assert EffectivePrice.objects.get(
+        product_inventory=inventory
+    ).promotion_price == Decimal("80.00")
+
+
+def test_effective_price_refreshed_on_expiry(
+    db, client, promotion_factory, product_inventory
+):
+    """
+    Test to verify an expiring promotion drops the effective price served by the API.
+    """
+
+    promotion = promotion_factory(
+        is_active=True,
+        is_schedule=True,
+        promotion_start=date.today() - timedelta(days=10),
+        promotion_end=date.today() + timedelta(days=1),
+    )
+    promotion.products_on_promotion.add(
+        product_inventory, through_defaults={"promotion_price": 60}
+    )
+    refresh_effective_prices([product_inventory.id])
+
+    url = reverse(
+        "restapi_product_inventory_retrieve", kwargs={"id": product_inventory.id}
+    )
+    assert client.get(url).json()["effective_price"] == {
+        "promotion": str(promotion.id),
+        "promotion_price": "60.00",
+        "valid_from": str(promotion.promotion_start),
+        "valid_to": str(promotion.promotion_end),
+    }
+
+    promotion.promotion_end = date.today() - timedelta(days=1)
+    promotion.save()
+    promotion_management()
+
+    assert client.get(url).json()["effective_price"] is None
+
+
+def test_effective_price_refreshed_on_row_changes(
+    db, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify rows saved and deleted directly, as by the admin inline, and cleared
+    promotions refresh the effective prices.
+    """
+
+    inventory, other = product_inventory_factory.create_batch(2)
+    promotion = promotion_factory(is_active=True, products_on_promotion=[])
+
+    row = ProductsOnPromotion.objects.create(
+        promotion=promotion,
+        product_inventory=inventory,
+        promotion_price=70,
+        price_override=True,
+    )
+
+    assert EffectivePrice.objects.get(
+        product_inventory=inventory
+    ).promotion_price == Decimal("70.00")
+
+    row.promotion_price = 60
+    row.save()
+
+    assert EffectivePrice.objects.get(
+        product_inventory=inventory
+    ).promotion_price == Decimal("60.00")
+
+    row.delete()
+
+    assert not EffectivePrice.objects.filter(product_inventory=inventory).exists()
+
+    promotion.products_on_promotion.add(
+        inventory, other, through_defaults={"promotion_price": 50}
+    )
+    refresh_effective_prices([inventory.id, other.id])
+    promotion.products_on_promotion.clear()
+
+    assert not EffectivePrice.objects.filter(
+        product_inventory__in=[inventory, other]
+    ).exists()
@@ -58,6 +58,57 @@ def test_celery_promotion_prices(
             )
 
 
+def test_celery_promotion_prices_price_override(
+    db, django_assert_num_queries, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify the promotion prices task keeps the overridden prices, in fixed queries.
+    """
+
+    promotion = promotion_factory(promotion_reduction=15)
+    product_invent_1, product_invent_2 = product_inventory_factory.create_batch(2)
+    promotion.products_on_promotion.add(product_invent_1)
+    promotion.products_on_promotion.add(
+        product_invent_2,
+        through_defaults={"promotion_price": 10, "price_override": True},
+    )
+
+    # The reduction, the UPDATE and the effective prices refresh, within savepoints
+    with django_assert_num_queries(8):
+        assert promotion_prices(promotion.id) == 1
+
+    assert ProductsOnPromotion.objects.get(
+        promotion=promotion, product_inventory=product_invent_1
+    ).promotion_price == ceil(product_invent_1.store_price * Decimal((100 - 15) / 100))
+    assert ProductsOnPromotion.objects.get(
+        promotion=promotion, product_inventory=product_invent_2
+    ).promotion_price == Decimal("10.00")
+
+
+@pytest.mark.parametrize("promotion_reduction", [1, 7, 10, 20, 33, 50, 70, 90, 99])
+def test_celery_promotion_prices_rounding(
+    db, promotion_factory, product_inventory_factory, promotion_reduction
+):
+    """
+    Test to verify the promotion prices task rounds like the Python `ceil` formula.
+    """
+
+    promotion = promotion_factory(promotion_reduction=promotion_reduction)
+    store_prices = ["0.01", "0.99", "1.00", "9.95", "10.00", "90.00", "4999.99"]
+    for store_price in store_prices:
+        promotion.products_on_promotion.add(
+            product_inventory_factory(store_price=Decimal(store_price))
+        )
+
+    promotion_prices(promotion.id)
+
+    for prod_promo in ProductsOnPromotion.objects.filter(promotion=promotion):
+        assert prod_promo.promotion_price == ceil(
+            prod_promo.product_inventory.store_price
+            * Decimal((100 - promotion_reduction) / 100)
+        )
+
+
 @pytest.mark.parametrize(
     "start, end, expected",
     [
@@ -87,3 +138,56 @@ def test_celery_promotion_management(db, promotion_factory, start, end, expected
 
     # Check if the promotion is active
     assert promo.is_active == expected
+
+
+def test_celery_promotion_management_transitions(
+    db, django_capture_on_commit_callbacks, promotion_factory
+):
+    """
+    Test to verify the promotion management only transitions and reprices changed promotions.
+    """
+
+    today = date.today()
+    expired = promotion_factory(
+        promotion_start=today - timedelta(days=10),
+        promotion_end=today - timedelta(days=1),
+        is_active=True,
+        is_schedule=True,
+    )
+    started = promotion_factory(
+        promotion_start=today,
+        promotion_end=today + timedelta(days=5),
+        is_schedule=True,
+    )
+    running = promotion_factory(
+        promotion_start=today - timedelta(days=1),
+        promotion_end=today + timedelta(days=5),
+        is_active=True,
+        is_schedule=True,
+    )
+    pending = promotion_factory(
+        promotion_start=today + timedelta(days=1),
+        promotion_end=today + timedelta(days=5),
+        is_active=True,
+        is_schedule=True,
+    )
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        changes = promotion_management()
+
+    assert expired.id in changes["expired"]
+    assert started.id in changes["activated"]
+    assert pending.id in changes["deactivated"]
+    assert str(running.id) not in sum(changes.values(), [])
+    # One price recomputation per activated promotion, and the transitions signal
+    assert len(callbacks) == len(changes["activated"]) + 1
+
+    expired.refresh_from_db()
+    assert not expired.is_active and not expired.is_schedule
+
+    # A second run has nothing left to transition
+    assert promotion_management() == {
+        "expired": [],
+        "activated": [],
+        "deactivated": [],
+    }
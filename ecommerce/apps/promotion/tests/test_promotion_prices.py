@@ -0,0 +1,154 @@
+import uuid
+from decimal import Decimal
+from math import ceil
+
+from ecommerce.apps.inventory.models import ProductInventory
+from ecommerce.apps.promotion.models import ProductsOnPromotion
+from ecommerce.apps.promotion.tasks import (
+    create_promotion_prices_run,
+    get_promotion_prices_bounds,
+    get_promotion_prices_progress,
+    promotion_prices_all,
+    promotion_prices_partition,
+    schedule_stale_promotion_prices,
+    stale_promotion_prices,
+)
+
+
+def get_prod_promo(promotion, product_inventory):
+    return ProductsOnPromotion.objects.get(
+        promotion=promotion, product_inventory=product_inventory
+    )
+
+
+def test_store_price_change_marks_prices_stale(
+    db,
+    django_capture_on_commit_callbacks,
+    promotion_factory,
+    product_inventory_factory,
+):
+    """
+    Test to verify a store price change marks only the prices of that product stale.
+    """
+
+    promotion = promotion_factory(promotion_reduction=20)
+    changed, unchanged = product_inventory_factory.create_batch(2)
+    promotion.products_on_promotion.add(changed, unchanged)
+    ProductsOnPromotion.objects.update(price_stale=False)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        unchanged.save()
+        changed.store_price = Decimal("50.00")
+        changed.save()
+
+    assert callbacks.count(schedule_stale_promotion_prices) == 1
+    assert get_prod_promo(promotion, changed).price_stale
+    assert not get_prod_promo(promotion, unchanged).price_stale
+
+    assert stale_promotion_prices() == 1
+    prod_promo = get_prod_promo(promotion, changed)
+    assert not prod_promo.price_stale
+    assert prod_promo.promotion_price == ceil(Decimal("50.00") * Decimal(80 / 100))
+
+
+def test_promotion_reduction_change_marks_prices_stale(
+    db, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify a promotion reduction change marks its prices stale, except overrides.
+    """
+
+    promotion = promotion_factory(promotion_reduction=20)
+    product_invent_1, product_invent_2 = product_inventory_factory.create_batch(2)
+    promotion.products_on_promotion.add(product_invent_1)
+    promotion.products_on_promotion.add(
+        product_invent_2,
+        through_defaults={"promotion_price": 10, "price_override": True},
+    )
+    stale_promotion_prices()
+
+    promotion.name = "Renamed promotion"
+    promotion.save()
+    assert not ProductsOnPromotion.objects.filter(price_stale=True).exists()
+
+    promotion.promotion_reduction = 50
+    promotion.save()
+    assert get_prod_promo(promotion, product_invent_1).price_stale
+    assert not get_prod_promo(promotion, product_invent_2).price_stale
+
+    stale_promotion_prices()
+
+    assert get_prod_promo(promotion, product_invent_1).promotion_price == ceil(
+        product_invent_1.store_price * Decimal(50 / 100)
+    )
+    assert get_prod_promo(promotion, product_invent_2).promotion_price == 10
+
+
+def test_promotion_prices_partition_fixes_drifted_prices(
+    db, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify a partition only rewrites the drifted prices and records its progress
+    in the database.
+    """
+
+    promotion = promotion_factory(promotion_reduction=10)
+    product_invent_1, product_invent_2 = product_inventory_factory.create_batch(2)
+    promotion.products_on_promotion.add(product_invent_1, product_invent_2)
+    stale_promotion_prices()
+
+    # A queryset update sends no signals
+    ProductInventory.objects.filter(id=product_invent_1.id).update(store_price=20)
+
+    # A single partition of every row
+    run = create_promotion_prices_run(ProductsOnPromotion.objects.count())
+    partition = run.partitions.get()
+
+    assert promotion_prices_partition(partition.id) == 1
+    assert get_prod_promo(promotion, product_invent_1).promotion_price == ceil(
+        Decimal(20) * Decimal(90 / 100)
+    )
+    assert get_promotion_prices_progress(run.id) == {
+        "partitions": 1,
+        "committed": 1,
+        "updated": 1,
+    }
+
+    # A committed partition is skipped when the run is restarted
+    ProductInventory.objects.filter(id=product_invent_2.id).update(store_price=20)
+    assert promotion_prices_partition(partition.id) == 0
+    assert promotion_prices_all(str(run.id)) == str(run.id)
+    assert get_promotion_prices_progress(run.id)["updated"] == 1
+    assert get_promotion_prices_progress(uuid.uuid4()) is None
+
+
+def test_promotion_prices_partitions(
+    db, settings, promotion_factory, product_inventory_factory
+):
+    """
+    Test to verify the partitions split the rows in id ranges of the partition size.
+    """
+
+    settings.PROMOTION_PRICES_PARTITION_SIZE = 2
+    promotion = promotion_factory(promotion_reduction=25)
+    promotion.products_on_promotion.add(*product_inventory_factory.create_batch(5))
+    ProductsOnPromotion.objects.exclude(promotion=promotion).delete()
+    ProductsOnPromotion.objects.update(promotion_price=0)
+
+    ids = sorted(ProductsOnPromotion.objects.values_list("id", flat=True))
+
+    assert get_promotion_prices_bounds(2) == [ids[0], ids[2], ids[4]]
+
+    run = create_promotion_prices_run(2)
+    partitions = run.partitions.order_by("index")
+
+    assert [(partition.lower, partition.upper) for partition in partitions] == [
+        (ids[0], ids[2]),
+        (ids[2], ids[4]),
+        (ids[4], None),
+    ]
+
+    updated = [promotion_prices_partition(partition.id) for partition in partitions]
+
+    assert updated == [2, 2, 1]
+    assert not ProductsOnPromotion.objects.filter(promotion_price=0).exists()
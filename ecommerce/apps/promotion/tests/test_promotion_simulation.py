@@ -0,0 +1,100 @@
+from decimal import Decimal
+from math import ceil
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+np = pytest.importorskip("numpy")
+
+from ecommerce.apps.promotion.simulation import (
+    get_projected_prices,
+    load_simulation_arrays,
+    simulate_promotion_prices,
+)
+from ecommerce.apps.inventory.models import ProductInventory
+
+
+def test_projected_prices_match_promotion_prices_rounding():
+    """
+    Test to verify the vectorized prices round like the `promotion_prices` task.
+    """
+
+    cents = np.arange(0, 1000000, 37, dtype=np.int64)
+
+    for reduction in range(0, 101, 3):
+        prices = get_projected_prices(cents, reduction)
+
+        assert [int(price) for price in prices] == [
+            ceil(Decimal(int(cent)).scaleb(-2) * Decimal((100 - reduction) / 100)) * 100
+            for cent in cents
+        ]
+
+
+def test_simulate_promotion_prices(
+    db, product_inventory_factory, stock_factory, promotion_factory
+):
+    """
+    Test to verify the scenarios project the retail discount and the revenue delta.
+    """
+
+    promotion = promotion_factory()
+    inventories = [
+        product_inventory_factory(retail_price=100, store_price=90),
+        product_inventory_factory(retail_price=50, store_price=40),
+    ]
+    stock_factory(product_inventory=inventories[0], units_sold=10)
+    promotion.products_on_promotion.add(*inventories)
+
+    arrays = load_simulation_arrays(
+        ProductInventory.objects.filter(products_on_promotion=promotion)
+    )
+    no_reduction, half = simulate_promotion_prices(arrays, [0, 50])
+
+    assert no_reduction["revenue_delta"] == Decimal("0.00")
+    assert no_reduction["discount_from_retail"] == Decimal("20.00")
+    assert half["min_price"] == Decimal("20.00")
+    assert half["max_price"] == Decimal("45.00")
+    assert half["discount_from_retail"] == Decimal("85.00")
+    assert half["revenue_delta"] == Decimal("-450.00")
+
+
+def test_simulate_endpoint(db, client, promotion_factory, product_inventory_factory):
+    """
+    Test to verify the simulation endpoint validates its parameters and writes nothing.
+    """
+
+    promotion = promotion_factory(promotion_reduction=10)
+    promotion.products_on_promotion.add(
+        product_inventory_factory(retail_price=100, store_price=90)
+    )
+    url = reverse("restapi_promotions_simulate", kwargs={"id": promotion.id})
+
+    response = client.get(url, {"reductions": "10,20"})
+
+    assert response.status_code == 200
+    assert [
+        (scenario["promotion_reduction"], scenario["min_price"])
+        for scenario in response.json()["scenarios"]
+    ] == [(10, "82.00"), (20, "73.00")]
+    assert promotion.product_inventory_promotion.get().promotion_price == 0
+
+    assert client.get(url, {"reductions": "10,200"}).status_code == 400
+    assert client.get(url).status_code == 400
+    assert (
+        client.get(
+            reverse("restapi_promotions_simulate", kwargs={"id": "missing"}),
+            {"reductions": "10"},
+        ).status_code
+        == 404
+    )
+
+
+@pytest.mark.parametrize("option", ["promotion", "brand", "product_type"])
+def test_simulate_command_invalid_id(db, option):
+    """
+    Test to verify the simulate command rejects an id which is not a UUID.
+    """
+
+    with pytest.raises(CommandError, match="must be a UUID"):
+        call_command("simulate_promotion", reductions="10", **{option: "notauuid"})
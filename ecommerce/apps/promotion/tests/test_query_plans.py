@@ -0,0 +1,44 @@
+import pytest
+
+from ecommerce.apps.promotion.models import ProductsOnPromotion
+from ecommerce.apps.promotion.tasks import get_scheduled_promotions
+
+pytestmark = pytest.mark.query_plan
+
+
+@pytest.mark.parametrize("transition", ["expired", "activated", "deactivated"])
+def test_scheduled_promotions_plan(
+    db, query_plan_catalogue, assert_index_plan, transition
+):
+    """
+    Test to verify the scheduled promotions transitions are selected from an index.
+    """
+
+    scheduled = get_scheduled_promotions(query_plan_catalogue["today"])
+
+    assert_index_plan(scheduled[transition])
+
+
+def test_products_on_promotion_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify a product on promotion is looked up by its unique index.
+    """
+
+    assert_index_plan(
+        ProductsOnPromotion.objects.filter(
+            promotion=query_plan_catalogue["promotion"],
+            product_inventory=query_plan_catalogue["product_inventory"],
+        )
+    )
+
+
+def test_stale_promotion_prices_plan(db, query_plan_catalogue, assert_index_plan):
+    """
+    Test to verify the stale promotion prices are found from the partial index.
+    """
+
+    assert_index_plan(
+        ProductsOnPromotion.objects.filter(price_stale=True)
+        .values_list("promotion", flat=True)
+        .distinct()
+    )
@@ -9,3 +9,9 @@ class RestapiConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "ecommerce.apps.restapi"
+
+    def ready(self):
+        """
+        Connect the response cache invalidation signals.
+        """
+        from . import signals
@@ -0,0 +1,297 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+
+from ecommerce.apps.inventory.categories import filter_category_products
+from ecommerce.apps.inventory.models import *
+from ecommerce.apps.promotion.models import *
+from .pagination import AsyncPageNumberPagination
+from .renderers import ORJSONRenderer
+from .serializers import *
+
+
+class AsyncReadOnlyView(View):
+    """
+    Base class of the async read-only endpoints.
+
+    The views are plain Django async views using the async ORM API, so under ASGI a request
+    waiting on the database does not hold a worker thread. Responses are rendered with the
+    REST API renderer and have the same payload as the matching `RestAPI*` viewset.
+    """
+
+    renderer = ORJSONRenderer()
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type=self.renderer.media_type,
+        )
+
+    def render_detail(self, detail, status_code):
+        return self.render({"detail": detail}, status_code=status_code)
+
+
+class AsyncListView(AsyncReadOnlyView):
+    """
+    Async list endpoint, page number paginated and rendered with a values plan.
+
+    Attributes:
+        queryset (QuerySet): The listed rows.
+        plan (ValuesPlan): The values plan rendering the rows.
+        not_found_detail (str): When set, an empty list is answered with this 404 detail.
+    """
+
+    queryset = None
+    plan = None
+    not_found_detail = None
+    pagination_class = AsyncPageNumberPagination
+
+    def get_queryset(self, request, **kwargs):
+        return self.queryset.all()
+
+    def get_plan(self, request):
+        return self.plan
+
+    async def get(self, request, **kwargs):
+        queryset = self.get_queryset(request, **kwargs)
+
+        if self.not_found_detail and not await queryset.aexists():
+            return self.render_detail(self.not_found_detail, status.HTTP_404_NOT_FOUND)
+
+        plan = self.get_plan(request)
+        paginator = self.pagination_class()
+
+        try:
+            rows = await paginator.apaginate_queryset(plan.values(queryset), request)
+        except NotFound as exc:
+            return self.render_detail(exc.detail, status.HTTP_404_NOT_FOUND)
+
+        return self.render(paginator.get_paginated_data(await plan.aserialize(rows)))
+
+
+class AsyncRetrieveView(AsyncReadOnlyView):
+    """
+    Async retrieve by `id` endpoint, rendered with a serializer.
+
+    The eager loading of `get_queryset` must load every relation the serializer reads,
+    since the serializer runs in the event loop where the ORM can not be called.
+
+    Attributes:
+        queryset (QuerySet): The retrieved rows.
+        serializer_class (Serializer): The serializer rendering the row.
+        not_found_detail (str): The 404 detail of a missing row.
+    """
+
+    queryset = None
+    serializer_class = None
+    not_found_detail = None
+
+    def get_queryset(self, request):
+        return self.queryset.all()
+
+    async def get_data(self, instance):
+        return self.serializer_class(instance).data
+
+    async def get(self, request, id):
+        try:
+            instance = await self.get_queryset(request).aget(id=id)
+        except ObjectDoesNotExist:
+            return self.render_detail(self.not_found_detail, status.HTTP_404_NOT_FOUND)
+
+        return self.render(await self.get_data(instance))
+
+
+class AsyncCategories(AsyncListView):
+    """
+    Async version of the `RestAPICategories` list action.
+    """
+
+    queryset = Category.objects.all()
+    not_found_detail = "Parent category not found."
+
+    def get_queryset(self, request, **kwargs):
+        return self.queryset.filter(parent__name=request.GET.get("parent_name"))
+
+    def get_plan(self, request):
+        if request.GET.get("parent_name") is None:
+            return PARENT_CATEGORY_PLAN
+
+        return CATEGORY_PLAN
+
+
+class AsyncCategoriesRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPICategories` retrieve action.
+    """
+
+    queryset = Category.objects.select_related("parent")
+    serializer_class = CategorySerializer
+    not_found_detail = "Category not found."
+
+
+class AsyncCategoriesProducts(AsyncListView):
+    """
+    Async version of the `RestAPICategoriesProducts` list action, the products of the
+    descendant categories included with `include_descendants`.
+    """
+
+    queryset = Product.objects.all()
+    plan = PRODUCT_LIST_PLAN
+    not_found_detail = "Category not found."
+
+    def get_queryset(self, request, id=None):
+        include_descendants = request.GET.get("include_descendants", "").lower() in (
+            "1",
+            "true",
+        )
+
+        return filter_category_products(self.queryset, id, include_descendants)
+
+
+class AsyncProductTypes(AsyncListView):
+    """
+    Async version of the `RestAPIProductTypes` list action.
+    """
+
+    queryset = ProductType.objects.all()
+    plan = PRODUCT_TYPE_PLAN
+
+
+class AsyncProductTypesRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPIProductTypes` retrieve action.
+    """
+
+    queryset = ProductType.objects.all()
+    serializer_class = ProductTypeSerializer
+    not_found_detail = "ProductType not found."
+
+
+class AsyncProductTypesProducts(AsyncListView):
+    """
+    Async version of the `RestAPIProductTypesProducts` list action.
+    """
+
+    queryset = ProductInventory.objects.all()
+    plan = PRODUCT_INVENTORY_PRODUCT_PLAN
+    not_found_detail = "Product Type not found."
+
+    def get_queryset(self, request, id=None):
+        return self.queryset.filter(product_type__id=id)
+
+
+class AsyncBrands(AsyncListView):
+    """
+    Async version of the `RestAPIBrands` list action.
+    """
+
+    queryset = Brand.objects.all()
+    plan = BRAND_PLAN
+
+
+class AsyncBrandsRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPIBrands` retrieve action.
+    """
+
+    queryset = Brand.objects.all()
+    serializer_class = BrandSerializer
+    not_found_detail = "Brand not found."
+
+
+class AsyncBrandsProducts(AsyncListView):
+    """
+    Async version of the `RestAPIBrandsProducts` list action.
+    """
+
+    queryset = ProductInventory.objects.all()
+    plan = PRODUCT_INVENTORY_PRODUCT_PLAN
+    not_found_detail = "Brand not found."
+
+    def get_queryset(self, request, id=None):
+        return self.queryset.filter(brand__id=id)
+
+
+class AsyncProducts(AsyncListView):
+    """
+    Async version of the `RestAPIProducts` list action.
+    """
+
+    queryset = Product.objects.all()
+    plan = PRODUCT_LIST_PLAN
+
+
+class AsyncProductsRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPIProducts` retrieve action.
+    """
+
+    queryset = Product.objects.all()
+    serializer_class = ProductRetrieveSerializer
+    not_found_detail = "Product not found."
+
+    def get_queryset(self, request):
+        return ProductRetrieveSerializer.setup_eager_loading(self.queryset)
+
+
+class AsyncProductInventory(AsyncListView):
+    """
+    Async version of the `RestAPIProductInventory` list action.
+    """
+
+    queryset = ProductInventory.objects.all()
+    plan = PRODUCT_INVENTORY_LIST_PLAN
+
+
+class AsyncProductInventoryRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPIProductInventory` retrieve action.
+    """
+
+    queryset = ProductInventory.objects.all()
+    serializer_class = ProductInventoryRetrieveSerializer
+    not_found_detail = "ProductInventory not found."
+
+    def get_queryset(self, request):
+        return ProductInventoryRetrieveSerializer.setup_eager_loading(self.queryset)
+
+
+class AsyncPromotions(AsyncListView):
+    """
+    Async version of the `RestAPIPromotions` list action.
+    """
+
+    queryset = Promotion.objects.all()
+    plan = PROMOTION_LIST_PLAN
+
+
+class AsyncPromotionsRetrieve(AsyncRetrieveView):
+    """
+    Async version of the `RestAPIPromotions` retrieve action.
+    """
+
+    queryset = Promotion.objects.select_related("promotion_type", "coupon")
+    serializer_class = PromotionRetrieveSerializer
+    not_found_detail = "Promotion not found."
+
+    async def get_data(self, instance):
+        # The serializer queries the products on promotion itself
+        serializer = self.serializer_class(instance)
+        return await sync_to_async(lambda: serializer.data)()
+
+
+class AsyncPromotionsProductInventories(AsyncListView):
+    """
+    Async version of the `RestAPIPromotionsProductInventories` list action.
+    """
+
+    queryset = ProductInventory.objects.all()
+    plan = PRODUCT_INVENTORY_LIST_PLAN
+    not_found_detail = "Promotion not found."
+
+    def get_queryset(self, request, id=None):
+        return self.queryset.filter(products_on_promotion__id=id)
@@ -0,0 +1,95 @@
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import urlencode
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def get_cache_version_key(namespace):
+    """
+    Return the cache key holding the current version of a response cache namespace.
+    """
+
+    return f"restapi:version:{namespace}"
+
+
+def get_cache_version(namespace):
+    """
+    Return the current version of a response cache namespace.
+    """
+
+    return cache.get_or_set(get_cache_version_key(namespace), 1, timeout=None)
+
+
+def get_cache_versions(namespaces):
+    """
+    Return the current versions of response cache namespaces, read in one round trip.
+    """
+
+    keys = [get_cache_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+
+    return [
+        versions[key] if key in versions else cache.get_or_set(key, 1, timeout=None)
+        for key in keys
+    ]
+
+
+def bump_cache_version(namespace):
+    """
+    Invalidate every cached response of a namespace by moving it to a new version.
+    """
+
+    try:
+        cache.incr(get_cache_version_key(namespace))
+    except ValueError:
+        cache.set(get_cache_version_key(namespace), 2, timeout=None)
+
+
+def get_response_cache_key(namespace, request):
+    """
+    Return the cache key of a response, built from the host, path and sorted query params.
+    """
+
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = hashlib.md5(
+        f"{request.get_host()}{request.path}?{query}".encode("utf-8")
+    ).hexdigest()
+
+    return f"restapi:response:{namespace}:{get_cache_version(namespace)}:{digest}"
+
+
+def cache_response(namespace):
+    """
+    Decorator that caches the successful responses of a viewset action.
+
+    Cached responses are invalidated by bumping the namespace version,
+    see `ecommerce.apps.restapi.signals`.
+
+    Args:
+        namespace (str): The namespace the cached responses belong to.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            key = get_response_cache_key(namespace, request)
+
+            data = cache.get(key)
+            if data is not None:
+                return Response(data, headers={"X-Cache": "HIT"})
+
+            response = func(self, request, *args, **kwargs)
+
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, settings.RESTAPI_RESPONSE_CACHE_TIMEOUT)
+                response["X-Cache"] = "MISS"
+
+            return response
+
+        return wrapper
+
+    return decorator
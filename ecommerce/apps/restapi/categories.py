@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from ecommerce.apps.inventory.categories import get_category_subtree
+from ecommerce.apps.inventory.models import Category
+from .cache import get_cache_version, get_cache_version_key
+from .renderers import ORJSONRenderer
+
+
+def get_category_tree_key(root_id):
+    """
+    Return the cache key of the rendered tree of a root category, or of every category.
+    """
+
+    return f"restapi:categories:tree:{root_id or 'all'}"
+
+
+def get_tree_rows(root_id=None):
+    """
+    Return the categories of the whole forest, or of the subtree of a root category, in
+    tree order, from a single query.
+
+    An unknown root returns no rows rather than needing a query of its own.
+    """
+
+    queryset = Category.objects.all()
+
+    if root_id is not None:
+        queryset = get_category_subtree(root_id)
+
+    return queryset.order_by("tree_id", "lft").values(
+        "id",
+        "name",
+        "slug",
+        "is_active",
+        "product_count",
+        "subtree_product_count",
+        "parent_id",
+    )
+
+
+def build_category_tree(rows):
+    """
+    Nest category rows given in tree order, every category under its parent `children`.
+
+    Rows are in `tree_id, lft` order, so every parent comes before its children and the
+    children of a parent come in name order. The categories whose parent is not in the
+    rows are the roots of the returned list.
+    """
+
+    nodes = {}
+    roots = []
+
+    for row in rows:
+        parent_id = row.pop("parent_id")
+        node = nodes[row["id"]] = {**row, "children": []}
+
+        parent = nodes.get(parent_id)
+        if parent is None:
+            roots.append(node)
+        else:
+            parent["children"].append(node)
+
+    return roots
+
+
+def get_category_tree(root_id=None):
+    """
+    Return the rendered JSON tree of every category, or of the subtree of a root category.
+
+    The tree is cached as rendered bytes along with the categories cache version, and
+    the version and the tree are read by a single `get_many`, so a cached tree costs one
+    cache round trip and no query. Any category write bumps the version, see
+    `ecommerce.apps.restapi.signals`.
+
+    Returns:
+        tuple: The rendered tree, None for an unknown root, and whether it was cached
+    """
+
+    version_key = get_cache_version_key("categories")
+    tree_key = get_category_tree_key(root_id)
+
+    cached = cache.get_many([version_key, tree_key])
+    version = cached.get(version_key)
+    if version is not None and tree_key in cached:
+        cached_version, content = cached[tree_key]
+        if cached_version == version:
+            return content, True
+
+    if version is None:
+        version = get_cache_version("categories")
+
+    tree = build_category_tree(get_tree_rows(root_id))
+    if root_id is not None:
+        if not tree:
+            return None, False
+        tree = tree[0]
+
+    content = ORJSONRenderer().render(tree)
+    cache.set(tree_key, (version, content), settings.RESTAPI_RESPONSE_CACHE_TIMEOUT)
+
+    return content, False
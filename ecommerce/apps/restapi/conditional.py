@@ -0,0 +1,212 @@
+import hashlib
+from datetime import datetime
+from functools import wraps
+from itertools import chain
+
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date, urlencode
+from rest_framework import status
+
+from .cache import get_cache_versions
+
+
+class RelatedVersion:
+    """
+    The version of the rows related to a row, folded into the version of the row.
+
+    The version is the max of a monotonic field of the related rows, their last update
+    or their insertion order, along with their count, so rows added, updated and deleted
+    all change it.
+
+    Args:
+        queryset (QuerySet): The related rows.
+        lookup (str): The field of the related rows referencing the row.
+        field (str): The monotonic field of the related rows, `updated_at` by default.
+        outer (str): The field of the row referenced by `lookup`, the primary key by default.
+    """
+
+    def __init__(self, queryset, lookup, field="updated_at", outer="pk"):
+        self.queryset = queryset
+        self.lookup = lookup
+        self.field = field
+        self.outer = outer
+
+    def get_annotations(self, name):
+        """
+        Return the subqueries of the max field and the count of the rows related to the outer row.
+        """
+
+        rows = (
+            self.queryset.filter(**{self.lookup: OuterRef(self.outer)})
+            .order_by()
+            .values(self.lookup)
+        )
+
+        return {
+            f"{name}_version": Subquery(
+                rows.annotate(version=Max(self.field)).values("version")
+            ),
+            f"{name}_count": Subquery(rows.annotate(count=Count("pk")).values("count")),
+        }
+
+
+def get_related_annotations(related):
+    """
+    Return the version subqueries of every `RelatedVersion`, by annotation name.
+    """
+
+    annotations = {}
+    for index, related_version in enumerate(related):
+        annotations.update(related_version.get_annotations(f"related_{index}"))
+
+    return annotations
+
+
+def get_object_version(queryset, id, related=()):
+    """
+    Return the `updated_at` of a single row and the versions of its related rows as its
+    version, or None if the row does not exist.
+    """
+
+    annotations = get_related_annotations(related)
+
+    return (
+        queryset.filter(id=id)
+        .annotate(**annotations)
+        .values_list("id", "updated_at", *annotations)
+        .first()
+    )
+
+
+def get_page_bounds(view, request):
+    """
+    Return the start and stop positions of the rows of the requested page of a list, or
+    None when the page number is invalid or can only be told by counting the rows.
+    """
+
+    paginator = view.paginator
+    if paginator is None:
+        return 0, None
+
+    try:
+        page_number = int(request.query_params.get(paginator.page_query_param, 1))
+    except ValueError:
+        return None
+
+    if page_number < 1:
+        return None
+
+    page_size = paginator.get_page_size(request)
+
+    return (page_number - 1) * page_size, page_number * page_size
+
+
+def get_list_version(queryset, bounds, related=()):
+    """
+    Return the ids, `updated_at` and versions of the related rows of the rows between
+    the bounds of a queryset as its version.
+
+    The rows are picked with the ordering of the queryset, and the related subqueries
+    only run for these rows, so the version costs the same on every page of any list.
+    """
+
+    annotations = get_related_annotations(related)
+    rows = (
+        queryset.filter(id__in=queryset.values("id")[slice(*bounds)])
+        .annotate(**annotations)
+        .order_by("id")
+        .values_list("id", "updated_at", *annotations)
+    )
+
+    return tuple(chain.from_iterable(rows))
+
+
+def get_last_modified(version):
+    """
+    Return the latest timestamp of a version as a `Last-Modified` timestamp, or None.
+    """
+
+    timestamps = [value for value in version if isinstance(value, datetime)]
+    if not timestamps:
+        return None
+
+    return int(max(timestamps).timestamp())
+
+
+def conditional_response(many=False, related=(), namespaces=()):
+    """
+    Decorator that adds a strong `ETag` validator to a viewset action.
+
+    The validator covers the whole representation: the `updated_at` of the rows (of the
+    rows of the requested page for lists), the `RelatedVersion` of their nested rows,
+    read within the same query, and the response cache versions of the shared nested
+    rows, bumped by `ecommerce.apps.restapi.signals`. A matching `If-None-Match` request
+    is answered with a 304 before the queryset is loaded or a serializer is instantiated.
+
+    `Last-Modified` is the latest timestamp of the rows and their nested rows. Removed
+    nested rows and changed shared rows do not move it, so clients should revalidate
+    with `If-None-Match`, which takes precedence over `If-Modified-Since`. Keyset
+    paginated lists are served without validators, as are the pages that can only be
+    located by counting the rows.
+
+    Args:
+        many (bool): Whether the action is a list action or a retrieve by `id` action.
+        related (tuple): The `RelatedVersion` of the nested rows with their own version.
+        namespaces (tuple): The response cache namespaces of the other nested rows.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            # Keyset pages exist to avoid counting the whole list
+            if many and getattr(self, "use_keyset_pagination", lambda: False)():
+                return func(self, request, *args, **kwargs)
+
+            if many:
+                bounds = get_page_bounds(self, request)
+                version = None
+                if bounds is not None:
+                    version = get_list_version(self.queryset, bounds, related)
+                    # Let the action build its usual invalid page response, only the
+                    # first page of a list can be empty
+                    if not version and bounds[0]:
+                        version = None
+            else:
+                version = get_object_version(self.queryset, kwargs.get("id"), related)
+
+            # Let the action build its usual not found response
+            if version is None:
+                return func(self, request, *args, **kwargs)
+
+            versions = ":".join(
+                str(value) for value in (*version, *get_cache_versions(namespaces))
+            )
+            query = urlencode(sorted(request.query_params.lists()), doseq=True)
+            etag = quote_etag(
+                hashlib.md5(
+                    f"{request.path}?{query}:{versions}".encode("utf-8")
+                ).hexdigest()
+            )
+
+            last_modified = get_last_modified(version)
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is None:
+                response = func(self, request, *args, **kwargs)
+
+            if response.status_code in (
+                status.HTTP_200_OK,
+                status.HTTP_304_NOT_MODIFIED,
+            ):
+                response["ETag"] = etag
+                if last_modified is not None:
+                    response["Last-Modified"] = http_date(last_modified)
+
+            return response
+
+        return wrapper
+
+    return decorator
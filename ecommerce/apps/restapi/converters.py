@@ -0,0 +1,29 @@
+import uuid
+
+
+def parse_object_id(value):
+    """
+    Return an object id string as a UUID, or None if it is not a UUID.
+    """
+
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
+
+
+class ObjectIdConverter:
+    """
+    Path converter of the object ids, matching any path segment as a UUID.
+
+    A segment which is not a UUID is converted to the nil UUID, which no row uses, so
+    the views answer it with their own not found response instead of a database error.
+    """
+
+    regex = "[^/]+"
+
+    def to_python(self, value):
+        return parse_object_id(value) or uuid.UUID(int=0)
+
+    def to_url(self, value):
+        return str(value)
@@ -0,0 +1,160 @@
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ecommerce.apps.promotion.models import Promotion
+from .cache import get_cache_version
+
+# The Bloom filter of the latest coupon codes version loaded by this process
+local_filters = {}
+
+
+class BloomFilter:
+    """
+    Compact set of strings answering membership with no false negatives, and false
+    positives at the error rate it was sized for.
+
+    Attributes:
+        size (int): The number of bits of the filter.
+        hashes (int): The number of bits set per item.
+        bits (bytearray): The bits of the filter.
+    """
+
+    def __init__(self, size, hashes, bits=None):
+        self.size = size
+        self.hashes = hashes
+        self.bits = bytearray(bits) if bits is not None else bytearray(-(-size // 8))
+
+    @classmethod
+    def for_items(cls, items, error_rate):
+        """
+        Return a filter holding the items, sized for their number and the error rate.
+        """
+
+        items = list(items)
+        count = max(len(items), 1)
+        size = max(int(-count * math.log(error_rate) / math.log(2) ** 2), 8)
+        hashes = max(round(size / count * math.log(2)), 1)
+
+        bloom_filter = cls(size, hashes)
+        for item in items:
+            bloom_filter.add(item)
+
+        return bloom_filter
+
+    def get_positions(self, item):
+        # Double hashing of two 64 bit halves of a single digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item):
+        for position in self.get_positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(item)
+        )
+
+
+def get_coupon_key(version, name):
+    """
+    Return the cache key of a coupon codes version value.
+    """
+
+    return f"restapi:coupons:{version}:{name}"
+
+
+def get_active_coupons(codes=None):
+    """
+    Return a dict mapping coupon codes to the active promotions using them.
+    """
+
+    promotions = Promotion.objects.filter(is_active=True, coupon__isnull=False)
+    if codes is not None:
+        promotions = promotions.filter(coupon__code__in=codes)
+
+    coupons = {}
+    for code, promotion_id, name, promotion_reduction in promotions.order_by(
+        "coupon__code", "name"
+    ).values_list("coupon__code", "id", "name", "promotion_reduction"):
+        coupons.setdefault(code, []).append(
+            {
+                "id": promotion_id,
+                "name": name,
+                "promotion_reduction": promotion_reduction,
+            }
+        )
+
+    return coupons
+
+
+def build_coupon_filter(version):
+    """
+    Cache the active promotions of every coupon code and their Bloom filter.
+    """
+
+    coupons = get_active_coupons()
+    bloom_filter = BloomFilter.for_items(
+        coupons, settings.RESTAPI_COUPON_FILTER_ERROR_RATE
+    )
+
+    cache.set_many(
+        {
+            get_coupon_key(version, f"code:{code}"): value
+            for code, value in coupons.items()
+        },
+        settings.RESTAPI_RESPONSE_CACHE_TIMEOUT,
+    )
+    cache.set(
+        get_coupon_key(version, "filter"),
+        (bloom_filter.size, bloom_filter.hashes, bytes(bloom_filter.bits)),
+        settings.RESTAPI_RESPONSE_CACHE_TIMEOUT,
+    )
+
+    return bloom_filter
+
+
+def get_coupon_filter(version):
+    """
+    Return the Bloom filter of the active coupon codes, from this process, the cache
+    or the database, in that order.
+    """
+
+    bloom_filter = local_filters.get(version)
+    if bloom_filter is not None:
+        return bloom_filter
+
+    cached = cache.get(get_coupon_key(version, "filter"))
+    bloom_filter = BloomFilter(*cached) if cached else build_coupon_filter(version)
+
+    local_filters.clear()
+    local_filters[version] = bloom_filter
+
+    return bloom_filter
+
+
+def get_coupon_promotions(code):
+    """
+    Return the active promotions of a coupon code, an empty list for an invalid code.
+
+    Codes missing from the Bloom filter are rejected in memory. The other codes are
+    read from the cached map, and from the database when evicted or a false positive.
+    """
+
+    version = get_cache_version("coupons")
+
+    if code not in get_coupon_filter(version):
+        return []
+
+    promotions = cache.get(get_coupon_key(version, f"code:{code}"))
+    if promotions is None:
+        promotions = get_active_coupons([code]).get(code, [])
+
+    return promotions
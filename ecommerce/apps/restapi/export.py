@@ -0,0 +1,117 @@
+import csv
+from datetime import datetime, time
+from decimal import Decimal
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .renderers import ORJSONRenderer
+
+# Exported columns, as (output name, ProductInventory lookup)
+EXPORT_COLUMNS = [
+    ("id", "id"),
+    ("sku", "sku"),
+    ("upc", "upc"),
+    ("product_id", "product_id"),
+    ("product_web_id", "product__web_id"),
+    ("product_name", "product__name"),
+    ("brand_id", "brand_id"),
+    ("brand_name", "brand__name"),
+    ("product_type_id", "product_type_id"),
+    ("product_type_name", "product_type__name"),
+    ("retail_price", "retail_price"),
+    ("store_price", "store_price"),
+    ("promotion_price", "effective_price__promotion_price"),
+    ("is_active", "is_active"),
+    ("is_on_sale", "is_on_sale"),
+    ("is_digital", "is_digital"),
+    ("weight", "weight"),
+    ("units", "stock_product_inventory__units"),
+    ("units_sold", "stock_product_inventory__units_sold"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+]
+
+
+def parse_export_datetime(value):
+    """
+    Parse an ISO 8601 datetime or date, a date meaning its midnight, in the current timezone.
+
+    Returns None when the value can not be parsed.
+    """
+
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            parsed = datetime.combine(date, time.min) if date else None
+    except ValueError:
+        return None
+
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+
+    return parsed
+
+
+def get_export_rows(queryset, chunk_size):
+    """
+    Return an iterator over the export rows of a ProductInventory queryset.
+
+    Product, brand, product type, stock and the effective promotion price are joined in,
+    and rows are read in `chunk_size` batches through a server-side cursor.
+    """
+
+    return (
+        queryset.order_by("created_at", "id")
+        .values_list(*[lookup for _, lookup in EXPORT_COLUMNS])
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def stream_ndjson(rows):
+    """
+    Yield one JSON object per row, rendered like the REST API responses.
+
+    Decimals are rendered as strings, as the REST API serializers do.
+    """
+
+    renderer = ORJSONRenderer()
+    names = [name for name, _ in EXPORT_COLUMNS]
+
+    for row in rows:
+        item = {
+            name: f"{value:f}" if isinstance(value, Decimal) else value
+            for name, value in zip(names, row)
+        }
+        yield renderer.render(item) + b"\n"
+
+
+class Echo:
+    """
+    File-like object returning what is written, for streaming `csv.writer` output.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    """
+    Yield the CSV header, then one CSV line per row.
+    """
+
+    writer = csv.writer(Echo())
+
+    yield writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow(
+            value.isoformat() if isinstance(value, datetime) else value for value in row
+        )
+
+
+# Export formats, as {output: (content type, stream function)}
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", stream_ndjson),
+    "csv": ("text/csv", stream_csv),
+}
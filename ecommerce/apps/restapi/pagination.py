@@ -0,0 +1,246 @@
+import json
+import uuid
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Cursor based pagination keyed on a stable, unique ordering such as `(created_at, id)`.
+
+    Every page is fetched with a `WHERE (ordering) > (last row)` range filter instead of an
+    `OFFSET`, and no total count is computed, so walking deep pages costs the same as page one.
+    Cursors are opaque base64 strings holding the ordering values of the last row of a page.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    ordering = ("created_at", "id")
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return a single page of results, positioned after the row encoded in the cursor.
+        """
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = tuple(getattr(view, "keyset_ordering", self.ordering))
+        self.model = queryset.model
+
+        position = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position))
+
+        # Fetch one extra row to know whether a next page exists without counting
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        return self.page
+
+    def get_keyset_filter(self, position):
+        """
+        Build the row comparison `(f1, f2, ...) > (v1, v2, ...)` for the current ordering.
+
+        The leading `f1 >= v1` term lets the database use a range scan on the ordering index.
+        """
+
+        fields = [field.lstrip("-") for field in self.ordering]
+        lookups = ["lt" if field.startswith("-") else "gt" for field in self.ordering]
+
+        keyset = Q()
+        for index in range(len(fields)):
+            condition = Q(**{f"{fields[index]}__{lookups[index]}": position[index]})
+            for previous in range(index):
+                condition &= Q(**{fields[previous]: position[previous]})
+            keyset |= condition
+
+        return Q(**{f"{fields[0]}__{lookups[0]}e": position[0]}) & keyset
+
+    def get_position(self, instance):
+        """
+        Return the ordering values of a row or `.values()` row, in a JSON serializable form.
+        """
+
+        position = []
+        for field in self.ordering:
+            if isinstance(instance, dict):
+                value = instance[field.lstrip("-")]
+            else:
+                value = getattr(instance, field.lstrip("-"))
+            if hasattr(value, "isoformat"):
+                value = value.isoformat()
+            elif isinstance(value, uuid.UUID):
+                value = str(value)
+            position.append(value)
+
+        return position
+
+    def encode_cursor(self, position):
+        """
+        Return the url of the page that starts after the given position.
+        """
+
+        encoded = urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode(
+            "ascii"
+        )
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """
+        Return the position encoded in the request cursor, or None on the first page.
+        """
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+
+            return [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        """
+        Return the url of the next page, or None on the last page.
+        """
+
+        if not self.has_next:
+            return None
+
+        return self.encode_cursor(self.get_position(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginationMixin:
+    """
+    Viewset mixin that switches between page number and keyset pagination.
+
+    Keyset pagination is used when the request passes `?pagination=cursor` or a `cursor`,
+    or when the endpoint sets `keyset_pagination_default = True`. `?pagination=page`
+    always falls back to the viewset `pagination_class`.
+    """
+
+    keyset_pagination_class = KeysetPagination
+    keyset_pagination_default = False
+    keyset_ordering = ("created_at", "id")
+
+    def use_keyset_pagination(self):
+        """
+        Return whether the current request should be paginated with a cursor.
+        """
+
+        request = getattr(self, "request", None)
+        if request is None:
+            return self.keyset_pagination_default
+
+        query_params = request.query_params
+        mode = query_params.get("pagination")
+
+        if mode == "page":
+            return False
+        if (
+            mode == "cursor"
+            or self.keyset_pagination_class.cursor_query_param in query_params
+        ):
+            return True
+
+        return self.keyset_pagination_default
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.pagination_class is None:
+                self._paginator = None
+            elif self.use_keyset_pagination():
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+
+        return self._paginator
+
+
+class AsyncPageNumberPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination for the async views, counting and loading the page with the
+    async ORM API. The payload is the same as `PageNumberPagination`.
+    """
+
+    async def apaginate_queryset(self, queryset, request):
+        """
+        Return the rows of the requested page, raising NotFound for an invalid page.
+        """
+
+        self.request = request
+
+        # Paginate the row positions, then load only the rows of the page
+        paginator = self.django_paginator_class(
+            range(await queryset.acount()), self.page_size
+        )
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+            )
+
+        positions = self.page.object_list
+        return [row async for row in queryset[positions.start : positions.stop]]
+
+    def get_page_number(self, request, paginator):
+        page_number = request.GET.get(self.page_query_param, 1)
+        if page_number in self.last_page_strings:
+            page_number = paginator.num_pages
+
+        return page_number
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("count", self.page.paginator.count),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
@@ -0,0 +1,16 @@
+from rest_framework import permissions
+
+
+class CanChangeStock(permissions.BasePermission):
+    """
+    Allow the staff users and the users with the `inventory.change_stock` permission.
+    """
+
+    def has_permission(self, request, view):
+        user = request.user
+
+        return bool(
+            user
+            and user.is_authenticated
+            and (user.is_staff or user.has_perm("inventory.change_stock"))
+        )
@@ -1,6 +1,79 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 from ecommerce.apps.inventory.models import *
 from ecommerce.apps.promotion.models import *
+from .values import JoinedValues, RelatedValues, ValuesPlan
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin adding sparse fieldsets (`?fields=`) and opt-in expansion (`?expand=`).
+
+    `Meta.expandable_fields` lists the nested fields of the serializer. When `expand` is given,
+    nested relations that are not listed are rendered as primary keys and nested method
+    fields are dropped. When `expand` is omitted every nested field is expanded as before.
+    The `setup_eager_loading` class methods use the same arguments to shape the SQL.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        for name in self.Meta.expandable_fields:
+            if name not in self.fields or self.is_expanded(name, fields, expand):
+                continue
+
+            field = self.fields.pop(name)
+            if isinstance(field, serializers.SerializerMethodField):
+                continue
+
+            collapsed_kwargs = {"read_only": True}
+            if isinstance(field, serializers.ListSerializer):
+                collapsed_kwargs["many"] = True
+            if field.source != name:
+                collapsed_kwargs["source"] = field.source
+
+            self.fields[name] = serializers.PrimaryKeyRelatedField(**collapsed_kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @staticmethod
+    def get_sparse_fieldset(request):
+        """
+        Return the `fields` and `expand` sets of a request, None when a parameter is omitted.
+        """
+
+        def parse(name):
+            value = request.query_params.get(name)
+            if value is None:
+                return None
+
+            return {item.strip() for item in value.split(",") if item.strip()}
+
+        return parse("fields"), parse("expand")
+
+    @staticmethod
+    def is_requested(name, fields):
+        return fields is None or name in fields
+
+    @classmethod
+    def is_expanded(cls, name, fields, expand):
+        return cls.is_requested(name, fields) and (expand is None or name in expand)
+
+    @classmethod
+    def setup_sparse_fieldset(cls, queryset, fields):
+        """
+        Restrict the selected columns to the requested concrete fields.
+        """
+
+        if fields is None:
+            return queryset
+
+        opts = cls.Meta.model._meta
+        columns = [field.name for field in opts.concrete_fields if field.name in fields]
+
+        return queryset.only(opts.pk.name, *columns)
 
 
 class ParentCategorySerializer(serializers.ModelSerializer):
@@ -10,7 +83,7 @@ class ParentCategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Category
-        fields = ["id", "name", "slug"]
+        fields = ["id", "name", "slug", "product_count", "subtree_product_count"]
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -22,7 +95,21 @@ class CategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Category
-        fields = ["id", "name", "slug", "parent"]
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "product_count",
+            "subtree_product_count",
+            "parent",
+        ]
+
+
+# Values plans render the list endpoints without instantiating the serializers,
+# with the same output as their serializer, see `ecommerce.apps.restapi.values`
+PARENT_CATEGORY_PLAN = ValuesPlan(ParentCategorySerializer)
+
+CATEGORY_PLAN = ValuesPlan(CategorySerializer)
 
 
 class SimpleCategorySerializer(serializers.ModelSerializer):
@@ -45,6 +132,9 @@ class ProductTypeSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+PRODUCT_TYPE_PLAN = ValuesPlan(ProductTypeSerializer)
+
+
 class BrandSerializer(serializers.ModelSerializer):
     """
     Serializer for the Brand model.
@@ -55,7 +145,10 @@ class BrandSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+BRAND_PLAN = ValuesPlan(BrandSerializer)
+
+
+class ProductListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for the Product model.
     """
@@ -65,9 +158,26 @@ class ProductListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
         fields = "__all__"
+        expandable_fields = ["category"]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, expand=None):
+        """
+        Load the categories of a whole page in a fixed number of queries.
+        """
+        queryset = cls.setup_sparse_fieldset(queryset, fields)
 
+        if cls.is_expanded("category", fields, expand):
+            queryset = queryset.prefetch_related("category")
+        elif cls.is_requested("category", fields):
+            queryset = queryset.prefetch_related(
+                Prefetch("category", queryset=Category.objects.only("id"))
+            )
 
-class ProductRetrieveSerializer(serializers.ModelSerializer):
+        return queryset
+
+
+class ProductRetrieveSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for the Product model.
     """
@@ -77,6 +187,25 @@ class ProductRetrieveSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
         fields = "__all__"
+        expandable_fields = ["category"]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, expand=None):
+        """
+        Load the categories and their parents in a fixed number of queries.
+        """
+        queryset = cls.setup_sparse_fieldset(queryset, fields)
+
+        if cls.is_expanded("category", fields, expand):
+            queryset = queryset.prefetch_related(
+                Prefetch("category", queryset=Category.objects.select_related("parent"))
+            )
+        elif cls.is_requested("category", fields):
+            queryset = queryset.prefetch_related(
+                Prefetch("category", queryset=Category.objects.only("id"))
+            )
+
+        return queryset
 
 
 class SimpleProductSerializer(serializers.ModelSerializer):
@@ -101,21 +230,59 @@ class ProductInventoryListSerializer(serializers.ModelSerializer):
         model = ProductInventory
         fields = "__all__"
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load the media, stock and attribute values of a whole page in a fixed number of queries.
+        """
+        return queryset.select_related(
+            "product", "brand", "product_type", "stock_product_inventory"
+        ).prefetch_related(
+            Prefetch(
+                "attribute_values", queryset=ProductAttributeValue.objects.order_by("id")
+            ),
+            Prefetch(
+                "media_product_inventory",
+                queryset=Media.objects.only(
+                    "id", "image", "product_inventory_id"
+                ).order_by("id"),
+            ),
+        )
+
     def get_media(self, obj):
-        return [
-            item["image"]
-            for item in Media.objects.filter(product_inventory=obj).values("image")
-        ]
+        return [item.image.name for item in obj.media_product_inventory.all()]
 
     def get_stock(self, obj):
-        return Stock.objects.filter(product_inventory=obj).values(
-            "units", "units_sold", "last_checked"
-        )
+        try:
+            stock = obj.stock_product_inventory
+        except Stock.DoesNotExist:
+            return []
+
+        return [
+            {
+                "units": stock.units,
+                "units_sold": stock.units_sold,
+                "last_checked": stock.last_checked,
+            }
+        ]
 
     # def get_promotions(self, obj):
     #     return [item["id"] for item in obj.promotions.values("id")]
 
 
+PRODUCT_LIST_PLAN = ValuesPlan(ProductListSerializer)
+
+PRODUCT_INVENTORY_LIST_PLAN = ValuesPlan(
+    ProductInventoryListSerializer,
+    related={
+        "media": RelatedValues(Media, "product_inventory", ["image"], flat=True),
+        "stock": JoinedValues(
+            "stock_product_inventory", ["units", "units_sold", "last_checked"]
+        ),
+    },
+)
+
+
 class ProductInventoryProductSerializer(serializers.ModelSerializer):
     """
     Serializer for the ProductInventory model.
@@ -127,6 +294,20 @@ class ProductInventoryProductSerializer(serializers.ModelSerializer):
         model = ProductInventory
         fields = "__all__"
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load the product and attribute values of a whole page in a fixed number of queries.
+        """
+        return queryset.select_related("product").prefetch_related(
+            Prefetch(
+                "attribute_values", queryset=ProductAttributeValue.objects.order_by("id")
+            )
+        )
+
+
+PRODUCT_INVENTORY_PRODUCT_PLAN = ValuesPlan(ProductInventoryProductSerializer)
+
 
 class ProductAttributeSerializer(serializers.ModelSerializer):
     """
@@ -170,7 +351,19 @@ class ProductInventoryPromotionSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "promotion_reduction", "is_active", "is_schedule"]
 
 
-class ProductInventoryRetrieveSerializer(serializers.ModelSerializer):
+class EffectivePriceSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the EffectivePrice model.
+    """
+
+    class Meta:
+        model = EffectivePrice
+        fields = ["promotion", "promotion_price", "valid_from", "valid_to"]
+
+
+class ProductInventoryRetrieveSerializer(
+    SparseFieldsetMixin, serializers.ModelSerializer
+):
     """
     Serializer for the ProductInventory model.
     """
@@ -181,21 +374,105 @@ class ProductInventoryRetrieveSerializer(serializers.ModelSerializer):
     attribute_values = ProductAttributeValueSerializer(many=True)
     media = serializers.SerializerMethodField()
     stock = serializers.SerializerMethodField()
-    promotions = ProductInventoryPromotionSerializer(many=True)
+    promotions = ProductInventoryPromotionSerializer(
+        many=True, source="products_on_promotion"
+    )
+    effective_price = serializers.SerializerMethodField()
 
     class Meta:
         model = ProductInventory
         fields = "__all__"
+        expandable_fields = [
+            "product_type",
+            "product",
+            "brand",
+            "attribute_values",
+            "media",
+            "stock",
+            "promotions",
+            "effective_price",
+        ]
 
-    def get_media(self, obj):
-        return Media.objects.filter(product_inventory=obj).values(
-            "id", "image", "alt_text", "is_feature"
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, expand=None):
+        """
+        Load the requested nested relations of the selected rows in a fixed number of queries.
+        """
+        queryset = cls.setup_sparse_fieldset(queryset, fields)
+
+        select_related = [
+            name
+            for name in ("product", "brand", "product_type")
+            if cls.is_expanded(name, fields, expand)
+        ]
+        if cls.is_expanded("stock", fields, expand):
+            select_related.append("stock_product_inventory")
+        if cls.is_expanded("effective_price", fields, expand):
+            select_related.append("effective_price")
+
+        prefetch_related = []
+        if cls.is_expanded("attribute_values", fields, expand):
+            prefetch_related.append(
+                Prefetch(
+                    "attribute_values",
+                    queryset=ProductAttributeValue.objects.select_related(
+                        "product_attribute"
+                    ).order_by("id"),
+                )
+            )
+        elif cls.is_requested("attribute_values", fields):
+            prefetch_related.append(
+                Prefetch(
+                    "attribute_values",
+                    queryset=ProductAttributeValue.objects.only("id").order_by("id"),
+                )
+            )
+        if cls.is_expanded("media", fields, expand):
+            prefetch_related.append("media_product_inventory")
+        if cls.is_expanded("promotions", fields, expand):
+            prefetch_related.append("products_on_promotion")
+        elif cls.is_requested("promotions", fields):
+            prefetch_related.append(
+                Prefetch("products_on_promotion", queryset=Promotion.objects.only("id"))
+            )
+
+        return queryset.select_related(*select_related).prefetch_related(
+            *prefetch_related
         )
 
+    def get_media(self, obj):
+        return [
+            {
+                "id": item.id,
+                "image": item.image.name,
+                "alt_text": item.alt_text,
+                "is_feature": item.is_feature,
+            }
+            for item in obj.media_product_inventory.all()
+        ]
+
     def get_stock(self, obj):
-        return Stock.objects.filter(product_inventory=obj).values(
-            "id", "units", "units_sold", "last_checked"
-        )
+        try:
+            stock = obj.stock_product_inventory
+        except Stock.DoesNotExist:
+            return []
+
+        return [
+            {
+                "id": stock.id,
+                "units": stock.units,
+                "units_sold": stock.units_sold,
+                "last_checked": stock.last_checked,
+            }
+        ]
+
+    def get_effective_price(self, obj):
+        try:
+            effective_price = obj.effective_price
+        except EffectivePrice.DoesNotExist:
+            return None
+
+        return EffectivePriceSerializer(effective_price).data
 
 
 class PromotionTypeSerializer(serializers.ModelSerializer):
@@ -231,6 +508,9 @@ class PromotionListSerializer(serializers.ModelSerializer):
         exclude = ["description"]
 
 
+PROMOTION_LIST_PLAN = ValuesPlan(PromotionListSerializer)
+
+
 class PromotionRetrieveSerializer(serializers.ModelSerializer):
     """
     Serializer for the Promotion model.
@@ -255,3 +535,41 @@ class PromotionRetrieveSerializer(serializers.ModelSerializer):
             }
             for item in all_products_on_promotion
         ]
+
+
+class PromotionSimulationSerializer(serializers.Serializer):
+    """
+    Serializer for the projected totals of a promotion reduction scenario.
+    """
+
+    promotion_reduction = serializers.IntegerField()
+    products = serializers.IntegerField()
+    min_price = serializers.DecimalField(
+        max_digits=20, decimal_places=2, allow_null=True
+    )
+    max_price = serializers.DecimalField(
+        max_digits=20, decimal_places=2, allow_null=True
+    )
+    discount_from_retail = serializers.DecimalField(max_digits=20, decimal_places=2)
+    discount_from_retail_percent = serializers.FloatField(allow_null=True)
+    revenue = serializers.DecimalField(max_digits=20, decimal_places=2)
+    projected_revenue = serializers.DecimalField(max_digits=20, decimal_places=2)
+    revenue_delta = serializers.DecimalField(max_digits=20, decimal_places=2)
+
+
+class StockUnitsSerializer(serializers.Serializer):
+    """
+    Serializer for the units of a stock decrement or reservation request.
+    """
+
+    units = serializers.IntegerField(min_value=1)
+
+
+class StockReservationSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the StockReservation model.
+    """
+
+    class Meta:
+        model = StockReservation
+        fields = ["id", "product_inventory", "units", "expires_at"]
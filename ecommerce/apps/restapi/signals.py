@@ -0,0 +1,105 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ecommerce.apps.inventory.categories import category_product_counts_changed
+from ecommerce.apps.inventory.models import (
+    Brand,
+    Category,
+    Product,
+    ProductAttribute,
+    ProductAttributeValue,
+    ProductInventory,
+    ProductType,
+)
+from ecommerce.apps.promotion.models import Coupon, Promotion
+from ecommerce.apps.promotion.tasks import promotions_transitioned
+from .cache import bump_cache_version
+
+# The versions are bumped once the writing transaction commits, a concurrent request
+# would otherwise cache the rows read before the commit under the new version
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(category_product_counts_changed)
+def invalidate_categories_cache(sender, **kwargs):
+    """
+    Invalidate the cached category responses when a category or its product counts change.
+    """
+    transaction.on_commit(partial(bump_cache_version, "categories"))
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+def invalidate_brands_cache(sender, **kwargs):
+    """
+    Invalidate the cached brand responses when a brand changes.
+    """
+    transaction.on_commit(partial(bump_cache_version, "brands"))
+
+
+@receiver(post_save, sender=ProductType)
+@receiver(post_delete, sender=ProductType)
+def invalidate_product_types_cache(sender, **kwargs):
+    """
+    Invalidate the cached product type responses when a product type changes.
+    """
+    transaction.on_commit(partial(bump_cache_version, "product_types"))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_products_cache(sender, created=True, **kwargs):
+    """
+    Invalidate the validators of the product lists when a product is added or removed,
+    which moves their count and pages.
+    """
+    if created:
+        transaction.on_commit(partial(bump_cache_version, "products"))
+
+
+@receiver(post_save, sender=ProductInventory)
+@receiver(post_delete, sender=ProductInventory)
+def invalidate_product_inventories_cache(sender, created=True, **kwargs):
+    """
+    Invalidate the validators of the product inventory lists when a product inventory
+    is added or removed, which moves their count and pages.
+    """
+    if created:
+        transaction.on_commit(partial(bump_cache_version, "product_inventories"))
+
+
+@receiver(post_save, sender=Coupon)
+@receiver(post_delete, sender=Coupon)
+@receiver(post_save, sender=Promotion)
+@receiver(post_delete, sender=Promotion)
+@receiver(promotions_transitioned)
+def invalidate_coupons_cache(sender, **kwargs):
+    """
+    Invalidate the cached coupon codes when a coupon or a promotion changes.
+    """
+    transaction.on_commit(partial(bump_cache_version, "coupons"))
+
+
+@receiver(post_save, sender=ProductAttribute)
+@receiver(post_delete, sender=ProductAttribute)
+@receiver(post_save, sender=ProductAttributeValue)
+@receiver(post_delete, sender=ProductAttributeValue)
+def invalidate_attributes_cache(sender, **kwargs):
+    """
+    Invalidate the validators of the responses nesting attribute values when one changes.
+    """
+    transaction.on_commit(partial(bump_cache_version, "attributes"))
+
+
+@receiver(post_save, sender=Promotion)
+@receiver(post_delete, sender=Promotion)
+@receiver(promotions_transitioned)
+def invalidate_promotions_cache(sender, **kwargs):
+    """
+    Invalidate the validators of the responses nesting promotions when one changes.
+    """
+    transaction.on_commit(partial(bump_cache_version, "promotions"))
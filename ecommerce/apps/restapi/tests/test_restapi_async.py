@@ -0,0 +1,149 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+
+def normalize(content):
+    """
+    Parse a response payload, sorting the many-to-many id lists which have no ordering.
+    """
+
+    def sort_ids(value):
+        if isinstance(value, dict):
+            return {key: sort_ids(item) for key, item in value.items()}
+        if isinstance(value, list):
+            items = [sort_ids(item) for item in value]
+            return sorted(items) if all(isinstance(i, str) for i in items) else items
+        return value
+
+    return sort_ids(json.loads(content))
+
+
+@pytest.fixture
+def catalogue(
+    product_inventory,
+    category_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    promotion_factory,
+):
+    """
+    A product inventory with a category, attribute values, media, stock and a promotion.
+    """
+
+    product_inventory.product.category.add(category_factory())
+    product_inventory.attribute_values.add(product_attribute_value_factory())
+    media_factory(product_inventory=product_inventory)
+    stock_factory(product_inventory=product_inventory)
+    promotion = promotion_factory()
+    promotion.products_on_promotion.add(product_inventory)
+
+    return {
+        "categories": product_inventory.product.category.get().id,
+        "product_types": product_inventory.product_type.id,
+        "brands": product_inventory.brand.id,
+        "products": product_inventory.product.id,
+        "product_inventory": product_inventory.id,
+        "promotions": promotion.id,
+    }
+
+
+@pytest.mark.parametrize(
+    "url_name, resource",
+    [
+        ("categories_list", None),
+        ("categories_retrieve", "categories"),
+        ("categories_products_list", "categories"),
+        ("product_types_list", None),
+        ("product_types_retrieve", "product_types"),
+        ("product_types_products_list", "product_types"),
+        ("brands_list", None),
+        ("brands_retrieve", "brands"),
+        ("brands_products_list", "brands"),
+        ("products_list", None),
+        ("products_retrieve", "products"),
+        ("product_inventory_list", None),
+        ("product_inventory_retrieve", "product_inventory"),
+        ("promotions_list", None),
+        ("promotions_retrieve", "promotions"),
+        ("promotions_product_inventories_list", "promotions"),
+    ],
+)
+def test_async_endpoint_matches_sync_endpoint(
+    db, client, catalogue, url_name, resource
+):
+    """
+    Test to verify every async endpoint returns the same payload as its sync viewset action.
+    """
+
+    kwargs = {"id": catalogue[resource]} if resource else {}
+
+    sync_response = client.get(reverse(f"restapi_{url_name}", kwargs=kwargs))
+    async_response = client.get(reverse(f"restapi_async_{url_name}", kwargs=kwargs))
+
+    assert async_response.status_code == sync_response.status_code == 200
+    assert async_response["Content-Type"] == "application/json"
+    assert normalize(
+        async_response.content.replace(b"/restapi/async/", b"/restapi/")
+    ) == normalize(sync_response.content)
+
+
+@pytest.mark.parametrize("include_descendants", [None, "true"])
+def test_async_categories_products_include_descendants(
+    db, client, category_factory, product_factory, include_descendants
+):
+    """
+    Test to verify the async category products match the sync ones, with and without
+    the products of the descendant categories.
+    """
+
+    root = category_factory()
+    child = category_factory(parent=root)
+    product_factory(category=[root])
+    product_factory(category=[child])
+    product_factory(category=[root, child])
+
+    kwargs = {"id": root.id}
+    params = {"include_descendants": include_descendants} if include_descendants else {}
+
+    sync_response = client.get(
+        reverse("restapi_categories_products_list", kwargs=kwargs), params
+    )
+    async_response = client.get(
+        reverse("restapi_async_categories_products_list", kwargs=kwargs), params
+    )
+
+    assert async_response.json()["count"] == (3 if include_descendants else 2)
+    assert normalize(
+        async_response.content.replace(b"/restapi/async/", b"/restapi/")
+    ) == normalize(sync_response.content)
+
+
+def test_async_endpoint_pagination(db, client, brand_factory):
+    """
+    Test to verify the async lists are paginated like the sync lists.
+    """
+
+    brand_factory.create_batch(11)
+    url = reverse("restapi_async_brands_list")
+
+    response = client.get(url, {"page": 2}).json()
+
+    assert response["previous"].endswith("/restapi/async/brands/")
+    assert response["count"] > 10
+    assert client.get(url, {"page": 999}).status_code == 404
+
+
+def test_async_endpoint_not_found(db, client):
+    """
+    Test to verify the async endpoints answer a missing row with the sync 404 detail.
+    """
+
+    response = client.get(
+        reverse("restapi_async_product_inventory_retrieve", kwargs={"id": "missing"})
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "ProductInventory not found."}
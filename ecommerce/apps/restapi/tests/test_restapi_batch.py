@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+@pytest.mark.parametrize("lookup", ["id", "sku", "upc"])
+def test_product_inventory_batch_order_and_missing(
+    db, client, product_inventory_factory, lookup
+):
+    """
+    Test to verify the batch endpoint keeps the requested order and reports missing keys.
+    """
+
+    product_inventories = product_inventory_factory.create_batch(3)
+    keys = [str(getattr(item, lookup)) for item in reversed(product_inventories)]
+
+    url = reverse("restapi_product_inventory_batch")
+    response = client.get(url, {lookup: ",".join(keys[:2] + ["missing"] + keys[2:])})
+
+    assert response.status_code == 200
+    assert [item[lookup] for item in response.json()["results"]] == keys
+    assert response.json()["missing"] == ["missing"]
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_product_inventory_batch_queries(
+    db,
+    client,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    promotion_factory,
+    size,
+):
+    """
+    Test to verify the batch endpoint query count does not grow with the number of keys.
+    """
+
+    promotion = promotion_factory()
+    product_inventories = product_inventory_factory.create_batch(size)
+    for product_inventory in product_inventories:
+        product_inventory.attribute_values.add(product_attribute_value_factory())
+        media_factory(product_inventory=product_inventory)
+        stock_factory(product_inventory=product_inventory)
+    promotion.products_on_promotion.add(*product_inventories)
+
+    url = reverse("restapi_product_inventory_batch")
+    keys = ",".join(str(item.id) for item in product_inventories)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, {"id": keys})
+
+    assert len(response.json()["results"]) == size
+    assert len(response.json()["results"][0]["promotions"]) == 1
+    assert len(context.captured_queries) == 4
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"id": "a", "sku": "b"},
+        {"sku": ","},
+        {"upc": ",".join(str(n) for n in range(101))},
+    ],
+)
+def test_product_inventory_batch_invalid(db, client, params):
+    """
+    Test to verify invalid batches return a 400 response.
+    """
+
+    url = reverse("restapi_product_inventory_batch")
+    response = client.get(url, params)
+
+    assert response.status_code == 400
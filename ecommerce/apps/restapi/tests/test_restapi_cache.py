@@ -0,0 +1,121 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty response cache.
+    """
+    cache.clear()
+
+
+@pytest.mark.parametrize(
+    "url_name, factory_name",
+    [
+        ("restapi_brands_retrieve", "brand_factory"),
+        ("restapi_product_types_retrieve", "product_type_factory"),
+        ("restapi_categories_retrieve", "category_factory"),
+    ],
+)
+def test_retrieve_cache_invalidated_on_save(
+    db,
+    client,
+    request,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+    url_name,
+    factory_name,
+):
+    """
+    Test to verify a cached retrieve response is served without queries and refreshed
+    after a save, once committed.
+    """
+
+    instance = request.getfixturevalue(factory_name)()
+    url = reverse(url_name, kwargs={"id": instance.id})
+
+    assert client.get(url)["X-Cache"] == "MISS"
+
+    with django_assert_num_queries(0):
+        response = client.get(url)
+
+    assert response["X-Cache"] == "HIT"
+    assert response.json()["name"] == instance.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        instance.name = f"{instance.name} Updated"
+        instance.save()
+
+        # Not invalidated before the commit
+        assert client.get(url)["X-Cache"] == "HIT"
+
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert response.json()["name"] == instance.name
+
+
+@pytest.mark.parametrize(
+    "url_name, factory_name",
+    [
+        ("restapi_brands_list", "brand_factory"),
+        ("restapi_product_types_list", "product_type_factory"),
+    ],
+)
+def test_list_cache_invalidated_on_delete(
+    db, client, request, django_capture_on_commit_callbacks, url_name, factory_name
+):
+    """
+    Test to verify a cached list response is refreshed after a delete.
+    """
+
+    instance = request.getfixturevalue(factory_name)(name="AAA Cached Name")
+    url = reverse(url_name)
+
+    assert client.get(url).json()["results"][0]["name"] == instance.name
+    assert client.get(url)["X-Cache"] == "HIT"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        instance.delete()
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert instance.name not in [item["name"] for item in response.json()["results"]]
+
+
+def test_cache_keyed_by_query_params(db, client, brand_factory):
+    """
+    Test to verify responses are cached per query string, independent of parameter order.
+    """
+
+    brand_factory.create_batch(15)
+    url = reverse("restapi_brands_list")
+
+    client.get(f"{url}?page=2&pagination=page")
+
+    assert client.get(f"{url}?pagination=page&page=2")["X-Cache"] == "HIT"
+    assert client.get(f"{url}?page=1")["X-Cache"] == "MISS"
+
+
+def test_category_cache_invalidated_on_product_counts(
+    db, client, category, product_factory, django_capture_on_commit_callbacks
+):
+    """
+    Test to verify a cached category response is refreshed when its product counts change.
+    """
+
+    url = reverse("restapi_categories_retrieve", kwargs={"id": category.id})
+
+    assert client.get(url).json()["product_count"] == 0
+    assert client.get(url)["X-Cache"] == "HIT"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product_factory(category=[category])
+
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    assert response.json()["product_count"] == 1
+    assert response.json()["subtree_product_count"] == 1
@@ -0,0 +1,73 @@
+import pytest
+from django.urls import reverse
+
+from .test_restapi_pagination import walk_cursor_pages
+
+
+@pytest.fixture
+def category_subtree(db, category_factory, product_factory):
+    """
+    A parent category, its child and grandchild, and their products.
+
+    One product is in both the child and the grandchild, and one is in another tree.
+    """
+
+    parent = category_factory()
+    child = category_factory(parent=parent)
+    grandchild = category_factory(parent=child)
+
+    products = [
+        product_factory(category=[parent]),
+        product_factory(category=[child, grandchild]),
+        *product_factory.create_batch(12, category=[grandchild]),
+    ]
+    product_factory(category=[category_factory()])
+
+    return parent, products
+
+
+def get_ids(pages):
+    return [item["id"] for page in pages for item in page["results"]]
+
+
+@pytest.mark.parametrize("values_serialization", [False, True])
+def test_categories_products_include_descendants(
+    client, settings, category_subtree, values_serialization
+):
+    """
+    Test to verify the descendants products are listed once each only when requested.
+    """
+
+    settings.RESTAPI_VALUES_SERIALIZATION = values_serialization
+    parent, products = category_subtree
+    url = reverse("restapi_categories_products_list", kwargs={"id": parent.id})
+
+    response = client.get(url).json()
+
+    assert response["count"] == 1
+    assert get_ids([response]) == [str(products[0].id)]
+
+    pages = walk_cursor_pages(client, f"{url}?pagination=cursor&include_descendants=1")
+    ids = get_ids(pages)
+
+    assert [len(page["results"]) for page in pages] == [10, 4]
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {str(product.id) for product in products}
+
+    response = client.get(url, {"include_descendants": "true", "page": 2}).json()
+
+    assert response["count"] == len(products)
+    assert get_ids([response]) == ids[10:]
+
+
+def test_categories_products_include_descendants_not_found(
+    db, client, category_factory
+):
+    """
+    Test to verify an unknown or empty category subtree is not found.
+    """
+
+    category = category_factory()
+    url = reverse("restapi_categories_products_list", kwargs={"id": category.id})
+
+    assert client.get(url, {"include_descendants": "1"}).status_code == 404
@@ -0,0 +1,131 @@
+import uuid
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from ecommerce.apps.inventory.models import Category
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty response cache.
+    """
+    cache.clear()
+
+
+@pytest.fixture
+def category_tree(db, category_factory, product_factory):
+    """
+    Two category trees, the first one three levels deep.
+    """
+
+    clothing = category_factory(name="Clothing")
+    shirts = category_factory(name="Shirts", parent=clothing)
+    polo = category_factory(name="Polo", parent=shirts)
+    category_factory(name="Jeans", parent=clothing)
+    category_factory(name="Shoes")
+    product_factory(category=[shirts, polo])
+
+    return clothing, shirts
+
+
+def tree_root(nodes, name):
+    return next(node for node in nodes if node["name"] == name)
+
+
+def get_names(nodes):
+    return [(node["name"], get_names(node["children"])) for node in nodes]
+
+
+def test_categories_tree(client, django_assert_num_queries, category_tree):
+    """
+    Test to verify the whole tree is nested in name order with its product counts from
+    a single query.
+    """
+
+    clothing, shirts = category_tree
+
+    with django_assert_num_queries(1):
+        response = client.get(reverse("restapi_categories_tree"))
+
+    assert response.status_code == 200
+    assert response["X-Cache"] == "MISS"
+
+    tree = response.json()
+
+    roots = [node["name"] for node in tree]
+    assert roots == sorted(roots)
+    assert get_names([tree_root(tree, "Clothing"), tree_root(tree, "Shoes")]) == [
+        ("Clothing", [("Jeans", []), ("Shirts", [("Polo", [])])]),
+        ("Shoes", []),
+    ]
+
+    node = tree_root(tree, "Clothing")
+    assert node["id"] == str(clothing.id)
+    assert node["children"][1] == {
+        "id": str(shirts.id),
+        "name": shirts.name,
+        "slug": shirts.slug,
+        "is_active": True,
+        "product_count": 1,
+        "subtree_product_count": 1,
+        "children": node["children"][1]["children"],
+    }
+
+
+def test_categories_subtree(client, django_assert_num_queries, category_tree):
+    """
+    Test to verify the subtree of a root category is returned from a single query.
+    """
+
+    _, shirts = category_tree
+    url = reverse("restapi_categories_tree")
+
+    with django_assert_num_queries(1):
+        response = client.get(url, {"root": str(shirts.id)})
+
+    assert get_names([response.json()]) == [("Shirts", [("Polo", [])])]
+
+    assert client.get(url, {"root": str(uuid.uuid4())}).status_code == 404
+    assert client.get(url, {"root": "unknown"}).status_code == 404
+
+
+def test_categories_tree_cache(
+    client,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+    category_tree,
+):
+    """
+    Test to verify the cached tree is served without queries and rebuilt after a write.
+    """
+
+    _, shirts = category_tree
+    url = reverse("restapi_categories_tree")
+    content = client.get(url).content
+
+    with django_assert_num_queries(0):
+        response = client.get(url)
+
+    assert response["X-Cache"] == "HIT"
+    assert response.content == content
+
+    # Reloaded for the tree fields shifted by the later inserts
+    shirts.refresh_from_db()
+    shirts.name = "T-Shirts"
+    with django_capture_on_commit_callbacks(execute=True):
+        shirts.save()
+
+    response = client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+    clothing = tree_root(response.json(), "Clothing")
+    assert clothing["children"][1]["name"] == "T-Shirts"
+
+    shoes = tree_root(response.json(), "Shoes")
+    with django_capture_on_commit_callbacks(execute=True):
+        Category.objects.get(id=shoes["id"]).delete()
+
+    assert "Shoes" not in [node["name"] for node in client.get(url).json()]
@@ -0,0 +1,204 @@
+import pytest
+from django.urls import reverse
+
+from ecommerce.apps.inventory.models import Product
+from ecommerce.apps.inventory.stock import decrement_stock
+
+
+@pytest.mark.parametrize(
+    "url_name, factory_name",
+    [
+        ("restapi_products_retrieve", "product_factory"),
+        ("restapi_product_inventory_retrieve", "product_inventory_factory"),
+    ],
+)
+def test_retrieve_conditional_get(
+    db, client, request, django_assert_num_queries, url_name, factory_name
+):
+    """
+    Test to verify a retrieve with a matching validator returns a 304 from a single query.
+    """
+
+    instance = request.getfixturevalue(factory_name)()
+    url = reverse(url_name, kwargs={"id": instance.id})
+
+    response = client.get(url)
+    etag = response["ETag"]
+
+    assert response.status_code == 200
+
+    with django_assert_num_queries(1):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert response.content == b""
+
+    instance.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_retrieve_validator_covers_nested_rows(
+    db,
+    client,
+    django_capture_on_commit_callbacks,
+    stock_factory,
+    media_factory,
+    promotion_factory,
+):
+    """
+    Test to verify changes of the nested rows only, including the bulk stock updates,
+    change the product inventory validator.
+    """
+
+    stock = stock_factory(units=10, units_sold=0)
+    product_inventory = stock.product_inventory
+    url = reverse(
+        "restapi_product_inventory_retrieve", kwargs={"id": product_inventory.id}
+    )
+
+    def assert_changed(etag):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        return response["ETag"]
+
+    etag = client.get(url)["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    decrement_stock(product_inventory.id, 2)
+    etag = assert_changed(etag)
+
+    media = media_factory(product_inventory=product_inventory)
+    etag = assert_changed(etag)
+
+    media.delete()
+    etag = assert_changed(etag)
+
+    promotion = promotion_factory(products_on_promotion=[])
+    promotion.products_on_promotion.add(product_inventory)
+    etag = assert_changed(etag)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        promotion.name = f"{promotion.name} Updated"
+        promotion.save()
+    etag = assert_changed(etag)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product_inventory.brand.name = f"{product_inventory.brand.name} Updated"
+        product_inventory.brand.save()
+    assert_changed(etag)
+
+
+def test_product_validator_covers_categories(
+    db, client, django_capture_on_commit_callbacks, product_factory, category_factory
+):
+    """
+    Test to verify category changes change the product validator.
+    """
+
+    category = category_factory()
+    product = product_factory(category=[category])
+    url = reverse("restapi_products_retrieve", kwargs={"id": product.id})
+    etag = client.get(url)["ETag"]
+
+    product.category.remove(category)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+    product.category.add(category)
+    etag = response["ETag"]
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+    etag = response["ETag"]
+    with django_capture_on_commit_callbacks(execute=True):
+        category.refresh_from_db()
+        category.name = f"{category.name} Updated"
+        category.save()
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_retrieve_not_found_has_no_validators(db, client):
+    """
+    Test to verify a missing row keeps the usual 404 response.
+    """
+
+    url = reverse("restapi_products_retrieve", kwargs={"id": "missing"})
+    response = client.get(url)
+
+    assert response.status_code == 404
+    assert not response.has_header("ETag")
+
+
+@pytest.mark.parametrize(
+    "url_name, factory_name",
+    [
+        ("restapi_products_list", "product_factory"),
+        ("restapi_product_inventory_list", "product_inventory_factory"),
+    ],
+)
+def test_list_conditional_get(
+    db,
+    client,
+    request,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+    url_name,
+    factory_name,
+):
+    """
+    Test to verify a list with a matching validator returns a 304 and a new row changes the validator.
+    """
+
+    factory = request.getfixturevalue(factory_name)
+    factory.create_batch(11)
+    url = reverse(url_name)
+
+    etag = client.get(url)["ETag"]
+
+    with django_assert_num_queries(1):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert client.get(f"{url}?page=2", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        factory()
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_list_validator_covers_page_rows(db, client, product_factory):
+    """
+    Test to verify the list validator is built from the rows of the requested page, and
+    only changes when the nested rows of the page change.
+    """
+
+    product_factory.create_batch(11)
+    url = reverse("restapi_products_list")
+
+    response = client.get(url)
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+
+    response = client.get(f"{url}?page=2")
+    page_etag = response["ETag"]
+    Product.objects.get(id=response.json()["results"][0]["id"]).save()
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert client.get(f"{url}?page=2", HTTP_IF_NONE_MATCH=page_etag).status_code == 200
+
+    response = client.get(f"{url}?page=last")
+
+    assert response.status_code == 200
+    assert not response.has_header("ETag")
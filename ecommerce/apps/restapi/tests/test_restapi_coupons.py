@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+from django.urls import reverse
+
+from ecommerce.apps.promotion.models import Promotion
+from ecommerce.apps.promotion.tasks import promotion_management
+from ecommerce.apps.restapi.coupons import BloomFilter
+
+
+def test_bloom_filter_membership():
+    """
+    Test to verify the Bloom filter has no false negatives and few false positives.
+    """
+
+    codes = [f"CODE{index:05d}" for index in range(2000)]
+    bloom_filter = BloomFilter.for_items(codes, 0.01)
+
+    assert all(code in bloom_filter for code in codes)
+    assert sum(f"MISS{index:05d}" in bloom_filter for index in range(2000)) < 60
+    assert len(bloom_filter.bits) < 2500
+
+
+def test_coupon_validate(db, client, django_assert_num_queries, promotion_factory):
+    """
+    Test to verify coupon codes validate against the active promotions only.
+    """
+
+    active = promotion_factory(is_active=True)
+    inactive = promotion_factory(is_active=False)
+    url = reverse("restapi_coupons_validate")
+
+    response = client.get(url, {"code": active.coupon.code}).json()
+
+    assert response["valid"]
+    assert response["promotions"] == [
+        {
+            "id": str(active.id),
+            "name": active.name,
+            "promotion_reduction": active.promotion_reduction,
+        }
+    ]
+    assert not client.get(url, {"code": inactive.coupon.code}).json()["valid"]
+
+    # Unknown codes are rejected without a database query
+    with django_assert_num_queries(0):
+        assert client.get(url, {"code": "NOT-A-CODE"}).json() == {
+            "code": "NOT-A-CODE",
+            "valid": False,
+            "promotions": [],
+        }
+
+    assert client.get(url).status_code == 400
+
+
+def test_coupon_validate_invalidated(
+    db, client, django_capture_on_commit_callbacks, promotion_factory
+):
+    """
+    Test to verify the cached coupon codes follow the promotion changes.
+    """
+
+    promotion = promotion_factory(is_active=False)
+    url = reverse("restapi_coupons_validate")
+
+    assert not client.get(url, {"code": promotion.coupon.code}).json()["valid"]
+
+    promotion.is_active = True
+    with django_capture_on_commit_callbacks(execute=True):
+        promotion.save()
+
+    assert client.get(url, {"code": promotion.coupon.code}).json()["valid"]
+
+    # The bulk transitions of promotion_management send no model signals
+    Promotion.objects.filter(id=promotion.id).update(
+        is_schedule=True, promotion_end=date.today() - timedelta(days=1)
+    )
+    assert client.get(url, {"code": promotion.coupon.code}).json()["valid"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        promotion_management()
+
+    assert not client.get(url, {"code": promotion.coupon.code}).json()["valid"]
@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+
+from django.urls import reverse
+
+from ecommerce.apps.inventory.models import ProductInventory
+from ecommerce.apps.promotion.tasks import refresh_effective_prices
+
+
+def read_lines(response):
+    return b"".join(response.streaming_content).decode("utf-8").splitlines()
+
+
+def test_export_ndjson_rows(
+    db, client, product_inventory_factory, stock_factory, promotion_factory, brand
+):
+    """
+    Test to verify the NDJSON export streams joined rows with the effective promotion price.
+    """
+
+    inventory, other = product_inventory_factory.create_batch(2, brand=brand)
+    stock_factory(product_inventory=inventory)
+    promotion_factory(is_active=True).products_on_promotion.add(
+        inventory, through_defaults={"promotion_price": 80}
+    )
+    promotion_factory(is_active=True).products_on_promotion.add(
+        inventory, through_defaults={"promotion_price": 75}
+    )
+    promotion_factory(is_active=False).products_on_promotion.add(
+        other, through_defaults={"promotion_price": 50}
+    )
+    refresh_effective_prices()
+
+    response = client.get(
+        reverse("restapi_product_inventory_export"), {"brand": brand.id}
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    rows = {row["id"]: row for row in map(json.loads, read_lines(response))}
+
+    assert set(rows) == {str(inventory.id), str(other.id)}
+    assert rows[str(inventory.id)]["brand_name"] == brand.name
+    assert rows[str(inventory.id)]["product_name"] == inventory.product.name
+    assert rows[str(inventory.id)]["store_price"] == "92.00"
+    assert rows[str(inventory.id)]["promotion_price"] == "75.00"
+    assert rows[str(inventory.id)]["units"] == 135
+    assert rows[str(other.id)]["promotion_price"] is None
+    assert rows[str(other.id)]["units"] is None
+
+
+def test_export_csv_filtered_by_updated_at(
+    db, client, product_inventory_factory, product_type
+):
+    """
+    Test to verify the CSV export applies the product type and `updated_at` range filters.
+    """
+
+    old, recent = product_inventory_factory.create_batch(2, product_type=product_type)
+    ProductInventory.objects.filter(id=old.id).update(updated_at="2020-01-01T00:00Z")
+    ProductInventory.objects.filter(id=recent.id).update(updated_at="2023-06-01T12:00Z")
+
+    response = client.get(
+        reverse("restapi_product_inventory_export"),
+        {
+            "output": "csv",
+            "product_type": product_type.id,
+            "updated_after": "2023-01-01",
+            "updated_before": "2024-01-01T00:00:00Z",
+        },
+        HTTP_ACCEPT="text/csv",
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+
+    rows = list(csv.DictReader(io.StringIO("\n".join(read_lines(response)))))
+
+    assert [row["id"] for row in rows] == [str(recent.id)]
+    assert rows[0]["product_type_name"] == product_type.name
+
+
+def test_export_invalid_parameters(db, client):
+    """
+    Test to verify invalid export formats, ids and datetimes are rejected before streaming.
+    """
+
+    url = reverse("restapi_product_inventory_export")
+
+    assert client.get(url, {"output": "xml"}).status_code == 400
+    assert client.get(url, {"updated_after": "yesterday"}).json() == {
+        "detail": "Invalid updated_after datetime."
+    }
+    assert client.get(url, {"brand": "notauuid"}).json() == {
+        "detail": "Invalid brand id."
+    }
+    assert client.get(url, {"product_type": "notauuid"}).status_code == 400
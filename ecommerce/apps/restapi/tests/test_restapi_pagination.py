@@ -0,0 +1,82 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from ecommerce.apps.inventory.models import ProductInventory
+
+
+def walk_cursor_pages(client, url):
+    """
+    Follow the `next` links of a cursor paginated endpoint and return every page.
+    """
+
+    pages = []
+    while url is not None:
+        response = client.get(url)
+        assert response.status_code == 200
+
+        pages.append(response.json())
+        url = response.json()["next"]
+
+    return pages
+
+
+@pytest.mark.parametrize("same_created_at", [False, True])
+def test_brand_products_cursor_pagination(
+    db, client, product_inventory_factory, brand, same_created_at
+):
+    """
+    Test to verify cursor pagination walks every row exactly once, even when the leading ordering field ties.
+    """
+
+    product_inventories = product_inventory_factory.create_batch(25, brand=brand)
+
+    if same_created_at:
+        ProductInventory.objects.filter(brand=brand).update(created_at=timezone.now())
+
+    url = reverse("restapi_brands_products_list", kwargs={"id": brand.id})
+    pages = walk_cursor_pages(client, f"{url}?pagination=cursor")
+
+    ids = [item["id"] for page in pages for item in page["results"]]
+
+    assert [len(page["results"]) for page in pages] == [10, 10, 5]
+    assert "count" not in pages[0]
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {str(item.id) for item in product_inventories}
+
+
+def test_product_inventory_cursor_pagination_queries(
+    db, client, product_inventory_factory
+):
+    """
+    Test to verify a deep cursor page costs the same queries as the first page and skips the count query.
+    """
+
+    product_inventory_factory.create_batch(25)
+
+    url = reverse("restapi_product_inventory_list")
+    first_page = client.get(f"{url}?pagination=cursor")
+
+    with CaptureQueriesContext(connection) as first_context:
+        client.get(f"{url}?pagination=cursor")
+
+    with CaptureQueriesContext(connection) as next_context:
+        client.get(first_page.json()["next"])
+
+    assert len(first_context.captured_queries) == 3
+    assert len(next_context.captured_queries) == len(first_context.captured_queries)
+    assert not any("COUNT(" in query["sql"] for query in next_context.captured_queries)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "WyJhIl0="])
+def test_product_inventory_invalid_cursor(db, client, cursor):
+    """
+    Test to verify an invalid cursor returns a 404 response.
+    """
+
+    url = reverse("restapi_product_inventory_list")
+    response = client.get(f"{url}?cursor={cursor}")
+
+    assert response.status_code == 404
@@ -0,0 +1,171 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+def create_product_inventories(
+    size,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    **kwargs,
+):
+    """
+    Create product inventories with media, stock and attribute values attached to each row.
+    """
+
+    product_inventories = []
+    for _ in range(size):
+        product_inventory = product_inventory_factory(**kwargs)
+        product_inventory.attribute_values.add(
+            product_attribute_value_factory(), product_attribute_value_factory()
+        )
+        media_factory(product_inventory=product_inventory)
+        media_factory(product_inventory=product_inventory)
+        stock_factory(product_inventory=product_inventory)
+        product_inventories.append(product_inventory)
+
+    return product_inventories
+
+
+def count_queries(client, url):
+    """
+    Return the number of queries executed to serve a GET request.
+    """
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_product_inventory_list_queries(
+    db,
+    client,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    brand,
+    product_type,
+    product,
+    size,
+):
+    """
+    Test to verify the product inventory list query count does not grow with the page size.
+    """
+
+    create_product_inventories(
+        size,
+        product_inventory_factory,
+        product_attribute_value_factory,
+        media_factory,
+        stock_factory,
+        brand=brand,
+        product_type=product_type,
+        product=product,
+    )
+
+    url = reverse("restapi_product_inventory_list")
+
+    assert count_queries(client, url) == 5
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_promotions_product_inventories_list_queries(
+    db,
+    client,
+    promotion_factory,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    size,
+):
+    """
+    Test to verify the promotion product inventories query count does not grow with the page size.
+    """
+
+    promotion = promotion_factory()
+    promotion.products_on_promotion.add(
+        *create_product_inventories(
+            size,
+            product_inventory_factory,
+            product_attribute_value_factory,
+            media_factory,
+            stock_factory,
+        )
+    )
+
+    url = reverse(
+        "restapi_promotions_product_inventories_list", kwargs={"id": promotion.id}
+    )
+    response = client.get(url)
+
+    assert len(response.json()["results"]) == size
+    assert len(response.json()["results"][0]["media"]) == 2
+    assert len(response.json()["results"][0]["stock"]) == 1
+    assert len(response.json()["results"][0]["attribute_values"]) == 2
+    assert count_queries(client, url) == 5
+
+
+@pytest.mark.parametrize(
+    "url_name, related_name",
+    [
+        ("restapi_brands_products_list", "brand"),
+        ("restapi_product_types_products_list", "product_type"),
+    ],
+)
+@pytest.mark.parametrize("size", [1, 10])
+def test_product_inventory_product_list_queries(
+    db,
+    client,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    brand,
+    product_type,
+    url_name,
+    related_name,
+    size,
+):
+    """
+    Test to verify the brand and product type product lists query count does not grow with the page size.
+    """
+
+    create_product_inventories(
+        size,
+        product_inventory_factory,
+        product_attribute_value_factory,
+        media_factory,
+        stock_factory,
+        brand=brand,
+        product_type=product_type,
+    )
+
+    related = {"brand": brand, "product_type": product_type}[related_name]
+    url = reverse(url_name, kwargs={"id": related.id})
+    response = client.get(url)
+
+    assert len(response.json()["results"]) == size
+    assert count_queries(client, url) == 4
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_products_list_queries(db, client, product_factory, category_factory, size):
+    """
+    Test to verify the product list query count does not grow with the page size.
+    """
+
+    categories = [category_factory(), category_factory()]
+    for _ in range(size):
+        product_factory(category=categories)
+
+    url = reverse("restapi_products_list")
+
+    assert count_queries(client, url) == 4
@@ -0,0 +1,118 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+@pytest.fixture
+def product_inventory_graph(
+    product_inventory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+    promotion_factory,
+):
+    """
+    A product inventory with attribute values, media, stock and a promotion attached.
+    """
+
+    product_inventory.attribute_values.add(product_attribute_value_factory())
+    media_factory(product_inventory=product_inventory)
+    stock_factory(product_inventory=product_inventory)
+    promotion_factory().products_on_promotion.add(product_inventory)
+
+    return product_inventory
+
+
+def test_products_list_sparse_fields(db, client, product_factory, category_factory):
+    """
+    Test to verify `?fields=` shapes both the JSON and the selected columns of the product list.
+    """
+
+    product_factory(category=[category_factory()])
+    url = reverse("restapi_products_list")
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, {"fields": "id,name,slug"})
+
+    assert set(response.json()["results"][0]) == {"id", "name", "slug"}
+    assert not any("description" in query["sql"] for query in context.captured_queries)
+    assert not any(
+        "inventory_category" in query["sql"] for query in context.captured_queries
+    )
+
+
+def test_product_inventory_retrieve_sparse_fields(
+    db, client, django_assert_num_queries, product_inventory_graph
+):
+    """
+    Test to verify a sparse product inventory retrieve skips every nested relation query.
+    """
+
+    url = reverse(
+        "restapi_product_inventory_retrieve", kwargs={"id": product_inventory_graph.id}
+    )
+
+    with django_assert_num_queries(2):
+        response = client.get(url, {"fields": "id,sku,store_price", "expand": ""})
+
+    assert response.json() == {
+        "id": str(product_inventory_graph.id),
+        "sku": product_inventory_graph.sku,
+        "store_price": "92.00",
+    }
+
+
+def test_product_inventory_retrieve_expand(db, client, product_inventory_graph):
+    """
+    Test to verify `?expand=` only expands the listed relations and collapses the others to primary keys.
+    """
+
+    url = reverse(
+        "restapi_product_inventory_retrieve", kwargs={"id": product_inventory_graph.id}
+    )
+    response = client.get(url, {"expand": "brand,stock"}).json()
+
+    assert response["brand"]["name"] == product_inventory_graph.brand.name
+    assert response["stock"][0]["units"] == 135
+    assert response["product"] == str(product_inventory_graph.product.id)
+    assert response["product_type"] == str(product_inventory_graph.product_type.id)
+    assert len(response["attribute_values"]) == 1
+    assert len(response["promotions"]) == 1
+    assert isinstance(response["promotions"][0], str)
+    assert "media" not in response
+
+
+def test_product_inventory_retrieve_default_expands_all(
+    db, client, product_inventory_graph
+):
+    """
+    Test to verify every nested relation is expanded when neither parameter is given.
+    """
+
+    url = reverse(
+        "restapi_product_inventory_retrieve", kwargs={"id": product_inventory_graph.id}
+    )
+    response = client.get(url).json()
+
+    assert response["product"]["name"] == product_inventory_graph.product.name
+    assert response["attribute_values"][0]["product_attribute"]["name"]
+    assert len(response["media"]) == 1
+    assert response["promotions"][0]["name"]
+
+
+def test_product_retrieve_sparse_fields_with_expand(
+    db, client, product_factory, category_factory
+):
+    """
+    Test to verify requested nested fields are still expanded in a sparse product retrieve.
+    """
+
+    parent = category_factory()
+    product = product_factory(category=[category_factory(parent=parent)])
+
+    url = reverse("restapi_products_retrieve", kwargs={"id": product.id})
+    response = client.get(url, {"fields": "name,category"}).json()
+
+    assert set(response) == {"name", "category"}
+    assert response["category"][0]["parent"]["id"] == str(parent.id)
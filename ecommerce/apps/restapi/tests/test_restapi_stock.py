@@ -0,0 +1,115 @@
+import pytest
+from django.contrib.auth.models import Permission
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ecommerce.apps.inventory.models import Stock
+
+
+@pytest.fixture
+def api_client(admin_user):
+    """
+    An API client authenticated as the admin user.
+    """
+
+    client = APIClient()
+    client.force_authenticate(user=admin_user)
+
+    return client
+
+
+def test_stock_reserve_and_commit(db, api_client, stock_factory):
+    """
+    Test to verify the stock endpoints reserve, commit and release units.
+    """
+
+    stock = stock_factory(units=5, units_sold=0)
+    url = reverse("restapi_stock_reserve", kwargs={"id": stock.product_inventory_id})
+
+    response = api_client.post(url, {"units": 3}, format="json")
+
+    assert response.status_code == 201
+    assert response.json()["product_inventory"] == str(stock.product_inventory_id)
+    assert response.json()["units"] == 3
+
+    reservation_id = response.json()["id"]
+    conflict = api_client.post(url, {"units": 3}, format="json")
+    committed = api_client.post(
+        reverse("restapi_stock_commit", kwargs={"id": reservation_id})
+    )
+    released = api_client.post(
+        reverse("restapi_stock_release", kwargs={"id": reservation_id})
+    )
+
+    assert conflict.status_code == 409
+    assert conflict.json() == {"detail": "Insufficient stock."}
+    assert committed.status_code == 200
+    assert released.status_code == 404
+    assert Stock.objects.get(id=stock.id).units_sold == 3
+
+
+def test_stock_decrement(db, api_client, stock_factory):
+    """
+    Test to verify the decrement endpoint sells the available units only.
+    """
+
+    stock = stock_factory(units=5, units_sold=3)
+    url = reverse("restapi_stock_decrement", kwargs={"id": stock.product_inventory_id})
+
+    response = api_client.post(url, {"units": 2}, format="json")
+
+    assert response.status_code == 200
+    assert response.json() == {"units": 2}
+    assert api_client.post(url, {"units": 1}, format="json").status_code == 409
+    assert Stock.objects.get(id=stock.id).units_sold == 5
+
+
+@pytest.mark.parametrize("data", [{"units": 0}, {"units": "many"}, {}])
+def test_stock_reserve_invalid_units(db, api_client, stock_factory, data):
+    """
+    Test to verify the reserved units must be a positive integer.
+    """
+
+    stock = stock_factory()
+    url = reverse("restapi_stock_reserve", kwargs={"id": stock.product_inventory_id})
+
+    assert api_client.post(url, data, format="json").status_code == 400
+
+
+def test_stock_endpoints_not_found(db, api_client, client, product_inventory):
+    """
+    Test to verify missing stocks and reservations are not found, and anonymous
+    clients can not reserve stock.
+    """
+
+    url = reverse("restapi_stock_reserve", kwargs={"id": product_inventory.id})
+
+    assert api_client.post(url, {"units": 1}, format="json").status_code == 404
+    assert client.post(url, {"units": 1}).status_code == 401
+    assert (
+        api_client.post(
+            reverse("restapi_stock_commit", kwargs={"id": "missing"})
+        ).status_code
+        == 404
+    )
+
+
+def test_stock_endpoints_permissions(db, django_user_model, stock_factory):
+    """
+    Test to verify only the staff and the users allowed to change the stock can change it.
+    """
+
+    stock = stock_factory(units=5, units_sold=0)
+    url = reverse("restapi_stock_decrement", kwargs={"id": stock.product_inventory_id})
+    user = django_user_model.objects.create_user(username="customer", password="x")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    assert client.post(url, {"units": 1}, format="json").status_code == 403
+
+    user.user_permissions.add(Permission.objects.get(codename="change_stock"))
+    client.force_authenticate(user=django_user_model.objects.get(id=user.id))
+
+    assert client.post(url, {"units": 1}, format="json").status_code == 200
+    assert Stock.objects.get(id=stock.id).units_sold == 1
+
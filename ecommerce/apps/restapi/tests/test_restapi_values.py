@@ -0,0 +1,185 @@
+import datetime
+import zoneinfo
+from collections import OrderedDict
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from ecommerce.apps.inventory.models import Product, ProductInventory
+from ecommerce.apps.restapi.renderers import ORJSONRenderer
+from ecommerce.apps.restapi.serializers import (
+    PRODUCT_INVENTORY_LIST_PLAN,
+    PRODUCT_INVENTORY_PRODUCT_PLAN,
+    PRODUCT_LIST_PLAN,
+    ProductInventoryListSerializer,
+    ProductInventoryProductSerializer,
+    ProductListSerializer,
+)
+
+
+def render_plan(plan, queryset):
+    return ORJSONRenderer().render(plan.serialize(plan.values(queryset)))
+
+
+def render_serializer(serializer_class, queryset):
+    return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+
+def test_product_inventory_list_plan_matches_serializer(
+    db,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    stock_factory,
+):
+    """
+    Test to verify the product inventory values plan renders the same bytes as its serializer.
+    """
+
+    complete, bare = product_inventory_factory.create_batch(2)
+    complete.attribute_values.add(product_attribute_value_factory())
+    media_factory(product_inventory=complete)
+    stock_factory(product_inventory=complete)
+
+    queryset = ProductInventory.objects.filter(id__in=[complete.id, bare.id]).order_by(
+        "id"
+    )
+
+    assert render_plan(PRODUCT_INVENTORY_LIST_PLAN, queryset) == render_serializer(
+        ProductInventoryListSerializer,
+        ProductInventoryListSerializer.setup_eager_loading(queryset),
+    )
+
+
+@pytest.mark.parametrize(
+    "plan, serializer_class",
+    [
+        (PRODUCT_INVENTORY_LIST_PLAN, ProductInventoryListSerializer),
+        (PRODUCT_INVENTORY_PRODUCT_PLAN, ProductInventoryProductSerializer),
+    ],
+)
+def test_attribute_values_plan_order_matches_serializer(
+    db,
+    product_inventory_factory,
+    product_attribute_value_factory,
+    media_factory,
+    plan,
+    serializer_class,
+):
+    """
+    Test to verify the values plan and the serializer render the attribute values and
+    media of a product inventory in the same explicit id order.
+    """
+
+    inventory = product_inventory_factory()
+    attribute_values = sorted(
+        product_attribute_value_factory.create_batch(5), key=lambda value: value.id
+    )
+    # Linked in reverse id order, so the insertion order differs from the id order
+    for attribute_value in reversed(attribute_values):
+        inventory.attribute_values.add(attribute_value)
+    media_factory.create_batch(3, product_inventory=inventory)
+
+    queryset = ProductInventory.objects.filter(id=inventory.id)
+    rendered = render_plan(plan, queryset)
+
+    assert rendered == render_serializer(
+        serializer_class, serializer_class.setup_eager_loading(queryset)
+    )
+    assert plan.serialize(plan.values(queryset))[0]["attribute_values"] == [
+        attribute_value.id for attribute_value in attribute_values
+    ]
+
+
+def test_product_list_plan_matches_serializer(db, product_factory, category_factory):
+    """
+    Test to verify the product values plan renders nested categories in serializer order.
+    """
+
+    products = [
+        product_factory(category=[category_factory(), category_factory()]),
+        product_factory(category=[]),
+    ]
+    queryset = Product.objects.filter(id__in=[product.id for product in products])
+
+    assert render_plan(PRODUCT_LIST_PLAN, queryset) == render_serializer(
+        ProductListSerializer, ProductListSerializer.setup_eager_loading(queryset)
+    )
+
+
+def test_product_inventory_product_plan_matches_serializer(
+    db, product_inventory_factory
+):
+    """
+    Test to verify the joined nested product renders the same bytes as its serializer.
+    """
+
+    inventory = product_inventory_factory()
+    queryset = ProductInventory.objects.filter(id=inventory.id)
+
+    assert render_plan(PRODUCT_INVENTORY_PRODUCT_PLAN, queryset) == render_serializer(
+        ProductInventoryProductSerializer, queryset
+    )
+
+
+@pytest.mark.parametrize("pagination", ["page", "cursor"])
+def test_values_serialization_response_bytes(
+    db, client, settings, product_inventory_factory, brand, pagination
+):
+    """
+    Test to verify a list endpoint returns identical bytes with and without the values plan.
+    """
+
+    product_inventory_factory.create_batch(3, brand=brand)
+    url = reverse("restapi_brands_products_list", kwargs={"id": brand.id})
+
+    settings.RESTAPI_VALUES_SERIALIZATION = True
+    values_response = client.get(url, {"pagination": pagination})
+
+    settings.RESTAPI_VALUES_SERIALIZATION = False
+    serializer_response = client.get(url, {"pagination": pagination})
+
+    assert values_response.status_code == 200
+    assert values_response.content == serializer_response.content
+
+
+def test_orjson_renderer_matches_json_renderer():
+    """
+    Test to verify the orjson renderer output bytes match the DRF JSON renderer.
+    """
+
+    data = OrderedDict(
+        [
+            ("price", Decimal("92.00")),
+            (
+                "utc",
+                datetime.datetime(2024, 2, 1, 10, 30, tzinfo=datetime.timezone.utc),
+            ),
+            (
+                "local",
+                datetime.datetime(
+                    2024,
+                    2,
+                    1,
+                    10,
+                    30,
+                    5,
+                    120,
+                    tzinfo=zoneinfo.ZoneInfo("Asia/Kolkata"),
+                ),
+            ),
+            ("date", datetime.date(2024, 2, 1)),
+            ("text", 'Caf\u00e9 \u2028 \u2029 "quoted"'),
+            ("lazy", gettext_lazy("Invalid page.")),
+            ("numbers", [1, 1.5, 987.0, None, True]),
+            ("keys", {1: "one"}),
+        ]
+    )
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+    assert ORJSONRenderer().render(
+        data, "application/json; indent=4"
+    ) == JSONRenderer().render(data, "application/json; indent=4")
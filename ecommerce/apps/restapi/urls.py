@@ -1,5 +1,7 @@
-from django.urls import path
-from . import views
+from django.urls import path, register_converter
+from . import async_views, converters, views
+
+register_converter(converters.ObjectIdConverter, "object_id")
 
 
 urlpatterns = [
@@ -10,12 +12,17 @@ urlpatterns = [
         name="restapi_categories_list",
     ),
     path(
-        "categories/<str:id>/",
+        "categories/tree/",
+        views.RestAPICategories.as_view({"get": "tree"}),
+        name="restapi_categories_tree",
+    ),
+    path(
+        "categories/<object_id:id>/",
         views.RestAPICategories.as_view({"get": "retrieve"}),
         name="restapi_categories_retrieve",
     ),
     path(
-        "categories/<str:id>/products/",
+        "categories/<object_id:id>/products/",
         views.RestAPICategoriesProducts.as_view({"get": "list"}),
         name="restapi_categories_products_list",
     ),
@@ -25,12 +32,12 @@ urlpatterns = [
         name="restapi_product_types_list",
     ),
     path(
-        "product_types/<str:id>/",
+        "product_types/<object_id:id>/",
         views.RestAPIProductTypes.as_view({"get": "retrieve"}),
         name="restapi_product_types_retrieve",
     ),
     path(
-        "product_types/<str:id>/products/",
+        "product_types/<object_id:id>/products/",
         views.RestAPIProductTypesProducts.as_view({"get": "list"}),
         name="restapi_product_types_products_list",
     ),
@@ -40,12 +47,12 @@ urlpatterns = [
         name="restapi_brands_list",
     ),
     path(
-        "brands/<str:id>/",
+        "brands/<object_id:id>/",
         views.RestAPIBrands.as_view({"get": "retrieve"}),
         name="restapi_brands_retrieve",
     ),
     path(
-        "brands/<str:id>/products",
+        "brands/<object_id:id>/products",
         views.RestAPIBrandsProducts.as_view({"get": "list"}),
         name="restapi_brands_products_list",
     ),
@@ -55,7 +62,7 @@ urlpatterns = [
         name="restapi_products_list",
     ),
     path(
-        "products/<str:id>/",
+        "products/<object_id:id>/",
         views.RestAPIProducts.as_view({"get": "retrieve"}),
         name="restapi_products_retrieve",
     ),
@@ -65,7 +72,17 @@ urlpatterns = [
         name="restapi_product_inventory_list",
     ),
     path(
-        "product_inventory/<str:id>/",
+        "product_inventory/batch/",
+        views.RestAPIProductInventory.as_view({"get": "batch"}),
+        name="restapi_product_inventory_batch",
+    ),
+    path(
+        "product_inventory/export/",
+        views.RestAPIProductInventory.as_view({"get": "export"}),
+        name="restapi_product_inventory_export",
+    ),
+    path(
+        "product_inventory/<object_id:id>/",
         views.RestAPIProductInventory.as_view({"get": "retrieve"}),
         name="restapi_product_inventory_retrieve",
     ),
@@ -75,13 +92,124 @@ urlpatterns = [
         name="restapi_promotions_list",
     ),
     path(
-        "promotions/<str:id>/",
+        "promotions/<object_id:id>/",
         views.RestAPIPromotions.as_view({"get": "retrieve"}),
         name="restapi_promotions_retrieve",
     ),
     path(
-        "promotions/<str:id>/product_inventories/",
+        "promotions/<object_id:id>/simulate/",
+        views.RestAPIPromotions.as_view({"get": "simulate"}),
+        name="restapi_promotions_simulate",
+    ),
+    path(
+        "promotions/<object_id:id>/product_inventories/",
         views.RestAPIPromotionsProductInventories.as_view({"get": "list"}),
         name="restapi_promotions_product_inventories_list",
     ),
+    path(
+        "coupons/validate/",
+        views.RestAPICoupons.as_view({"get": "validate"}),
+        name="restapi_coupons_validate",
+    ),
+    path(
+        "product_inventory/<object_id:id>/stock/decrement/",
+        views.RestAPIStock.as_view({"post": "decrement"}),
+        name="restapi_stock_decrement",
+    ),
+    path(
+        "product_inventory/<object_id:id>/stock/reserve/",
+        views.RestAPIStock.as_view({"post": "reserve"}),
+        name="restapi_stock_reserve",
+    ),
+    path(
+        "stock/reservations/<object_id:id>/commit/",
+        views.RestAPIStock.as_view({"post": "commit"}),
+        name="restapi_stock_commit",
+    ),
+    path(
+        "stock/reservations/<object_id:id>/release/",
+        views.RestAPIStock.as_view({"post": "release"}),
+        name="restapi_stock_release",
+    ),
+    # Async read-only endpoints, served natively under ASGI
+    path(
+        "async/categories/",
+        async_views.AsyncCategories.as_view(),
+        name="restapi_async_categories_list",
+    ),
+    path(
+        "async/categories/<object_id:id>/",
+        async_views.AsyncCategoriesRetrieve.as_view(),
+        name="restapi_async_categories_retrieve",
+    ),
+    path(
+        "async/categories/<object_id:id>/products/",
+        async_views.AsyncCategoriesProducts.as_view(),
+        name="restapi_async_categories_products_list",
+    ),
+    path(
+        "async/product_types/",
+        async_views.AsyncProductTypes.as_view(),
+        name="restapi_async_product_types_list",
+    ),
+    path(
+        "async/product_types/<object_id:id>/",
+        async_views.AsyncProductTypesRetrieve.as_view(),
+        name="restapi_async_product_types_retrieve",
+    ),
+    path(
+        "async/product_types/<object_id:id>/products/",
+        async_views.AsyncProductTypesProducts.as_view(),
+        name="restapi_async_product_types_products_list",
+    ),
+    path(
+        "async/brands/",
+        async_views.AsyncBrands.as_view(),
+        name="restapi_async_brands_list",
+    ),
+    path(
+        "async/brands/<object_id:id>/",
+        async_views.AsyncBrandsRetrieve.as_view(),
+        name="restapi_async_brands_retrieve",
+    ),
+    path(
+        "async/brands/<object_id:id>/products",
+        async_views.AsyncBrandsProducts.as_view(),
+        name="restapi_async_brands_products_list",
+    ),
+    path(
+        "async/products/",
+        async_views.AsyncProducts.as_view(),
+        name="restapi_async_products_list",
+    ),
+    path(
+        "async/products/<object_id:id>/",
+        async_views.AsyncProductsRetrieve.as_view(),
+        name="restapi_async_products_retrieve",
+    ),
+    path(
+        "async/product_inventory/",
+        async_views.AsyncProductInventory.as_view(),
+        name="restapi_async_product_inventory_list",
+    ),
+    path(
+        "async/product_inventory/<object_id:id>/",
+        async_views.AsyncProductInventoryRetrieve.as_view(),
+        name="restapi_async_product_inventory_retrieve",
+    ),
+    path(
+        "async/promotions/",
+        async_views.AsyncPromotions.as_view(),
+        name="restapi_async_promotions_list",
+    ),
+    path(
+        "async/promotions/<object_id:id>/",
+        async_views.AsyncPromotionsRetrieve.as_view(),
+        name="restapi_async_promotions_retrieve",
+    ),
+    path(
+        "async/promotions/<object_id:id>/product_inventories/",
+        async_views.AsyncPromotionsProductInventories.as_view(),
+        name="restapi_async_promotions_product_inventories_list",
+    ),
 ]
@@ -0,0 +1,380 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# Fields whose `to_representation` returns database values unchanged
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+
+def get_converter(field):
+    """
+    Return the callable converting a raw column value like `field.to_representation`,
+    or None when the column value is already its representation.
+    """
+
+    if isinstance(field, serializers.FileField):
+        raise ImproperlyConfigured(
+            f"File field `{field.field_name}` can not be rendered from a values() row."
+        )
+
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return field.pk_field.to_representation if field.pk_field else None
+
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+
+    return field.to_representation
+
+
+def get_relation_lookup(model, source):
+    """
+    Return the related model of a to-many relation and the lookup leading back to `model`.
+    """
+
+    model_field = model._meta.get_field(source)
+
+    if model_field.auto_created and not model_field.concrete:
+        return model_field.related_model, model_field.field.name
+
+    return model_field.related_model, model_field.related_query_name()
+
+
+def column_getter(column, converter):
+    if converter is None:
+        return lambda row, related: row[column]
+
+    def getter(row, related):
+        value = row[column]
+        return None if value is None else converter(value)
+
+    return getter
+
+
+def nested_getter(column, children):
+    def getter(row, related):
+        if row[column] is None:
+            return None
+
+        return {name: child(row, related) for name, child in children}
+
+    return getter
+
+
+def related_getter(name, pk):
+    return lambda row, related: related[name].get(row[pk], [])
+
+
+class RelatedValues:
+    """
+    Loads a to-many relation for a whole page with a single `values_list()` query.
+
+    Args:
+        model: The related model.
+        lookup (str): The lookup from the related model back to the listed rows.
+        columns (list): The related columns to load, in output order.
+        names (list): The output keys of the columns, the column names when omitted.
+        converters (list): Per column converters, see `get_converter`.
+        flat (bool): Whether to return the value of the single column instead of a dict.
+        ordering (list): The order of the related values of a row, the model ordering
+            or else the primary key when omitted. The serializer prefetches must use the
+            same order to render the same output.
+    """
+
+    def __init__(
+        self,
+        model,
+        lookup,
+        columns,
+        names=None,
+        converters=None,
+        flat=False,
+        ordering=None,
+    ):
+        self.model = model
+        self.lookup = lookup
+        self.columns = list(columns)
+        self.names = list(names or columns)
+        self.converters = list(converters or [None] * len(self.columns))
+        self.flat = flat
+        self.ordering = list(ordering or model._meta.ordering or ["pk"])
+
+    def get_rows(self, pks):
+        return (
+            self.model._default_manager.filter(**{f"{self.lookup}__in": pks})
+            .order_by(*self.ordering)
+            .values_list(self.lookup, *self.columns)
+        )
+
+    def add_row(self, related, row):
+        key, *values = row
+        values = [
+            value if converter is None or value is None else converter(value)
+            for converter, value in zip(self.converters, values)
+        ]
+        related[key].append(values[0] if self.flat else dict(zip(self.names, values)))
+
+    def fetch(self, pks):
+        """
+        Return a dict mapping the primary key of every listed row to its related values.
+        """
+
+        related = defaultdict(list)
+        for row in self.get_rows(pks):
+            self.add_row(related, row)
+
+        return related
+
+    async def afetch(self, pks):
+        """
+        Async version of `fetch`, iterating the rows with the async ORM API.
+        """
+
+        related = defaultdict(list)
+        async for row in self.get_rows(pks):
+            self.add_row(related, row)
+
+        return related
+
+
+class JoinedValues:
+    """
+    Loads a to-one relation into the listed rows with a join, rendered as a list holding
+    a single dict, or an empty list without a related row.
+
+    Args:
+        lookup (str): The lookup from the listed rows to the related model.
+        columns (list): The related columns to load, in output order.
+        names (list): The output keys of the columns, the column names when omitted.
+    """
+
+    def __init__(self, lookup, columns, names=None):
+        self.lookup = lookup
+        self.columns = list(columns)
+        self.names = list(names or columns)
+
+    def get_columns(self):
+        return [f"{self.lookup}__{column}" for column in ["pk", *self.columns]]
+
+    def get_getter(self):
+        pk, *columns = self.get_columns()
+        items = list(zip(self.names, columns))
+
+        def getter(row, related):
+            if row[pk] is None:
+                return []
+
+            return [{name: row[column] for name, column in items}]
+
+        return getter
+
+
+class ValuesPlan:
+    """
+    Precompiled plan rendering `.values()` rows like `serializer_class(rows, many=True).data`.
+
+    The plan is compiled once from the serializer fields: concrete fields and primary key
+    relations read their column, nested serializers of a forward relation read joined
+    columns, and to-many relations are loaded for the whole page with one `RelatedValues`
+    query each. Method fields have no column and must be given in `related`, either as
+    `RelatedValues` or as `JoinedValues`. The plan is
+    compiled on first use, so it can be declared next to its serializer at import time.
+
+    Args:
+        serializer_class: The ModelSerializer whose output the plan reproduces.
+        related (dict): `RelatedValues` or `JoinedValues` loading the fields that can not
+            be derived from the serializer.
+    """
+
+    def __init__(self, serializer_class, related=None):
+        self.serializer_class = serializer_class
+        self.related = dict(related or {})
+        self.compiled = False
+
+    def compile(self):
+        """
+        Build the column list and the per field getters, once per process.
+        """
+
+        if self.compiled:
+            return
+
+        serializer = self.serializer_class()
+        model = serializer.Meta.model
+
+        self.pk = model._meta.pk.attname
+        self.getters = []
+        columns = [self.pk]
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if isinstance(self.related.get(name), JoinedValues):
+                columns.extend(self.related[name].get_columns())
+                getter = self.related.pop(name).get_getter()
+            elif name in self.related:
+                getter = related_getter(name, self.pk)
+            elif isinstance(field, serializers.ManyRelatedField):
+                related_model, lookup = get_relation_lookup(model, field.source)
+                self.related[name] = RelatedValues(
+                    related_model,
+                    lookup,
+                    ["pk"],
+                    converters=[get_converter(field.child_relation)],
+                    flat=True,
+                )
+                getter = related_getter(name, self.pk)
+            elif isinstance(field, serializers.ListSerializer):
+                related_model, lookup = get_relation_lookup(model, field.source)
+                children = self.get_children(field.child)
+                self.related[name] = RelatedValues(
+                    related_model,
+                    lookup,
+                    [child.source for child in children],
+                    names=[child.field_name for child in children],
+                    converters=[get_converter(child) for child in children],
+                )
+                getter = related_getter(name, self.pk)
+            elif isinstance(field, serializers.BaseSerializer):
+                # A forward relation, joined into the row and None without a related row
+                children = [
+                    (
+                        child.field_name,
+                        f"{field.source}__{child.source}",
+                        get_converter(child),
+                    )
+                    for child in self.get_children(field)
+                ]
+                columns.append(field.source)
+                columns.extend(column for _, column, _ in children)
+                getter = nested_getter(
+                    field.source,
+                    [
+                        (child_name, column_getter(column, converter))
+                        for child_name, column, converter in children
+                    ],
+                )
+            elif field.source == "*" or "." in field.source:
+                raise ImproperlyConfigured(
+                    f"Field `{name}` of {self.serializer_class.__name__} has no column, "
+                    "it must be loaded with `related`."
+                )
+            else:
+                columns.append(field.source)
+                getter = column_getter(field.source, get_converter(field))
+
+            self.getters.append((name, getter))
+
+        self.columns = list(dict.fromkeys(columns))
+        self.compiled = True
+
+    def get_children(self, serializer):
+        """
+        Return the fields of a nested serializer, which must all be plain columns.
+        """
+
+        children = [
+            child for child in serializer.fields.values() if not child.write_only
+        ]
+
+        for child in children:
+            if isinstance(
+                child, (serializers.BaseSerializer, serializers.ManyRelatedField)
+            ):
+                raise ImproperlyConfigured(
+                    f"Nested field `{child.field_name}` of {type(serializer).__name__} "
+                    "can not be rendered from a values() row."
+                )
+            if child.source == "*" or "." in child.source:
+                raise ImproperlyConfigured(
+                    f"Nested field `{child.field_name}` of {type(serializer).__name__} "
+                    "has no column."
+                )
+
+        return children
+
+    def values(self, queryset):
+        """
+        Return the queryset as `.values()` rows holding every column of the plan.
+        """
+
+        self.compile()
+        return queryset.values(*self.columns)
+
+    def serialize(self, rows):
+        """
+        Render a page of `.values()` rows, loading the related fields in one query each.
+        """
+
+        self.compile()
+
+        rows = list(rows)
+        if not rows:
+            return []
+
+        pks = [row[self.pk] for row in rows]
+        related = {name: spec.fetch(pks) for name, spec in self.related.items()}
+
+        return self.render(rows, related)
+
+    async def aserialize(self, rows):
+        """
+        Async version of `serialize`, loading the related fields with the async ORM API.
+        """
+
+        self.compile()
+
+        if not rows:
+            return []
+
+        pks = [row[self.pk] for row in rows]
+        related = {name: await spec.afetch(pks) for name, spec in self.related.items()}
+
+        return self.render(rows, related)
+
+    def render(self, rows, related):
+        return [
+            {name: getter(row, related) for name, getter in self.getters}
+            for row in rows
+        ]
+
+
+class ValuesPlanMixin:
+    """
+    Viewset mixin serving list actions from a `ValuesPlan` instead of their serializer.
+
+    The plan is used when `RESTAPI_VALUES_SERIALIZATION` is enabled and the request does
+    not shape the serializer with `?fields=` or `?expand=`.
+    """
+
+    def use_values_plan(self):
+        """
+        Return whether the current request can be served from a values plan.
+        """
+
+        if not settings.RESTAPI_VALUES_SERIALIZATION:
+            return False
+
+        return not {"fields", "expand"} & set(self.request.query_params)
+
+    def get_values_response(self, plan, queryset):
+        """
+        Return the (paginated) response of a queryset rendered with a values plan.
+        """
+
+        rows = plan.values(queryset)
+        page = self.paginate_queryset(rows)
+
+        if page is not None:
+            return self.get_paginated_response(plan.serialize(page))
+
+        return Response(plan.serialize(rows))
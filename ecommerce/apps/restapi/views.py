@@ -1,12 +1,55 @@
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework import views, viewsets, mixins, pagination
 
+from ecommerce.apps.inventory.categories import filter_category_products
 from ecommerce.apps.inventory.models import *
+from ecommerce.apps.inventory.stock import (
+    commit_reservation,
+    decrement_stock,
+    release_reservation,
+    reserve_stock,
+)
 from .serializers import *
+from .pagination import KeysetPaginationMixin
+from .cache import cache_response
+from .conditional import RelatedVersion, conditional_response
+from .permissions import CanChangeStock
+from .converters import parse_object_id
+from .categories import get_category_tree
+from .coupons import get_coupon_promotions
+from .values import ValuesPlanMixin
+from .export import EXPORT_FORMATS, get_export_rows, parse_export_datetime
+from ecommerce.apps.promotion.models import EffectivePrice, ProductsOnPromotion
+from ecommerce.apps.promotion.simulation import (
+    is_simulation_available,
+    load_simulation_arrays,
+    parse_reductions,
+    simulate_promotion_prices,
+)
 
 from drf_yasg import openapi
-from drf_yasg.utils import swagger_auto_schema
+from drf_yasg.utils import no_body, swagger_auto_schema
+
+
+def detail_schema(description):
+    """
+    Return the swagger response of an error detail message.
+    """
+
+    return openapi.Response(
+        description=description,
+        schema=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "detail": openapi.Schema(
+                    type=openapi.TYPE_STRING, description=f"{description}."
+                ),
+            },
+        ),
+    )
 
 
 class RestAPIHome(views.APIView):
@@ -51,14 +94,19 @@ class RestAPIHome(views.APIView):
 
 
 class RestAPICategories(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
+    KeysetPaginationMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
 ):
     """
-    This viewset automatically provides `list` and `retrieve` actions for the categories.
+    This viewset automatically provides `list` and `retrieve` actions for the categories,
+    and the `tree` action for their nested tree.
     """
 
     queryset = Category.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_categories_list",
@@ -72,6 +120,21 @@ class RestAPICategories(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
             openapi.Parameter(
                 name="parent_name",
                 in_=openapi.IN_QUERY,
@@ -113,6 +176,7 @@ class RestAPICategories(
         },
         tags=["Categories"],
     )
+    @cache_response("categories")
     def list(self, request):
         """
         Override the list method to paginate the queryset manually.
@@ -176,6 +240,7 @@ class RestAPICategories(
         },
         tags=["Categories"],
     )
+    @cache_response("categories")
     def retrieve(self, request, id=None):
         """
         Override the retrieve method to return the category details.
@@ -197,19 +262,108 @@ class RestAPICategories(
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+    @swagger_auto_schema(
+        operation_id="restapi_categories_tree",
+        operation_description="Nested tree of the Categories, or of a Category subtree",
+        manual_parameters=[
+            openapi.Parameter(
+                name="root",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Id of the Category whose subtree is returned",
+                required=False,
+                default=None,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response(
+                description="List of root Category nodes, or the root Category node, "
+                "with their nested `children`",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "id": openapi.Schema(type=openapi.TYPE_STRING),
+                        "name": openapi.Schema(type=openapi.TYPE_STRING),
+                        "slug": openapi.Schema(type=openapi.TYPE_STRING),
+                        "is_active": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        "product_count": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "subtree_product_count": openapi.Schema(
+                            type=openapi.TYPE_INTEGER
+                        ),
+                        "children": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                        ),
+                    },
+                ),
+            ),
+            status.HTTP_404_NOT_FOUND: detail_schema("Category not found"),
+        },
+        tags=["Categories"],
+    )
+    def tree(self, request):
+        """
+        Return the nested category tree, built from a single query in tree order and
+        cached as rendered JSON until a category changes.
+        """
+
+        root = request.query_params.get("root")
+        root_id = None
+
+        if root:
+            root_id = parse_object_id(root)
+            if root_id is None:
+                return Response(
+                    {"detail": "Category not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+        content, cached = get_category_tree(root_id)
+
+        if content is None:
+            return Response(
+                {"detail": "Category not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        response = HttpResponse(content, content_type="application/json")
+        response["X-Cache"] = "HIT" if cached else "MISS"
+        return response
 
-class RestAPICategoriesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
+
+class RestAPICategoriesProducts(
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
     """
-    This viewset automatically provides `list` action for the products under a category.
+    This viewset automatically provides `list` action for the products under a category,
+    or under a category and its descendants with `include_descendants`.
     """
 
     queryset = Product.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_categories_products_list",
         operation_description="List of Products under a Category",
         manual_parameters=[
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated fields to return, all fields when omitted",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="expand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated nested fields to expand, all nested fields when omitted",
+                required=False,
+            ),
             openapi.Parameter(
                 name="page",
                 default=1,
@@ -218,6 +372,21 @@ class RestAPICategoriesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
             openapi.Parameter(
                 name="id",
                 in_=openapi.IN_PATH,
@@ -225,6 +394,14 @@ class RestAPICategoriesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
                 description="Category ID",
                 required=True,
             ),
+            openapi.Parameter(
+                name="include_descendants",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                description="Whether the products of the descendant categories are listed",
+                required=False,
+                default=False,
+            ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
@@ -265,9 +442,15 @@ class RestAPICategoriesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
 
         page = request.query_params.get("page", 1)
         category_id = id
+        include_descendants = request.query_params.get(
+            "include_descendants", ""
+        ).lower() in ("1", "true")
+        fields, expand = ProductListSerializer.get_sparse_fieldset(request)
 
         if page is not None:
-            queryset = self.queryset.filter(category__id=category_id)
+            queryset = filter_category_products(
+                self.queryset, category_id, include_descendants
+            )
 
             if not queryset.exists():
                 return Response(
@@ -275,16 +458,29 @@ class RestAPICategoriesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            if self.use_values_plan():
+                return self.get_values_response(PRODUCT_LIST_PLAN, queryset)
+
+            queryset = ProductListSerializer.setup_eager_loading(
+                queryset, fields, expand
+            )
             page = self.paginate_queryset(queryset)
-            serializer = ProductListSerializer(page, many=True)
+            serializer = ProductListSerializer(
+                page, many=True, fields=fields, expand=expand
+            )
             return self.get_paginated_response(serializer.data)
 
-        serializer = ProductListSerializer(self.queryset, many=True)
+        serializer = ProductListSerializer(
+            self.queryset, many=True, fields=fields, expand=expand
+        )
         return Response(serializer.data)
 
 
 class RestAPIProductTypes(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
+    KeysetPaginationMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
 ):
     """
     This viewset automatically provides `list` and `retrieve` actions for the product types.
@@ -292,6 +488,7 @@ class RestAPIProductTypes(
 
     queryset = ProductType.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_product_types_list",
@@ -305,6 +502,21 @@ class RestAPIProductTypes(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
@@ -326,6 +538,7 @@ class RestAPIProductTypes(
         },
         tags=["ProductType"],
     )
+    @cache_response("product_types")
     def list(self, request):
         """
         Override the list method to paginate the queryset manually.
@@ -375,6 +588,7 @@ class RestAPIProductTypes(
         },
         tags=["ProductType"],
     )
+    @cache_response("product_types")
     def retrieve(self, request, id=None):
         """
         Override the retrieve method to return the productType details.
@@ -397,13 +611,19 @@ class RestAPIProductTypes(
             )
 
 
-class RestAPIProductTypesProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
+class RestAPIProductTypesProducts(
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
     """
     This viewset automatically provides `list` action for the products under a product type.
     """
 
     queryset = ProductInventory.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("created_at", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_product_types_products_list",
@@ -417,6 +637,21 @@ class RestAPIProductTypesProducts(viewsets.GenericViewSet, mixins.ListModelMixin
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
             openapi.Parameter(
                 name="id",
                 in_=openapi.IN_PATH,
@@ -474,6 +709,12 @@ class RestAPIProductTypesProducts(viewsets.GenericViewSet, mixins.ListModelMixin
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            if self.use_values_plan():
+                return self.get_values_response(
+                    PRODUCT_INVENTORY_PRODUCT_PLAN, queryset
+                )
+
+            queryset = ProductInventoryProductSerializer.setup_eager_loading(queryset)
             page = self.paginate_queryset(queryset)
             serializer = ProductInventoryProductSerializer(page, many=True)
             return self.get_paginated_response(serializer.data)
@@ -483,7 +724,10 @@ class RestAPIProductTypesProducts(viewsets.GenericViewSet, mixins.ListModelMixin
 
 
 class RestAPIBrands(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
+    KeysetPaginationMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
 ):
     """
     This viewset automatically provides `list` and `retrieve` actions for the brands.
@@ -491,6 +735,7 @@ class RestAPIBrands(
 
     queryset = Brand.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_brands_list",
@@ -504,6 +749,21 @@ class RestAPIBrands(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
@@ -525,6 +785,7 @@ class RestAPIBrands(
         },
         tags=["Brands"],
     )
+    @cache_response("brands")
     def list(self, request):
         """
         Override the list method to paginate the queryset manually.
@@ -574,6 +835,7 @@ class RestAPIBrands(
         },
         tags=["Brands"],
     )
+    @cache_response("brands")
     def retrieve(self, request, id=None):
         """
         Override the retrieve method to return the brand details.
@@ -596,13 +858,19 @@ class RestAPIBrands(
             )
 
 
-class RestAPIBrandsProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
+class RestAPIBrandsProducts(
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
     """
     This viewset automatically provides `list` action for the products under a brand.
     """
 
     queryset = ProductInventory.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("created_at", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_brands_products_list",
@@ -616,6 +884,21 @@ class RestAPIBrandsProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
             openapi.Parameter(
                 name="id",
                 in_=openapi.IN_PATH,
@@ -673,6 +956,12 @@ class RestAPIBrandsProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            if self.use_values_plan():
+                return self.get_values_response(
+                    PRODUCT_INVENTORY_PRODUCT_PLAN, queryset
+                )
+
+            queryset = ProductInventoryProductSerializer.setup_eager_loading(queryset)
             page = self.paginate_queryset(queryset)
             serializer = ProductInventoryProductSerializer(page, many=True)
             return self.get_paginated_response(serializer.data)
@@ -681,8 +970,29 @@ class RestAPIBrandsProducts(viewsets.GenericViewSet, mixins.ListModelMixin):
         return Response(serializer.data)
 
 
+# The nested rows covered by the product validators, the categories are
+# added and removed through rows with increasing ids
+PRODUCT_VERSIONS = {
+    "related": (
+        RelatedVersion(Product.category.through.objects.all(), "product", field="id"),
+    ),
+    "namespaces": ("categories",),
+}
+
+# The product list validators also cover the products added and removed, which move
+# the count and pages of the list
+PRODUCT_LIST_VERSIONS = {
+    "related": PRODUCT_VERSIONS["related"],
+    "namespaces": (*PRODUCT_VERSIONS["namespaces"], "products"),
+}
+
+
 class RestAPIProducts(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
 ):
     """
     This viewset automatically provides `list` and `retrieve` actions for the products.
@@ -690,11 +1000,26 @@ class RestAPIProducts(
 
     queryset = Product.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_products_list",
         operation_description="List of Products",
         manual_parameters=[
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated fields to return, all fields when omitted",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="expand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated nested fields to expand, all nested fields when omitted",
+                required=False,
+            ),
             openapi.Parameter(
                 name="page",
                 default=1,
@@ -703,6 +1028,21 @@ class RestAPIProducts(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
@@ -724,23 +1064,51 @@ class RestAPIProducts(
         },
         tags=["Products"],
     )
+    @conditional_response(many=True, **PRODUCT_LIST_VERSIONS)
     def list(self, request):
         """
         Override the list method to paginate the queryset manually.
         """
 
-        page = self.paginate_queryset(self.queryset)
+        if self.use_values_plan():
+            return self.get_values_response(PRODUCT_LIST_PLAN, self.queryset)
+
+        fields, expand = ProductListSerializer.get_sparse_fieldset(request)
+        queryset = ProductListSerializer.setup_eager_loading(
+            self.queryset, fields, expand
+        )
+        page = self.paginate_queryset(queryset)
 
         if page is not None:
-            serializer = ProductListSerializer(page, many=True)
+            serializer = ProductListSerializer(
+                page, many=True, fields=fields, expand=expand
+            )
             return self.get_paginated_response(serializer.data)
 
-        serializer = ProductListSerializer(self.queryset, many=True)
+        serializer = ProductListSerializer(
+            queryset, many=True, fields=fields, expand=expand
+        )
         return Response(serializer.data)
 
     @swagger_auto_schema(
         operation_id="restapi_products_retrieve",
         operation_description="Retrieve a Product by ID",
+        manual_parameters=[
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated fields to return, all fields when omitted",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="expand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated nested fields to expand, all nested fields when omitted",
+                required=False,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: openapi.Response(
                 description="Product object",
@@ -773,6 +1141,7 @@ class RestAPIProducts(
         },
         tags=["Products"],
     )
+    @conditional_response(**PRODUCT_VERSIONS)
     def retrieve(self, request, id=None):
         """
         Override the retrieve method to return the product details.
@@ -784,9 +1153,15 @@ class RestAPIProducts(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        fields, expand = ProductRetrieveSerializer.get_sparse_fieldset(request)
+
         try:
-            queryset = self.queryset.get(id=id)
-            serializer = ProductRetrieveSerializer(queryset)
+            queryset = ProductRetrieveSerializer.setup_eager_loading(
+                self.queryset, fields, expand
+            ).get(id=id)
+            serializer = ProductRetrieveSerializer(
+                queryset, fields=fields, expand=expand
+            )
             return Response(serializer.data)
         except Product.DoesNotExist:
             return Response(
@@ -795,8 +1170,42 @@ class RestAPIProducts(
             )
 
 
+# The nested rows covered by the product inventory list validators, along with the
+# product inventories added and removed, which move the count and pages of the list
+PRODUCT_INVENTORY_LIST_VERSIONS = {
+    "related": (
+        RelatedVersion(
+            ProductInventory.attribute_values.through.objects.all(),
+            "productinventory",
+            field="id",
+        ),
+        RelatedVersion(Media.objects.all(), "product_inventory"),
+        RelatedVersion(Stock.objects.all(), "product_inventory"),
+    ),
+    "namespaces": ("product_inventories",),
+}
+
+# The nested rows covered by the product inventory retrieve validators, the brand,
+# product type, attribute values and promotions through the response cache versions
+PRODUCT_INVENTORY_VERSIONS = {
+    "related": (
+        *PRODUCT_INVENTORY_LIST_VERSIONS["related"],
+        RelatedVersion(Product.objects.all(), "pk", outer="product_id"),
+        RelatedVersion(
+            ProductsOnPromotion.objects.all(), "product_inventory", field="created_at"
+        ),
+        RelatedVersion(EffectivePrice.objects.all(), "product_inventory"),
+    ),
+    "namespaces": ("brands", "product_types", "attributes", "promotions"),
+}
+
+
 class RestAPIProductInventory(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
 ):
     """
     This viewset automatically provides `list` and `retrieve` actions for the product inventory.
@@ -804,6 +1213,7 @@ class RestAPIProductInventory(
 
     queryset = ProductInventory.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("created_at", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_product_inventory_list",
@@ -817,6 +1227,21 @@ class RestAPIProductInventory(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
@@ -838,12 +1263,17 @@ class RestAPIProductInventory(
         },
         tags=["Product Inventory"],
     )
+    @conditional_response(many=True, **PRODUCT_INVENTORY_LIST_VERSIONS)
     def list(self, request):
         """
         Override the list method to paginate the queryset manually.
         """
 
-        page = self.paginate_queryset(self.queryset)
+        if self.use_values_plan():
+            return self.get_values_response(PRODUCT_INVENTORY_LIST_PLAN, self.queryset)
+
+        queryset = ProductInventoryListSerializer.setup_eager_loading(self.queryset)
+        page = self.paginate_queryset(queryset)
 
         if page is not None:
             serializer = ProductInventoryListSerializer(page, many=True)
@@ -855,6 +1285,22 @@ class RestAPIProductInventory(
     @swagger_auto_schema(
         operation_id="restapi_product_inventory_retrieve",
         operation_description="Retrieve a Product Inventory by ID",
+        manual_parameters=[
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated fields to return, all fields when omitted",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="expand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated nested fields to expand, all nested fields when omitted",
+                required=False,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: openapi.Response(
                 description="ProductInventory object",
@@ -887,6 +1333,7 @@ class RestAPIProductInventory(
         },
         tags=["Product Inventory"],
     )
+    @conditional_response(**PRODUCT_INVENTORY_VERSIONS)
     def retrieve(self, request, id=None):
         """
         Override the retrieve method to return the product inventory details.
@@ -898,9 +1345,15 @@ class RestAPIProductInventory(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        fields, expand = ProductInventoryRetrieveSerializer.get_sparse_fieldset(request)
+
         try:
-            queryset = self.queryset.get(id=id)
-            serializer = ProductInventoryRetrieveSerializer(queryset)
+            queryset = ProductInventoryRetrieveSerializer.setup_eager_loading(
+                self.queryset, fields, expand
+            ).get(id=id)
+            serializer = ProductInventoryRetrieveSerializer(
+                queryset, fields=fields, expand=expand
+            )
             return Response(serializer.data)
         except ProductInventory.DoesNotExist:
             return Response(
@@ -908,49 +1361,336 @@ class RestAPIProductInventory(
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-
-class RestAPIPromotions(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin
-):
-    """
-    This viewset automatically provides `list` and `retrieve` actions for the promotions.
-    """
-
-    queryset = Promotion.objects.all()
-    pagination_class = pagination.PageNumberPagination
-
     @swagger_auto_schema(
-        operation_id="restapi_promotions_list",
-        operation_description="List of Promotions",
+        operation_id="restapi_product_inventory_batch",
+        operation_description="Retrieve several Product Inventories by ID, SKU or UPC",
         manual_parameters=[
             openapi.Parameter(
-                name="page",
-                default=1,
+                name="id",
                 in_=openapi.IN_QUERY,
-                type=openapi.TYPE_INTEGER,
-                description="Page number for the paginated response",
-                required=True,
+                type=openapi.TYPE_STRING,
+                description="Comma separated ProductInventory IDs",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="sku",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated ProductInventory SKUs",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="upc",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated ProductInventory UPCs",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated fields to return, all fields when omitted",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="expand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated nested fields to expand, all nested fields when omitted",
+                required=False,
             ),
         ],
         responses={
             status.HTTP_200_OK: openapi.Response(
-                description="List of Promotion objects",
-                schema=PromotionListSerializer(many=True),
+                description="ProductInventory objects in the requested order",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                            description="Found ProductInventory objects.",
+                        ),
+                        "missing": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_STRING),
+                            description="Requested keys that were not found.",
+                        ),
+                    },
+                ),
             ),
             status.HTTP_400_BAD_REQUEST: openapi.Response(
-                description="Page not found",
+                description="Invalid batch",
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
                         "detail": openapi.Schema(
                             type=openapi.TYPE_STRING,
-                            description="Invalid page.",
+                            description="Exactly one of id, sku or upc required.",
                         ),
                     },
                 ),
             ),
         },
-        tags=["Promotions"],
+        tags=["Product Inventory"],
+    )
+    def batch(self, request):
+        """
+        Retrieve up to `RESTAPI_BATCH_MAX_SIZE` product inventories by ID, SKU or UPC in one request.
+        """
+
+        lookups = [key for key in ("id", "sku", "upc") if key in request.query_params]
+
+        if len(lookups) != 1:
+            return Response(
+                {"detail": "Exactly one of id, sku or upc required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        lookup = lookups[0]
+        keys = list(
+            dict.fromkeys(
+                key.strip()
+                for key in request.query_params[lookup].split(",")
+                if key.strip()
+            )
+        )
+
+        if not keys:
+            return Response(
+                {"detail": f"At least one {lookup} required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(keys) > settings.RESTAPI_BATCH_MAX_SIZE:
+            return Response(
+                {
+                    "detail": f"At most {settings.RESTAPI_BATCH_MAX_SIZE} keys allowed per batch."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fields, expand = ProductInventoryRetrieveSerializer.get_sparse_fieldset(request)
+
+        # Ids are matched in their canonical UUID form, and are missing if not UUIDs
+        if lookup == "id":
+            values = {key: str(parse_object_id(key) or "") for key in keys}
+        else:
+            values = {key: key for key in keys}
+
+        # The lookup column is always loaded to match rows back to the requested keys
+        queryset = ProductInventoryRetrieveSerializer.setup_eager_loading(
+            self.queryset.filter(
+                **{f"{lookup}__in": [value for value in values.values() if value]}
+            ),
+            fields if fields is None else fields | {lookup},
+            expand,
+        )
+        found = {str(getattr(item, lookup)): item for item in queryset}
+
+        serializer = ProductInventoryRetrieveSerializer(
+            [found[values[key]] for key in keys if values[key] in found],
+            many=True,
+            fields=fields,
+            expand=expand,
+        )
+        return Response(
+            {
+                "results": serializer.data,
+                "missing": [key for key in keys if values[key] not in found],
+            }
+        )
+
+    @swagger_auto_schema(
+        operation_id="restapi_product_inventory_export",
+        operation_description="Stream the Product Inventory catalogue as NDJSON or CSV",
+        manual_parameters=[
+            openapi.Parameter(
+                name="output",
+                default="ndjson",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["ndjson", "csv"],
+                description="Export format, one JSON object per line or CSV with a header",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="brand",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Brand ID",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="product_type",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Product Type ID",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="updated_after",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+                description="Only rows updated at or after this ISO 8601 datetime or date",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="updated_before",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+                description="Only rows updated before this ISO 8601 datetime or date",
+                required=False,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response(
+                description="Streamed ProductInventory rows",
+            ),
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                description="Invalid export parameters",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            description="Invalid updated_after datetime.",
+                        ),
+                    },
+                ),
+            ),
+        },
+        tags=["Product Inventory"],
+    )
+    def export(self, request):
+        """
+        Stream the product inventory catalogue in constant memory, ordered by creation.
+        """
+
+        output = request.query_params.get("output", "ndjson")
+
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"Output must be one of {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.queryset
+
+        for param, lookup in (
+            ("brand", "brand__id"),
+            ("product_type", "product_type__id"),
+        ):
+            if param not in request.query_params:
+                continue
+
+            object_id = parse_object_id(request.query_params[param])
+            if object_id is None:
+                return Response(
+                    {"detail": f"Invalid {param} id."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            queryset = queryset.filter(**{lookup: object_id})
+
+        for param, lookup in (
+            ("updated_after", "updated_at__gte"),
+            ("updated_before", "updated_at__lt"),
+        ):
+            if param not in request.query_params:
+                continue
+
+            value = parse_export_datetime(request.query_params[param])
+            if value is None:
+                return Response(
+                    {"detail": f"Invalid {param} datetime."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            queryset = queryset.filter(**{lookup: value})
+
+        content_type, stream = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(
+            stream(get_export_rows(queryset, settings.RESTAPI_EXPORT_CHUNK_SIZE)),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="catalogue.{output}"'
+        return response
+
+    def perform_content_negotiation(self, request, force=False):
+        """
+        Exports are streamed without a renderer, so they are served for any `Accept` header.
+        """
+
+        return super().perform_content_negotiation(
+            request, force=force or self.action == "export"
+        )
+
+
+class RestAPIPromotions(
+    KeysetPaginationMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+):
+    """
+    This viewset automatically provides `list` and `retrieve` actions for the promotions.
+    """
+
+    queryset = Promotion.objects.all()
+    pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("name", "id")
+
+    @swagger_auto_schema(
+        operation_id="restapi_promotions_list",
+        operation_description="List of Promotions",
+        manual_parameters=[
+            openapi.Parameter(
+                name="page",
+                default=1,
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description="Page number for the paginated response",
+                required=True,
+            ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response(
+                description="List of Promotion objects",
+                schema=PromotionListSerializer(many=True),
+            ),
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                description="Page not found",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            description="Invalid page.",
+                        ),
+                    },
+                ),
+            ),
+        },
+        tags=["Promotions"],
     )
     def list(self, request):
         """
@@ -1022,9 +1762,102 @@ class RestAPIPromotions(
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+    @swagger_auto_schema(
+        operation_id="restapi_promotions_simulate",
+        operation_description="Project the prices and revenue of a Promotion for several reductions, without saving",
+        manual_parameters=[
+            openapi.Parameter(
+                name="id",
+                in_=openapi.IN_PATH,
+                type=openapi.TYPE_STRING,
+                description="Promotion ID",
+                required=True,
+            ),
+            openapi.Parameter(
+                name="reductions",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Comma separated reduction percentages to simulate",
+                required=True,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response(
+                description="Projected totals per reduction",
+                schema=PromotionSimulationSerializer(many=True),
+            ),
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                description="Invalid reductions",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            description="Invalid reductions.",
+                        ),
+                    },
+                ),
+            ),
+            status.HTTP_404_NOT_FOUND: openapi.Response(
+                description="Promotion not found",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            description="Promotion not found.",
+                        ),
+                    },
+                ),
+            ),
+        },
+        tags=["Promotions"],
+    )
+    def simulate(self, request, id=None):
+        """
+        Simulate reductions on the products of a promotion, read-only.
+        """
+
+        if not is_simulation_available():
+            return Response(
+                {"detail": "Promotion simulation requires NumPy."},
+                status=status.HTTP_501_NOT_IMPLEMENTED,
+            )
+
+        reductions = parse_reductions(
+            request.query_params.get("reductions", ""),
+            settings.RESTAPI_SIMULATION_MAX_SCENARIOS,
+        )
+        if reductions is None:
+            return Response(
+                {
+                    "detail": "Reductions must be up to "
+                    f"{settings.RESTAPI_SIMULATION_MAX_SCENARIOS} comma separated "
+                    "percentages between 0 and 100."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not self.queryset.filter(id=id).exists():
+            return Response(
+                {"detail": "Promotion not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        arrays = load_simulation_arrays(
+            ProductInventory.objects.filter(products_on_promotion__id=id)
+        )
+        serializer = PromotionSimulationSerializer(
+            simulate_promotion_prices(arrays, reductions), many=True
+        )
+        return Response({"promotion": id, "scenarios": serializer.data})
+
 
 class RestAPIPromotionsProductInventories(
-    viewsets.GenericViewSet, mixins.ListModelMixin
+    KeysetPaginationMixin,
+    ValuesPlanMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
 ):
     """
     This viewset automatically provides `list` action for the product inventories under a promotion.
@@ -1032,6 +1865,7 @@ class RestAPIPromotionsProductInventories(
 
     queryset = ProductInventory.objects.all()
     pagination_class = pagination.PageNumberPagination
+    keyset_ordering = ("created_at", "id")
 
     @swagger_auto_schema(
         operation_id="restapi_promotions_product_inventories_list",
@@ -1045,6 +1879,21 @@ class RestAPIPromotionsProductInventories(
                 description="Page number for the paginated response",
                 required=True,
             ),
+            openapi.Parameter(
+                name="pagination",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                description="Pagination mode, `cursor` walks the list without a total count",
+                required=False,
+            ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Opaque cursor returned in `next` by a cursor paginated response",
+                required=False,
+            ),
             openapi.Parameter(
                 name="id",
                 in_=openapi.IN_PATH,
@@ -1094,7 +1943,7 @@ class RestAPIPromotionsProductInventories(
         promotion_id = id
 
         if page is not None:
-            queryset = self.queryset.filter(promotions__id=promotion_id)
+            queryset = self.queryset.filter(products_on_promotion__id=promotion_id)
 
             if not queryset.exists():
                 return Response(
@@ -1102,9 +1951,208 @@ class RestAPIPromotionsProductInventories(
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            if self.use_values_plan():
+                return self.get_values_response(PRODUCT_INVENTORY_LIST_PLAN, queryset)
+
+            queryset = ProductInventoryListSerializer.setup_eager_loading(queryset)
             page = self.paginate_queryset(queryset)
             serializer = ProductInventoryListSerializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
         serializer = ProductInventoryListSerializer(self.queryset, many=True)
         return Response(serializer.data)
+
+
+class RestAPICoupons(viewsets.GenericViewSet):
+    """
+    This viewset provides the `validate` action for the coupon codes.
+    """
+
+    @swagger_auto_schema(
+        operation_id="restapi_coupons_validate",
+        operation_description="Validate a Coupon code against the active Promotions",
+        manual_parameters=[
+            openapi.Parameter(
+                name="code",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="Coupon code",
+                required=True,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response(
+                description="Coupon code validity and its active promotions",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "code": openapi.Schema(type=openapi.TYPE_STRING),
+                        "valid": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        "promotions": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                        ),
+                    },
+                ),
+            ),
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                description="Coupon code required",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            description="Coupon code required.",
+                        ),
+                    },
+                ),
+            ),
+        },
+        tags=["Coupons"],
+    )
+    def validate(self, request):
+        """
+        Validate a coupon code from the cached coupon codes, without a database query.
+        """
+
+        code = request.query_params.get("code", "").strip()
+
+        if not code:
+            return Response(
+                {"detail": "Coupon code required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        promotions = get_coupon_promotions(code)
+        return Response(
+            {"code": code, "valid": bool(promotions), "promotions": promotions}
+        )
+
+
+class RestAPIStock(viewsets.GenericViewSet):
+    """
+    This viewset provides the `decrement`, `reserve`, `commit` and `release` actions for
+    the stock.
+
+    The stock is only changed by conditional atomic UPDATEs, so concurrent requests
+    never oversell it, and unused reservations expire after `STOCK_RESERVATION_TIMEOUT`.
+    The actions are restricted to the staff and the users allowed to change the stock.
+    """
+
+    queryset = StockReservation.objects.all()
+    serializer_class = StockReservationSerializer
+    permission_classes = (CanChangeStock,)
+
+    @swagger_auto_schema(
+        operation_id="restapi_stock_decrement",
+        operation_description="Sell units of a Product Inventory stock right away",
+        request_body=StockUnitsSerializer,
+        responses={
+            status.HTTP_200_OK: StockUnitsSerializer,
+            status.HTTP_400_BAD_REQUEST: detail_schema("Invalid units"),
+            status.HTTP_404_NOT_FOUND: detail_schema("Stock not found"),
+            status.HTTP_409_CONFLICT: detail_schema("Insufficient stock"),
+        },
+        tags=["Stock"],
+    )
+    def decrement(self, request, id=None):
+        """
+        Sell units of a product inventory stock, without a reservation.
+        """
+
+        serializer = StockUnitsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if not decrement_stock(id, serializer.validated_data["units"]):
+            return self.get_unavailable_response(id)
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_id="restapi_stock_reserve",
+        operation_description="Reserve units of a Product Inventory stock",
+        request_body=StockUnitsSerializer,
+        responses={
+            status.HTTP_201_CREATED: StockReservationSerializer,
+            status.HTTP_400_BAD_REQUEST: detail_schema("Invalid units"),
+            status.HTTP_404_NOT_FOUND: detail_schema("Stock not found"),
+            status.HTTP_409_CONFLICT: detail_schema("Insufficient stock"),
+        },
+        tags=["Stock"],
+    )
+    def reserve(self, request, id=None):
+        """
+        Reserve units of a product inventory stock until they are committed or released.
+        """
+
+        serializer = StockUnitsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reservation = reserve_stock(id, serializer.validated_data["units"])
+
+        if reservation is None:
+            return self.get_unavailable_response(id)
+
+        return Response(
+            StockReservationSerializer(reservation).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @swagger_auto_schema(
+        operation_id="restapi_stock_commit",
+        operation_description="Commit the units of a Stock Reservation as sold",
+        request_body=no_body,
+        responses={
+            status.HTTP_200_OK: StockReservationSerializer,
+            status.HTTP_404_NOT_FOUND: detail_schema(
+                "Reservation not found or expired"
+            ),
+        },
+        tags=["Stock"],
+    )
+    def commit(self, request, id=None):
+        """
+        Commit the units of a reservation as sold.
+        """
+
+        return self.get_reservation_response(commit_reservation(id))
+
+    @swagger_auto_schema(
+        operation_id="restapi_stock_release",
+        operation_description="Release the units of a Stock Reservation",
+        request_body=no_body,
+        responses={
+            status.HTTP_200_OK: StockReservationSerializer,
+            status.HTTP_404_NOT_FOUND: detail_schema(
+                "Reservation not found or expired"
+            ),
+        },
+        tags=["Stock"],
+    )
+    def release(self, request, id=None):
+        """
+        Release the units of a reservation back to the available stock.
+        """
+
+        return self.get_reservation_response(release_reservation(id))
+
+    def get_unavailable_response(self, id):
+        if not Stock.objects.filter(product_inventory_id=id).exists():
+            return Response(
+                {"detail": "Stock not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {"detail": "Insufficient stock."},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    def get_reservation_response(self, reservation):
+        if reservation is None:
+            return Response(
+                {"detail": "Reservation not found or expired."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(StockReservationSerializer(reservation).data)
@@ -93,6 +93,10 @@ TEMPLATES = [
 WSGI_APPLICATION = "ecommerce.wsgi.application"
 
 
+# ASGI application, serving the async REST API endpoints without blocking a thread
+ASGI_APPLICATION = "ecommerce.asgi.application"
+
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "Asia/Kolkata"
@@ -168,8 +172,50 @@ REST_FRAMEWORK = {
         "rest_framework.throttling.UserRateThrottle",
     ],
     # "DEFAULT_THROTTLE_RATES": {"anon": "10/hour", "user": "100/hour"},
+    "DEFAULT_RENDERER_CLASSES": [
+        "ecommerce.apps.restapi.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
+# Cache configuration, Redis when configured with a local-memory fallback
+if os.environ.get("REDIS_CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_CACHE_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Cached REST API responses are invalidated by model signals
+RESTAPI_RESPONSE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Cached demo pages are invalidated by model signals, the timeout bounds the
+# staleness of the stock and promotion price updates sending no signals
+DEMO_PAGE_CACHE_TIMEOUT = 60 * 5
+
+# Maximum number of keys accepted by the REST API batch endpoints
+RESTAPI_BATCH_MAX_SIZE = 100
+
+# Maximum number of reductions simulated per REST API promotion simulation
+RESTAPI_SIMULATION_MAX_SCENARIOS = 50
+
+# False positive rate of the Bloom filter rejecting unknown coupon codes in memory
+RESTAPI_COUPON_FILTER_ERROR_RATE = 0.01
+
+# Rows fetched per server-side cursor round trip by the REST API catalogue export
+RESTAPI_EXPORT_CHUNK_SIZE = 2000
+
+# Serve the REST API list endpoints from values() rows instead of model serializers
+RESTAPI_VALUES_SERIALIZATION = True
+
+
 SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": [
         "Bearer",
@@ -184,15 +230,28 @@ CELERY_BROKER_URL = "redis://redis:6379/0"
 CELERY_RESULT_BACKEND = "redis://redis:6379/0"
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+# Seconds a promotion price recomputation waits to batch the following changes
+PROMOTION_PRICES_DEBOUNCE = 30
+
+# Rows checked per partition, in its own transaction, by the nightly promotion prices check
+PROMOTION_PRICES_PARTITION_SIZE = 5000
+
+
+# Seconds before a stock reservation expires and its units are available again
+STOCK_RESERVATION_TIMEOUT = 60 * 15
 
 # Set a CELERY BEAT task scheduler
 CELERY_BEAT_SCHEDULE = {
     "update_promotions": {
         "task": "ecommerce.apps.promotion.tasks.promotion_management",
-        "schedule": crontab(minute="0", hour="1"),
+        "schedule": crontab(minute="0"),
     },
     "update_promotion_prices": {
         "task": "ecommerce.apps.promotion.tasks.promotion_prices_all",
         "schedule": crontab(minute="0", hour="1"),
     },
+    "release_stock_reservations": {
+        "task": "ecommerce.apps.inventory.tasks.release_expired_stock_reservations",
+        "schedule": crontab(),
+    },
 }
@@ -1,5 +1,23 @@
+import datetime
+import random
+from decimal import Decimal
+
 import pytest
 from django.core.management import call_command
+from django.db import connection, transaction
+
+from ecommerce.apps.inventory.models import (
+    Brand,
+    Category,
+    Product,
+    ProductInventory,
+    ProductType,
+)
+from ecommerce.apps.promotion.models import (
+    ProductsOnPromotion,
+    Promotion,
+    PromotionType,
+)
 
 
 @pytest.fixture(scope="session")
@@ -75,3 +93,141 @@ def db_fixture_setup(django_db_setup, django_db_blocker):
             "loaddata",
             "db_stock_fixture.json",
         )
+
+
+@pytest.fixture(scope="module")
+def query_plan_catalogue(django_db_setup, django_db_blocker):
+    """
+    Generate a large catalogue and analyze it, for the EXPLAIN plan tests of a module.
+
+    The rows are inserted in bulk in a transaction rolled back after the module, so the
+    planner statistics describe a production sized database, where an index is cheaper
+    than a sequential scan for the hot queries.
+
+    Returns:
+        dict: A sample of the generated rows, to filter the hot queries on
+    """
+
+    generator = random.Random(0)
+    today = datetime.date.today()
+
+    with django_db_blocker.unblock(), transaction.atomic():
+        product_types = ProductType.objects.bulk_create(
+            ProductType(name=f"plan type {index}") for index in range(50)
+        )
+        brands = Brand.objects.bulk_create(
+            Brand(name=f"plan brand {index}") for index in range(200)
+        )
+
+        # 50 trees of a root and 19 children, with their nested set values
+        categories = []
+        for tree in range(50):
+            root = Category(
+                name=f"plan root {tree}",
+                slug=f"plan-root-{tree}",
+                tree_id=10000 + tree,
+                lft=1,
+                rght=40,
+                level=0,
+            )
+            categories.append(root)
+            categories.extend(
+                Category(
+                    name=f"plan category {tree}-{index}",
+                    slug=f"plan-category-{tree}-{index}",
+                    parent=root,
+                    tree_id=root.tree_id,
+                    lft=2 + index * 2,
+                    rght=3 + index * 2,
+                    level=1,
+                )
+                for index in range(19)
+            )
+        Category.objects.bulk_create(categories)
+
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"plan product {index}",
+                slug=f"plan-product-{index}",
+                description="plan product",
+            )
+            for index in range(2500)
+        )
+        # Every product in two child categories of a tree
+        Product.category.through.objects.bulk_create(
+            Product.category.through(
+                product=product,
+                category=categories[index % 50 * 20 + 1 + (index + offset) % 19],
+            )
+            for index, product in enumerate(products)
+            for offset in (0, 7)
+        )
+        product_inventories = ProductInventory.objects.bulk_create(
+            ProductInventory(
+                product=products[index % len(products)],
+                product_type=generator.choice(product_types),
+                brand=generator.choice(brands),
+                retail_price=Decimal(generator.randint(100, 10000)) / 100,
+                store_price=Decimal(generator.randint(100, 10000)) / 100,
+                weight=1,
+            )
+            for index in range(10000)
+        )
+
+        promotion_type = PromotionType.objects.create(name="plan promotion type")
+        promotions = Promotion.objects.bulk_create(
+            Promotion(
+                name=f"plan promotion {index}",
+                description="plan promotion",
+                promotion_reduction=generator.randint(1, 90),
+                is_active=generator.random() < 0.5,
+                # One promotion in 20 is scheduled, as most promotions are ended
+                is_schedule=index % 20 == 0,
+                promotion_start=today
+                + datetime.timedelta(days=generator.randint(-400, 30)),
+                promotion_end=today
+                + datetime.timedelta(days=generator.randint(-30, 400)),
+                promotion_type=promotion_type,
+            )
+            for index in range(2000)
+        )
+        ProductsOnPromotion.objects.bulk_create(
+            ProductsOnPromotion(
+                promotion=promotions[index % len(promotions)],
+                product_inventory=product_inventory,
+                promotion_price=product_inventory.store_price,
+                # One row in 100 waits for its price to be recomputed
+                price_stale=index % 100 == 0,
+            )
+            for index, product_inventory in enumerate(product_inventories)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        yield {
+            "category": categories[1],
+            "product": products[0],
+            "product_type": product_types[0],
+            "brand": brands[0],
+            "promotion": promotions[0],
+            "product_inventory": product_inventories[0],
+            "today": today,
+        }
+
+        transaction.set_rollback(True)
+
+
+@pytest.fixture
+def assert_index_plan():
+    """
+    Return a function asserting a queryset is planned without any sequential scan.
+    """
+
+    def assert_index_plan(queryset):
+        plan = queryset.explain()
+        assert "Seq Scan" not in plan, plan
+
+        return plan
+
+    return assert_index_plan